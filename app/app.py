@@ -1,23 +1,45 @@
+import time
 from typing import Optional
 
 import pygame  # type: ignore
 import thorpy as tp
 from obj.axes import Axes
 from obj.camera import Camera
+from obj.dirtyrenderer import DirtyRectRenderer
 from obj.drawassistance import DrawAssistance
+from obj.drawn.lod import render_quality
 from obj.grid import Grid
 from obj.guielements.popinfo import PopInfo
 from obj.guielements.sidebar.particle_sidebar import PointParticleSideBar
 from obj.guielements.sidebar.sidebar import SideBar
-from obj.objectsmanager import ObjectsManager
+from obj.objectsmanager import FRAME_RATE_HZ, ObjectsManager
 from obj.panelgui import Panel_GUI
 from obj.physicobject import Features
+from obj.qualitycontroller import QualityController
+from obj.staticlayer import StaticLayer
+from obj.taskqueue import TASK_SLICE_MS
 from pygame import Surface  # type: ignore
 from pygame.time import Clock  # type: ignore
 
+# how long an idle frame blocks waiting for input
+IDLE_TIMEOUT_MS = 500
+
+# internal resolutions of the scene relative to the window
+RENDER_SCALES = (0.5, 0.75, 1.0)
+
 
 class App:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        render_scale: float = 1.0,
+        adaptive_quality: bool = True,
+        solver_quality: str = "normal",
+        physics_worker: bool = False,
+        physics_frames: int = 1,
+        interpolate: bool = False,
+    ) -> None:
+        if render_scale not in RENDER_SCALES:
+            raise ValueError(f"Render scale must be one of {RENDER_SCALES}.")
         # --- WINDOW INIT ---
         pygame.init()
         info = pygame.display.Info()
@@ -26,33 +48,47 @@ class App:
         self.screen: Surface = pygame.display.set_mode(self.size, pygame.NOFRAME)
         pygame.display.set_caption("Classical-Mechanics-Simulator-in-2D")
 
+        # the scene (grid, axes, objects, vectors) is drawn here and scaled up
+        # to the window once per frame; the GUI stays at window resolution
+        if render_scale == 1.0:
+            self.render_surface: Surface = self.screen
+        else:
+            self.render_surface = pygame.Surface(
+                (round(self.size[0] * render_scale), round(self.size[1] * render_scale))
+            ).convert()
+
         # logo
         self.logo: Surface = pygame.image.load("app/assets/logo.svg")
         pygame.display.set_icon(self.logo)
 
         # --- CAMERA ---
         self.camera: Camera = Camera()
+        self.camera.set_render_scale(render_scale)
 
         # --- GRID and AXES ---
         self.grid: Grid = Grid(
-            screen=self.screen,
+            screen=self.render_surface,
             cell_size=100,
             color=(150, 150, 150),
             camera=self.camera,
         )
-        self.axes: Axes = Axes(screen=self.screen, grid=self.grid)
+        self.axes: Axes = Axes(screen=self.render_surface, grid=self.grid)
 
         # --- OBJECTS MANAGER ---
         self.objectsmanager: ObjectsManager = ObjectsManager(
-            surface=self.screen,
+            surface=self.render_surface,
             camera=self.camera,
             cell_size=self.grid.base_cell_size,
             gravity=(0.0, 9.8),
         )
+        self.objectsmanager.set_quality(solver_quality, default=True)
+        self.objectsmanager.use_physics_worker = physics_worker
+        self.objectsmanager.physics_frames = physics_frames
+        self.objectsmanager.interpolate = interpolate
 
         # --- Draw Assistance ---
         self.draw_assistance = DrawAssistance(
-            self.screen, self.camera, self.grid.base_cell_size
+            self.render_surface, self.camera, self.grid.base_cell_size
         )
 
         # --- Thorpy Init ---
@@ -80,17 +116,37 @@ class App:
                 self.objsidebar.container,
                 self.point_particle_sidebar.container,
                 self.pop_info.get(),
+                self.panelgui.scene_browser.get(),
             ],
             mode=None,
         )
         self.panels_launcher = self.panels.get_updater()
+        # tooltips count down in the panels' update, i.e. only in rendered frames
+        self.helpers: list[tp.Helper] = [
+            element
+            for element in self.panels.get_all_descendants()
+            if isinstance(element, tp.Helper)
+        ]
 
         # --- TIMING ---
         self.clock: Clock = Clock()
 
+        # --- ADAPTIVE QUALITY ---
+        self.quality = QualityController()
+        self.quality.enabled = adaptive_quality
+        self._interpolate_setting: bool = self.objectsmanager.interpolate
+        self._add_quality_steps()
+
+        # --- CACHED BACKGROUND AND PARTIAL REDRAWS ---
+        self.static_layer = StaticLayer(self.render_surface)
+        self.dirty_renderer = DirtyRectRenderer(self.screen, self.static_layer)
+
         # --- FLAGS ---
         self._running: bool = True
         self.dragging: bool = False
+        # set when the next frame has to be rendered; see _is_idle
+        self._dirty: bool = True
+        self._rendered_camera_version: int = -1
 
         # --- PREV MOUSE POS ---
         self.prev_mouse_pos: Optional[pygame.Vector2] = None
@@ -103,6 +159,9 @@ class App:
         elif event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
             if event.key == pygame.K_ESCAPE:
                 pygame.display.iconify()
+            elif self.panelgui.scene_browser.takes_keys():
+                # arrow keys move the cursor of the file name, not the camera
+                pass
             elif event.key == pygame.K_UP:
                 self.camera.move(dy=10)
             elif event.key == pygame.K_DOWN:
@@ -151,14 +210,14 @@ class App:
                     if event.y > 0
                     else 1.0 / self.camera.zoom_speed
                 )
-                self.camera.zoom_at(factor, pygame.mouse.get_pos())
+                self.camera.zoom_at(factor, self._mouse_pos())
         else:
             self.dragging = False
             self.prev_mouse_pos = None
             self.objectsmanager.end_dragging_obj()
 
     def on_update(self) -> None:
-        pos = pygame.mouse.get_pos()
+        pos = self._mouse_pos()
         current_mouse_pos = pygame.Vector2(pos)
         if not self.objectsmanager.selected_obj_is_being_dragged:
             self.objectsmanager.select_object_at_position(pos)
@@ -176,8 +235,17 @@ class App:
                 ) - self.camera.screen_to_world(current_mouse_pos)
                 self.objectsmanager.move_selected_obj(diff * self.camera.zoom)
                 self.prev_mouse_pos = current_mouse_pos
-        self.objectsmanager.step_simulation()
+        # the frame that stops a run or hides the info box must still be drawn
+        if self.objectsmanager.is_simulation_running or self.pop_info.is_active():
+            self.mark_dirty()
+        # the scene advances by the time the last frame took, not by a fixed
+        # frame, so slow frames do not slow the simulation down
+        self.objectsmanager.step_simulation(self.clock.get_time() / 1000)
+        self.objectsmanager.schedule_tasks()
         self.pop_info.tick()
+        self.panelgui.scene_browser.tick()
+        # without a frame rate to keep, background work runs all at once
+        self.objectsmanager.tasks.run(TASK_SLICE_MS if self._is_animating() else None)
 
     def draw_panels(self):
         self.objsidebar.update()
@@ -186,37 +254,187 @@ class App:
         self.panels_launcher.update(func_after=self.panelgui.after_update)
 
     def on_render(self) -> None:
-        self.screen.fill((220, 220, 220))
+        if self._can_render_partially():
+            self._render_partially()
+            return
+        self.dirty_renderer.invalidate()
+        key = self._static_layer_key()
+        if self.static_layer.is_valid(key):
+            self.static_layer.restore()
+        else:
+            self._draw_static_layer(key)
+        self.draw_assistance.draw()
+        self.objectsmanager.draw_dynamic_objects()
+        if self.render_surface is not self.screen:
+            pygame.transform.scale(
+                self.render_surface, self.screen.get_size(), self.screen
+            )
+        self.draw_panels()
+        pygame.display.flip()
+
+    def _static_layer_key(self) -> tuple:
+        return (
+            self.camera.version,
+            self.objectsmanager.objects.static_version,
+            self.grid.visible,
+            self.axes.visible,
+            self.quality.level,
+        )
+
+    def _draw_static_layer(self, key: tuple) -> None:
+        """Draws background, grid, axes and static objects and caches them."""
+        self.render_surface.fill((220, 220, 220))
         self.grid.draw()
         self.axes.draw()
-        self.draw_assistance.draw()
-        self.objectsmanager.draw_objects()
+        self.objectsmanager.draw_static_objects()
+        self.static_layer.capture(key)
+
+    def _can_render_partially(self) -> bool:
+        """
+        Partial redraws are used during playback with a still camera, when the
+        scene is drawn at window resolution.
+        """
+        return (
+            self.render_surface is self.screen
+            and self.objectsmanager.is_simulation_running
+            and not self.dragging
+            and not self.objectsmanager.selected_obj_is_being_dragged
+            and not self.draw_assistance.is_drawing
+            and self.camera.version == self._rendered_camera_version
+        )
+
+    def _render_partially(self) -> None:
+        renderer = self.dirty_renderer
+        key = self._static_layer_key()
+        if renderer.needs_background(key):
+            self._draw_static_layer(key)
+        for rect in self.objectsmanager.draw_dynamic_objects():
+            renderer.add(rect)
         self.draw_panels()
+        for rect in self._panel_rects():
+            renderer.add(rect)
+        renderer.present()
+
+    def _panel_rects(self) -> list[pygame.Rect]:
+        """Screen areas of the GUI panels, which are drawn over the scene."""
+        rects = []
+        for panel in self.panels.children:
+            rect = panel.rect.copy()
+            for element in panel.get_all_descendants():
+                rect.union_ip(element.rect)
+            rects.append(rect)
+        return rects
 
     def on_cleanup(self) -> None:
         pygame.quit()
 
     def on_execute(self) -> None:
         while self._running:
-            for event in pygame.event.get():
+            if self._is_idle():
+                self.quality.pause()
+                # nothing moves: sleep until input arrives or the timeout passes
+                event = pygame.event.wait(IDLE_TIMEOUT_MS)
+                events = [] if event.type == pygame.NOEVENT else [event]
+                events += pygame.event.get()
+            else:
+                events = pygame.event.get()
+            if events:
+                self.mark_dirty()
+            for event in events:
                 self.on_event(event)
+            started = time.perf_counter()
             self.on_update()
-            self.on_render()
-            pygame.display.flip()
-            self.clock.tick(100)
+            animating = self._is_animating()
+            if self._dirty or animating:
+                self.on_render()
+                self._dirty = False
+                self._rendered_camera_version = self.camera.version
+                if animating:
+                    self._measure_frame(started)
+            self.clock.tick(FRAME_RATE_HZ)
 
         self.on_cleanup()
 
+    def _add_quality_steps(self) -> None:
+        """Features dropped on slow frames, in the order they are dropped."""
+        quality = self.quality
+        quality.add_step(
+            "antialiased outlines",
+            lambda on: setattr(render_quality, "antialias", on),
+        )
+        quality.add_step(
+            "vector labels",
+            lambda on: setattr(render_quality, "vector_labels", on),
+        )
+        quality.add_step(
+            "trajectory resolution",
+            lambda on: setattr(render_quality, "trajectory_stride", 1 if on else 2),
+        )
+        quality.add_step(
+            "helper grid lines",
+            lambda on: setattr(self.grid, "show_helpers", on),
+        )
+        quality.add_step(
+            "prediction length",
+            lambda on: setattr(render_quality, "prediction_length", 1.0 if on else 0.5),
+        )
+        quality.add_step("interpolation", self._set_interpolation)
+
+    def _set_interpolation(self, on: bool) -> None:
+        """Turns interpolation off, or back to what it was before."""
+        if on:
+            self.objectsmanager.interpolate = self._interpolate_setting
+        else:
+            self._interpolate_setting = self.objectsmanager.interpolate
+            self.objectsmanager.interpolate = False
+
+    def _measure_frame(self, started: float) -> None:
+        """Feeds the time of an animated frame to the quality controller."""
+        if self.quality.frame((time.perf_counter() - started) * 1000):
+            self.mark_dirty()
+
+    def _mouse_pos(self) -> tuple[int, int]:
+        """Mouse position in render surface pixels."""
+        x, y = self.camera.from_window(pygame.mouse.get_pos())
+        return int(x), int(y)
+
+    def mark_dirty(self) -> None:
+        """Requests a render of the next frame."""
+        self._dirty = True
+
+    def _is_animating(self) -> bool:
+        """True while something on screen changes without user input."""
+        return (
+            self.objectsmanager.is_simulation_running
+            or self.dragging
+            or self.objectsmanager.selected_obj_is_being_dragged
+            or self.draw_assistance.is_drawing
+            or self.camera.version != self._rendered_camera_version
+            or self.objsidebar.is_animating()
+            or self.point_particle_sidebar.is_animating()
+            or self.pop_info.is_active()
+            or self.panelgui.scene_browser.is_animating()
+            or self._helper_pending()
+        )
+
+    def _helper_pending(self) -> bool:
+        """True while the mouse rests on a widget whose tooltip is not shown yet."""
+        return any(
+            helper.time_before_launch > 0
+            and helper.event_parent.state in ("hover", "pressed")
+            for helper in self.helpers
+        )
+
+    def _is_idle(self) -> bool:
+        return not self._dirty and not self._is_animating()
+
     def toggle_simulation(self, running: bool) -> None:
         self.objectsmanager.is_simulation_running = running
 
     def _at_left_mouse_button(self, event) -> None:
         if self.panelgui.is_rubber_on:
             if self.objectsmanager.selected_obj:
-                for i, old_obj in enumerate(self.objectsmanager.objects):
-                    if old_obj == self.objectsmanager.selected_obj:
-                        self.objectsmanager.objects[i].destroy()
-                        self.objectsmanager.objects.pop(i)
+                self.objectsmanager.remove_object(self.objectsmanager.selected_obj)
                 self.objectsmanager.selected_obj = None
                 self.panelgui.is_rubber_on = False
             self.objectsmanager.end_dragging_obj()
@@ -226,12 +444,12 @@ class App:
                 self.draw_assistance.start_pos is None
                 and event.type == pygame.MOUSEBUTTONDOWN
             ):
-                self.draw_assistance.set_start_position(pygame.mouse.get_pos())
+                self.draw_assistance.set_start_position(self._mouse_pos())
             elif (
                 self.draw_assistance.state == 'triangle'
                 and self.draw_assistance.third_triangel_point is None
             ):
-                self.draw_assistance.set_third_triangle_point(pygame.mouse.get_pos())
+                self.draw_assistance.set_third_triangle_point(self._mouse_pos())
             else:
                 self.prev_mouse_pos = None
                 result = self.draw_assistance.deactivate_drawing()
@@ -252,7 +470,7 @@ class App:
                 self.prev_mouse_pos = None
             else:
                 obj = self.objectsmanager.selected_obj
-                self.prev_mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+                self.prev_mouse_pos = pygame.Vector2(self._mouse_pos())
                 if obj:
                     self.objectsmanager.selected_obj_is_being_dragged = True
                 elif not self.dragging:
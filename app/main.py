@@ -1,5 +1,54 @@
-from app import App
+import argparse
+
+from obj.objectsmanager import FRAME_RATE_HZ
+from obj.solversettings import QUALITY_PRESETS
+
+from app import RENDER_SCALES, App
 
 if __name__ == "__main__":
-    theApp = App()
+    parser = argparse.ArgumentParser(description="Classical-Mechanics-Simulator-in-2D")
+    parser.add_argument(
+        "--render-scale",
+        type=int,
+        choices=[round(scale * 100) for scale in RENDER_SCALES],
+        default=100,
+        help="resolution of the scene in percent of the window; the GUI stays sharp",
+    )
+    parser.add_argument(
+        "--no-adaptive-quality",
+        action="store_true",
+        help="keep full rendering quality even when frames take too long",
+    )
+    parser.add_argument(
+        "--solver-quality",
+        choices=list(QUALITY_PRESETS),
+        default="normal",
+        help="physics solver preset for new scenes and scenes saved without one",
+    )
+    parser.add_argument(
+        "--physics-worker",
+        action="store_true",
+        help="step the physics in a separate process while the simulation plays",
+    )
+    parser.add_argument(
+        "--physics-rate",
+        type=int,
+        choices=[FRAME_RATE_HZ // frames for frames in (1, 2, 4)],
+        default=FRAME_RATE_HZ,
+        help="physics frames per second; below the frame rate, combine with --interpolate",
+    )
+    parser.add_argument(
+        "--interpolate",
+        action="store_true",
+        help="draw bodies blended between the last two physics frames",
+    )
+    args = parser.parse_args()
+    theApp = App(
+        render_scale=args.render_scale / 100,
+        adaptive_quality=not args.no_adaptive_quality,
+        solver_quality=args.solver_quality,
+        physics_worker=args.physics_worker,
+        physics_frames=FRAME_RATE_HZ // args.physics_rate,
+        interpolate=args.interpolate,
+    )
     theApp.on_execute()
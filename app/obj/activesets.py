@@ -0,0 +1,77 @@
+from typing import Callable, Hashable
+
+from obj.drawn.visualvector import visibility_version
+from obj.forcemanager import applied_force_version
+from obj.objectregistry import ObjectRegistry
+from obj.realobject import RealObject
+from obj.trajectory import trajectory_visibility_version
+
+
+class ActiveSets:
+    """
+    Subsets of the registry that per-step and per-frame passes iterate instead
+    of every object, each in draw order. A subset is rebuilt on first use
+    after what it depends on was edited: membership (registry version), an
+    applied force, or the visibility of a vector or trajectory.
+    """
+
+    def __init__(self, objects: ObjectRegistry) -> None:
+        self.objects = objects
+        self._cache: dict[str, tuple[Hashable, list[RealObject]]] = {}
+
+    def _subset(
+        self, name: str, key: Hashable, test: Callable[[RealObject], bool]
+    ) -> list[RealObject]:
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        subset = [obj for obj in self.objects if test(obj)]
+        self._cache[name] = (key, subset)
+        return subset
+
+    @property
+    def dynamic(self) -> list[RealObject]:
+        """Non-static objects with a body."""
+        return self._subset(
+            "dynamic",
+            self.objects.version,
+            lambda obj: obj.obj_type != "static" and obj.physics.body is not None,
+        )
+
+    @property
+    def forced(self) -> list[RealObject]:
+        """Objects with a non-zero applied force."""
+        return self._subset(
+            "forced",
+            (self.objects.version, applied_force_version()),
+            lambda obj: obj.forcemanager is not None
+            and obj.forcemanager.has_applied_force(),
+        )
+
+    @property
+    def with_vectors(self) -> list[RealObject]:
+        """Objects showing at least one vector."""
+
+        def shows_vectors(obj: RealObject) -> bool:
+            vm = obj.get_vector_manager(create=False)
+            return vm is not None and vm.any_visible()
+
+        return self._subset(
+            "with_vectors",
+            (self.objects.version, visibility_version()),
+            shows_vectors,
+        )
+
+    @property
+    def with_trajectories(self) -> list[RealObject]:
+        """Objects showing their trajectory."""
+
+        def shows_trajectory(obj: RealObject) -> bool:
+            trajectory = obj.get_trajectory(create=False)
+            return trajectory is not None and trajectory.visible
+
+        return self._subset(
+            "with_trajectories",
+            (self.objects.version, trajectory_visibility_version()),
+            shows_trajectory,
+        )
@@ -0,0 +1,59 @@
+from typing import Any, Tuple
+
+from Box2D import b2_dynamicBody
+from obj.bodystate import BodyState
+
+
+def is_contact_free(body: Any) -> bool:
+    """
+    True for a dynamic body whose motion contacts can never change:
+    every fixture is a sensor and nothing damps it. Point particles qualify.
+    """
+    if body is None or body.type != b2_dynamicBody or not body.fixtures:
+        return False
+    if body.linearDamping != 0 or body.angularDamping != 0:
+        return False
+    return all(fixture.sensor for fixture in body.fixtures)
+
+
+class AnalyticMotion:
+    """
+    Closed-form motion of a body under constant acceleration, anchored at
+    time `t0` (seconds):
+        p(t) = p0 + v0 (t - t0) + a (t - t0)^2 / 2
+        v(t) = v0 + a (t - t0)
+    Evaluating it at any time is O(1) and free of integration error.
+    """
+
+    def __init__(
+        self,
+        state: BodyState,
+        acceleration: Tuple[float, float],
+        t0: float,
+        fixed_rotation: bool,
+    ) -> None:
+        self.x0 = state.x
+        self.y0 = state.y
+        self.vx0 = state.vx
+        self.vy0 = state.vy
+        self.angle0 = state.angle
+        self.angular_velocity = 0.0 if fixed_rotation else state.angular_velocity
+        self.ax, self.ay = acceleration
+        self.t0 = t0
+
+    def at(self, t: float) -> Tuple[float, float, float, float, float]:
+        """Returns (x, y, angle, vx, vy) at time `t` in seconds."""
+        dt = t - self.t0
+        half_dt2 = 0.5 * dt * dt
+        return (
+            self.x0 + self.vx0 * dt + self.ax * half_dt2,
+            self.y0 + self.vy0 * dt + self.ay * half_dt2,
+            self.angle0 + self.angular_velocity * dt,
+            self.vx0 + self.ax * dt,
+            self.vy0 + self.ay * dt,
+        )
+
+    def apply(self, body: Any, t: float) -> None:
+        x, y, angle, vx, vy = self.at(t)
+        body.transform = ((x, y), angle)
+        body.linearVelocity = (vx, vy)
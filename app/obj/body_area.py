@@ -2,6 +2,9 @@ import math
 
 from Box2D import b2CircleShape, b2PolygonShape
 
+# Radius of the circle fixture PhysicObject gives to every point particle.
+POINT_PARTICLE_RADIUS = 0.0022
+
 
 def body_area(body):
     total_area = 0.0
@@ -20,3 +23,56 @@ def body_area(body):
                 )
             )
     return total_area
+
+
+def shape_area(shape_type, size):
+    """
+    Area the body created by PhysicObject for the given shape and size will have.
+    Lets callers reject dust before a Box2D body is created.
+    """
+    if shape_type == "rectangle":
+        width, height = size
+        return abs(width * height)
+    if shape_type == "circle":
+        return math.pi * size**2
+    if shape_type == "triangle":
+        verts = list(size)
+        return 0.5 * abs(
+            sum(
+                x0 * y1 - x1 * y0
+                for (x0, y0), (x1, y1) in zip(verts, verts[1:] + verts[:1])
+            )
+        )
+    if shape_type == "point_particle":
+        return math.pi * POINT_PARTICLE_RADIUS**2
+    raise ValueError(f"Unknown shape type: {shape_type}")
+
+
+def body_min_extent(body):
+    """
+    Smallest thickness of the body's solid fixtures: the diameter of a circle,
+    the minimum width of a convex polygon. Sensors are skipped, as they can not
+    tunnel. Returns math.inf when there is nothing solid.
+    """
+    extent = math.inf
+    if body is None:
+        return extent
+    for fixture in body.fixtures:
+        if fixture.sensor:
+            continue
+        shape = fixture.shape
+        if isinstance(shape, b2CircleShape):
+            extent = min(extent, 2 * shape.radius)
+        elif isinstance(shape, b2PolygonShape):
+            verts = shape.vertices
+            for (x0, y0), (x1, y1) in zip(verts, verts[1:] + verts[:1]):
+                length = math.hypot(x1 - x0, y1 - y0)
+                if length == 0:
+                    continue
+                # width across this edge: farthest vertex from its line
+                width = max(
+                    abs((x1 - x0) * (y0 - y) - (x0 - x) * (y1 - y0)) / length
+                    for x, y in verts
+                )
+                extent = min(extent, width)
+    return extent
@@ -0,0 +1,205 @@
+import math
+from collections import deque
+from typing import Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+from Box2D import (
+    b2_angularSleepTolerance,
+    b2_linearSleepTolerance,
+    b2_staticBody,
+    b2_timeToSleep,
+)
+from obj.bodystate import ANGULAR_VELOCITY, AWAKE, VX, VY, BodyStateMirror, X, Y
+
+LIFECYCLE_MODES = ("deactivate", "remove")
+
+
+def _valid_bounds(bounds: Any) -> bool:
+    """True for (min_x, min_y, max_x, max_y) of finite numbers with min < max."""
+    if not isinstance(bounds, (list, tuple)) or len(bounds) != 4:
+        return False
+    if not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+        for v in bounds
+    ):
+        return False
+    min_x, min_y, max_x, max_y = bounds
+    return min_x < max_x and min_y < max_y
+
+
+class LifecycleEvent(NamedTuple):
+    time: float
+    obj_id: Optional[int]
+    shape_type: str
+    kind: str  # "deactivated", "removed" or "slept"
+    position: Tuple[float, float]
+
+
+class BodyLifecycle:
+    """
+    Keeps long sessions from degrading: bodies that leave the world bounds are
+    deactivated or removed, and resting bodies are put to sleep using the
+    thresholds below. Everything that happens is logged in `events`.
+    """
+
+    def __init__(
+        self,
+        bounds: Optional[Tuple[float, float, float, float]] = (
+            -1000.0,
+            -1000.0,
+            1000.0,
+            1000.0,
+        ),
+        mode: str = "deactivate",
+        allow_sleeping: bool = True,
+        linear_sleep_tolerance: float = b2_linearSleepTolerance,
+        angular_sleep_tolerance: float = b2_angularSleepTolerance,
+        time_to_sleep: float = b2_timeToSleep,
+        max_events: int = 200,
+    ) -> None:
+        if mode not in LIFECYCLE_MODES:
+            raise ValueError(f"Unknown lifecycle mode: {mode}")
+        if bounds is not None:
+            min_x, min_y, max_x, max_y = bounds
+            if min_x >= max_x or min_y >= max_y:
+                raise ValueError("World bounds must have positive width and height.")
+            bounds = (float(min_x), float(min_y), float(max_x), float(max_y))
+        if linear_sleep_tolerance < 0 or angular_sleep_tolerance < 0:
+            raise ValueError("Sleep tolerances can not be negative.")
+        # (min_x, min_y, max_x, max_y) in meters, None disables the kill plane
+        self.bounds = bounds
+        self.mode = mode
+        self.allow_sleeping = bool(allow_sleeping)
+        self.linear_sleep_tolerance = float(linear_sleep_tolerance)
+        self.angular_sleep_tolerance = float(angular_sleep_tolerance)
+        self.time_to_sleep = float(time_to_sleep)
+        self.events: deque[LifecycleEvent] = deque(maxlen=max_events)
+        # seconds each mirror row has been below the sleep tolerances
+        self._still_time: np.ndarray = np.zeros(0)
+        self._rows_version: int = -1
+
+    def transfer_to_json(self) -> dict:
+        return {
+            "bounds": list(self.bounds) if self.bounds is not None else None,
+            "mode": self.mode,
+            "allow_sleeping": self.allow_sleeping,
+            "linear_sleep_tolerance": self.linear_sleep_tolerance,
+            "angular_sleep_tolerance": self.angular_sleep_tolerance,
+            "time_to_sleep": self.time_to_sleep,
+        }
+
+    @classmethod
+    def from_json(cls, data: Any) -> "BodyLifecycle":
+        """
+        Reads settings saved by transfer_to_json. Missing or invalid values
+        keep their defaults, so a damaged block never makes a scene unloadable.
+        """
+        default = cls()
+        if not isinstance(data, dict):
+            return default
+
+        def tolerance(key: str) -> float:
+            value = data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if math.isfinite(value) and value >= 0:
+                    return float(value)
+            return getattr(default, key)
+
+        # null disables the bounds; anything else must be a valid box
+        bounds = data.get("bounds", default.bounds)
+        if bounds is not None and not _valid_bounds(bounds):
+            bounds = default.bounds
+        mode = data.get("mode")
+        allow_sleeping = data.get("allow_sleeping")
+        return cls(
+            bounds=tuple(bounds) if bounds is not None else None,
+            mode=mode if mode in LIFECYCLE_MODES else default.mode,
+            allow_sleeping=(
+                allow_sleeping
+                if isinstance(allow_sleeping, bool)
+                else default.allow_sleeping
+            ),
+            linear_sleep_tolerance=tolerance("linear_sleep_tolerance"),
+            angular_sleep_tolerance=tolerance("angular_sleep_tolerance"),
+            time_to_sleep=tolerance("time_to_sleep"),
+        )
+
+    def restart(self) -> None:
+        """Forgets how long bodies have been resting, e.g. after a reset."""
+        self._rows_version = -1
+
+    # -------------------------------------------------------
+    def out_of_bounds(self, objects: Any, states: BodyStateMirror) -> list[Any]:
+        """Dynamic, still simulated objects whose body is outside the bounds."""
+        if self.bounds is None or not states.rows:
+            return []
+        min_x, min_y, max_x, max_y = self.bounds
+        x = states.column(X)
+        y = states.column(Y)
+        outside = (x < min_x) | (x > max_x) | (y < min_y) | (y > max_y)
+        if not outside.any():
+            return []
+        return [
+            obj
+            for obj in objects
+            if obj.state_mirror is states
+            and outside[obj.state_index]
+            and obj.obj_type != "static"
+            and not obj.out_of_world
+        ]
+
+    def sleepy(self, objects: Any, states: BodyStateMirror, dt: float) -> list[Any]:
+        """
+        Awake objects that stayed below the sleep tolerances for time_to_sleep
+        and touch no other moving body.
+        """
+        if not self.allow_sleeping or not states.rows:
+            return []
+        if self._rows_version != objects.version or len(self._still_time) != len(
+            states.rows
+        ):
+            self._still_time = np.zeros(len(states.rows))
+            self._rows_version = objects.version
+        speed = np.hypot(states.column(VX), states.column(VY))
+        still = (
+            (speed <= self.linear_sleep_tolerance)
+            & (np.abs(states.column(ANGULAR_VELOCITY)) <= self.angular_sleep_tolerance)
+            & (states.column(AWAKE) != 0)
+        )
+        self._still_time = np.where(still, self._still_time + dt, 0.0)
+        ready = self._still_time >= self.time_to_sleep
+        if not ready.any():
+            return []
+        result = []
+        for obj in objects:
+            if (
+                obj.state_mirror is not states
+                or obj.obj_type == "static"
+                or not ready[obj.state_index]
+            ):
+                continue
+            if _touches_moving_body(obj.physics.body, ready, objects):
+                continue
+            result.append(obj)
+        return result
+
+    def log(self, time: float, obj: Any, kind: str) -> None:
+        body = obj.physics.body
+        position = (body.position.x, body.position.y) if body is not None else (0, 0)
+        self.events.append(LifecycleEvent(time, obj.id, obj.shape_type, kind, position))
+
+
+def _touches_moving_body(body: Any, ready: np.ndarray, objects: Any) -> bool:
+    """True if a touching neighbour is dynamic, awake and not about to sleep too."""
+    for edge in body.contacts:
+        if not edge.contact.touching:
+            continue
+        other = edge.other
+        if other.type == b2_staticBody or not other.awake:
+            continue
+        neighbour = objects.from_body(other)
+        if neighbour is None or neighbour.state_mirror is None:
+            return True
+        if not ready[neighbour.state_index]:
+            return True
+    return False
@@ -0,0 +1,119 @@
+import math
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+
+
+class BodyState(NamedTuple):
+    """Snapshot of the body values read every frame."""
+
+    x: float
+    y: float
+    angle: float
+    vx: float
+    vy: float
+    cx: float
+    cy: float
+    angular_velocity: float
+    awake: bool
+
+    @classmethod
+    def read(cls, body: Any) -> "BodyState":
+        p = body.position
+        v = body.linearVelocity
+        c = body.worldCenter
+        return cls(
+            p.x, p.y, body.angle, v.x, v.y, c.x, c.y, body.angularVelocity, body.awake
+        )
+
+
+# column indices of BodyStateMirror.array
+X, Y, ANGLE, VX, VY, CX, CY, ANGULAR_VELOCITY, AWAKE = range(9)
+
+
+def lerp_angle(a: Any, b: Any, alpha: float) -> Any:
+    """Blends two angles in radians along the shorter arc; works on arrays too."""
+    delta = (b - a + math.pi) % (2 * math.pi) - math.pi
+    return a + delta * alpha
+
+
+class BodyStateMirror:
+    """
+    Struct-of-arrays copy of all body states, captured in one pass after each
+    world step. Objects read their row instead of crossing into pybox2d for
+    every value, and whole-scene consumers use the NumPy columns.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[BodyState] = []
+        # Fortran order keeps every column contiguous
+        self.array: np.ndarray = np.zeros((0, 9), order="F")
+        # set when a body was changed outside a step; rows are stale until capture
+        self.dirty: bool = True
+        self._bodies: list[Any] = []
+        self._version: int = -1
+        # array from before the last physics frame and how far rendering has
+        # moved from it towards the current one (1.0 renders the current state)
+        self.previous: Optional[np.ndarray] = None
+        self.alpha: float = 1.0
+
+    def column(self, index: int) -> np.ndarray:
+        return self.array[:, index]
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        # a body was moved by hand, there is nothing to blend from
+        self.previous = None
+
+    def keep_previous(self) -> None:
+        """Remembers the current states as the start of the next blend."""
+        self.previous = None if self.dirty else self.array
+
+    def blended(self, index: int) -> BodyState:
+        """
+        State of row `index` as it should be rendered: the current one, or a
+        blend from the previous physics frame (position lerp, angle slerp).
+        """
+        current = self.rows[index]
+        previous = self.previous
+        alpha = self.alpha
+        if alpha >= 1.0 or previous is None or len(previous) != len(self.rows):
+            return current
+        x0, y0, angle0 = previous[index, X], previous[index, Y], previous[index, ANGLE]
+        cx0, cy0 = previous[index, CX], previous[index, CY]
+        return current._replace(
+            x=x0 + (current.x - x0) * alpha,
+            y=y0 + (current.y - y0) * alpha,
+            angle=lerp_angle(angle0, current.angle, alpha),
+            cx=cx0 + (current.cx - cx0) * alpha,
+            cy=cy0 + (current.cy - cy0) * alpha,
+        )
+
+    def capture(self, objects: Any) -> None:
+        """Reads every body once. `objects` is the scene's ObjectRegistry."""
+        if objects.version != self._version:
+            self._rebuild(objects)
+        rows = [BodyState.read(body) for body in self._bodies]
+        self.rows = rows
+        if rows:
+            self.array = np.array(rows, dtype=float, order="F")
+        else:
+            self.array = np.zeros((0, 9), order="F")
+        self.dirty = False
+
+    def refresh(self, objects: Any) -> None:
+        """Captures only if something changed since the last capture."""
+        if self.dirty or objects.version != self._version:
+            self.capture(objects)
+
+    def _rebuild(self, objects: Any) -> None:
+        self.previous = None
+        self._bodies = []
+        for obj in objects:
+            obj.state_mirror = None
+            if obj.physics.body is None:
+                continue
+            obj.state_mirror = self
+            obj.state_index = len(self._bodies)
+            self._bodies.append(obj.physics.body)
+        self._version = objects.version
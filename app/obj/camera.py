@@ -9,6 +9,30 @@ class Camera:
         self.min_zoom: float = 0.01
         self.max_zoom: float = 100.0
         self.zoom_speed: float = 1.12
+        # bumped whenever zoom or offset changes, for caches of screen geometry
+        self.version: int = 0
+        # size of the render surface relative to the window; zoom and offset
+        # are in render surface pixels
+        self.render_scale: float = 1.0
+
+    def set_render_scale(self, scale: float) -> None:
+        """Moves the camera to a render surface `scale` times the window size."""
+        if scale <= 0:
+            raise ValueError("Render scale must be positive.")
+        ratio = scale / self.render_scale
+        self.zoom *= ratio
+        self.min_zoom *= ratio
+        self.max_zoom *= ratio
+        self.offset *= ratio
+        self.render_scale = scale
+        self.version += 1
+
+    def from_window(self, window_pos: tuple) -> pygame.Vector2:
+        """Window pixel (e.g. the mouse) to render surface pixel."""
+        return pygame.Vector2(window_pos) * self.render_scale
+
+    def to_window(self, render_pos: tuple) -> pygame.Vector2:
+        return pygame.Vector2(render_pos) / self.render_scale
 
     def zoom_at(self, factor: float, pivot: tuple[float, float]) -> None:
         old_zoom = self.zoom
@@ -23,10 +47,14 @@ class Camera:
         # korekta offsetu, aby pivot pozostał w tym samym miejscu ekranu
         self.zoom = new_zoom
         self.offset = pygame.Vector2(pivot) - world_pos * self.zoom
+        self.version += 1
 
     def move(self, dx: float = 0.0, dy: float = 0.0) -> None:
+        if dx == 0 and dy == 0:
+            return
         self.offset.x += dx
         self.offset.y += dy
+        self.version += 1
 
     def world_to_screen(self, world_pos: tuple) -> pygame.Vector2:
         return pygame.Vector2(world_pos) * self.zoom + self.offset
@@ -0,0 +1,104 @@
+from typing import Hashable, Iterable, Optional
+
+import pygame  # type: ignore
+from obj.staticlayer import StaticLayer
+
+
+def union_rect(
+    a: Optional[pygame.Rect], b: Optional[pygame.Rect]
+) -> Optional[pygame.Rect]:
+    """Union of two optional rects; None stands for "nothing drawn"."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a.union(b)
+
+
+def points_rect(points: Iterable) -> Optional[pygame.Rect]:
+    """Bounding rect of screen points, None for an empty sequence."""
+    xs = []
+    ys = []
+    for p in points:
+        xs.append(p[0])
+        ys.append(p[1])
+    if not xs:
+        return None
+    left, top = int(min(xs)), int(min(ys))
+    return pygame.Rect(left, top, int(max(xs)) - left + 1, int(max(ys)) - top + 1)
+
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Joins overlapping rects so that no pixel is pushed twice."""
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    Partial redraws for a static camera. The first frame for a given key draws
+    the whole background (grid, axes, statics) into the StaticLayer. Later
+    frames only restore the layer under everything drawn on top of it in the
+    previous frame and push the changed rects to the display.
+    """
+
+    # anti-aliased edges and line caps reach a little past the geometry
+    PADDING = 3
+
+    def __init__(self, screen: pygame.Surface, layer: StaticLayer) -> None:
+        self.screen = screen
+        self.layer = layer
+        self._prev_rects: list[pygame.Rect] = []
+        self._rects: list[pygame.Rect] = []
+        self._full: bool = True
+
+    def invalidate(self) -> None:
+        """Forgets what is on screen; the next frame is pushed in full."""
+        self._prev_rects = []
+        self._full = True
+
+    def needs_background(self, key: Hashable) -> bool:
+        """
+        True if the background has to be drawn on screen (and captured into
+        the layer) for this frame.
+        """
+        self._rects = []
+        if not self.layer.is_valid(key):
+            self._full = True
+            return True
+        if self._full:
+            # the screen holds a full frame from another path: start clean
+            self.layer.restore()
+        else:
+            for rect in self._prev_rects:
+                self.layer.restore(rect)
+        return False
+
+    def add(self, rect: Optional[pygame.Rect]) -> None:
+        """Registers a rect drawn over the background in this frame."""
+        if rect is None:
+            return
+        rect = rect.inflate(2 * self.PADDING, 2 * self.PADDING).clip(
+            self.screen.get_rect()
+        )
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def present(self) -> None:
+        if self._full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(merge_rects(self._prev_rects + self._rects))
+        self._prev_rects = self._rects
+        self._rects = []
+        self._full = False
@@ -1,10 +1,24 @@
 import math
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame  # type: ignore
 import pygame.gfxdraw
 from obj.camera import Camera
 from obj.drawn.empty import Empty
+from obj.drawn.lod import (
+    circle_polygon,
+    draw_circle_outline,
+    draw_outline,
+    pixel_batch,
+    render_quality,
+    screen_bounds,
+)
+from obj.drawn.spritecache import (
+    ANGLE_STEP,
+    SPRITE_PADDING,
+    angle_bucket,
+    sprite_cache,
+)
 
 
 class Circle(Empty):
@@ -32,42 +46,101 @@ class Circle(Empty):
         self.is_visible: bool = True
 
     def draw(self) -> None:
-        if not self.update():
+        if not self.refresh():
             return
-        pygame.gfxdraw.filled_circle(
-            self.surface,
-            int(self.screen_center.x),
-            int(self.screen_center.y),
-            int(self.screen_radius),
-            self.color,
-        )
-        if self.cam.zoom <= 10:
-            pygame.gfxdraw.aacircle(
+        diameter = 2 * self.screen_radius
+        if diameter < render_quality.pixel_size:
+            pixel_batch.add(self.screen_center, self.color)
+            return
+        outline = self.cam.zoom <= 10 and diameter >= render_quality.outline_size
+        if self.angle is None:
+            self.angle = 0.0
+        if self._draw_sprite(outline):
+            return
+
+        sprite_cache.flush(self.surface)
+        bounds = screen_bounds(self.surface)
+        if self.screen_radius > max(bounds.width, bounds.height):
+            # rasterize only the part of a huge circle that is on screen
+            points = circle_polygon(self.screen_center, self.screen_radius, bounds)
+            if points is None:
+                return
+            pygame.gfxdraw.filled_polygon(self.surface, points, self.color)
+            if outline:
+                draw_outline(self.surface, points, self.border_color)
+        else:
+            self._raster(
                 self.surface,
                 int(self.screen_center.x),
                 int(self.screen_center.y),
                 int(self.screen_radius),
-                self.border_color,
+                outline,
             )
-        self._draw_radius_line()
-
-    def _draw_radius_line(self) -> None:
         radius_px = self.radius * self.base_cell_size_world * self.cam.zoom
+        self._draw_radius_line(
+            self.surface, self.screen_center, radius_px, self.angle, bounds
+        )
+
+    def _raster(
+        self, surface: pygame.Surface, x: int, y: int, radius: int, outline: bool
+    ) -> None:
+        pygame.gfxdraw.filled_circle(surface, x, y, radius, self.color)
+        if outline:
+            draw_circle_outline(surface, x, y, radius, self.border_color)
+
+    def _draw_sprite(self, outline: bool) -> bool:
+        """Queues a shared sprite of the circle; False if it is drawn directly."""
+        if not render_quality.sprites or 2 * self.screen_radius > sprite_cache.max_size:
+            return False
+        radius = int(self.screen_radius)
+        bucket = angle_bucket(self.angle)
+        key = (
+            "circle",
+            radius,
+            tuple(map(int, self.color)),
+            bucket,
+            outline,
+            render_quality.antialias,
+        )
+        center = radius + SPRITE_PADDING
+        side = 2 * center + 1
+
+        def raster(sprite: pygame.Surface) -> None:
+            self._raster(sprite, center, center, radius, outline)
+            self._draw_radius_line(
+                sprite,
+                pygame.Vector2(center, center),
+                radius,
+                bucket * ANGLE_STEP,
+                sprite.get_rect(),
+            )
+
+        sprite = sprite_cache.get(key, (side, side), raster)
+        sprite_cache.queue(
+            sprite,
+            (int(self.screen_center.x) - center, int(self.screen_center.y) - center),
+        )
+        return True
 
-        start = pygame.Vector2(self.screen_center)
+    def _draw_radius_line(
+        self,
+        surface: pygame.Surface,
+        start: pygame.Vector2,
+        radius_px: float,
+        angle: float,
+        bounds: pygame.Rect,
+    ) -> None:
+        start = pygame.Vector2(start)
         end = pygame.Vector2(start.x + radius_px, start.y)
-        if self.angle is None:
-            self.angle = 0.0
         # Obrót względem środka (zgodnie z konwencją Pygame)
-        end = self.rotate_point(end, start, self.angle)
+        end = self.rotate_point(end, start, angle)
 
+        line = bounds.clipline(start, end)
+        if not line:
+            return
+        (x0, y0), (x1, y1) = line
         pygame.gfxdraw.line(
-            self.surface,
-            int(start.x),
-            int(start.y),
-            int(end.x),
-            int(end.y),
-            self.border_color,
+            surface, int(x0), int(y0), int(x1), int(y1), self.border_color
         )
 
     def rotate_point(
@@ -80,6 +153,13 @@ class Circle(Empty):
         qy = center.y + dx * math.sin(angle_rad) + dy * math.cos(angle_rad)
         return pygame.Vector2(qx, qy)
 
+    def screen_rect(self) -> Optional[pygame.Rect]:
+        if not self.is_visible:
+            return None
+        r = int(self.screen_radius) + 1
+        x, y = int(self.screen_center.x), int(self.screen_center.y)
+        return pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1)
+
     def move(self, vec: pygame.Vector2) -> None:
         """Move the rectangle by dx, dy in world coordinates."""
         self.position += vec
@@ -1,5 +1,5 @@
 import typing
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import pygame  # type: ignore
 from obj.camera import Camera
@@ -69,6 +69,15 @@ class DrawnObject:
         """Draws the underlying shape."""
         self.object.draw()
 
+    def screen_rect(self) -> Optional[pygame.Rect]:
+        """Screen area covered by the last draw, None if nothing was drawn."""
+        return self.object.screen_rect()
+
+    def hide(self) -> None:
+        """Forgets the screen geometry; the next draw recomputes it."""
+        self.object.is_visible = False
+        self.object._geometry_key = None
+
     def move(self, vec: pygame.Vector2) -> None:
         """Moves the shape in world coordinates."""
         self.object.move(vec)
@@ -5,6 +5,10 @@ from obj.camera import Camera
 
 
 class Empty:
+    # inputs of the last update(), see refresh()
+    _geometry_key: Optional[tuple] = None
+    is_visible: bool = False
+
     def __init__(
         self,
         surface: Optional[pygame.Surface] = None,
@@ -33,6 +37,29 @@ class Empty:
     def update(self) -> bool:
         return False
 
+    def refresh(self) -> bool:
+        """
+        Calls update() only if position, angle, camera or surface size changed
+        since the last call, otherwise returns the cached visibility.
+        """
+        if self.cam is None or self.surface is None or self.position is None:
+            return self.update()
+        key = (
+            self.position[0],
+            self.position[1],
+            getattr(self, "angle", None),
+            self.cam.version,
+            self.surface.get_size(),
+        )
+        if key != self._geometry_key:
+            self._geometry_key = key
+            self.is_visible = self.update()
+        return self.is_visible
+
+    def screen_rect(self) -> Optional[pygame.Rect]:
+        """Screen bounds of the shape as of the last update(), None if hidden."""
+        return None
+
     # ------------------------------------------------------
     def move(self, vec: pygame.Vector2) -> None:
         return
@@ -0,0 +1,191 @@
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+import pygame  # type: ignore
+import pygame.gfxdraw
+
+# gfxdraw takes 16-bit coordinates; geometry is clipped well before that
+MAX_RASTER_COORD = 16000
+
+
+class RenderQuality:
+    """
+    Zoom-dependent level-of-detail thresholds, all in screen pixels, and the
+    feature switches lowered by the QualityController on slow frames. Shared
+    by every drawn shape through `render_quality`.
+    """
+
+    def __init__(
+        self,
+        pixel_size: float = 1.5,
+        outline_size: float = 6.0,
+        clip_margin: int = 4,
+        sprites: bool = True,
+        antialias: bool = True,
+        vector_labels: bool = True,
+        trajectory_stride: int = 1,
+        prediction_length: float = 1.0,
+    ) -> None:
+        # shapes smaller than this are drawn as a single batched pixel
+        self.pixel_size = pixel_size
+        # outlines of shapes smaller than this are skipped
+        self.outline_size = outline_size
+        # clipped geometry reaches this far past the screen edge, so the edges
+        # made by clipping are never visible
+        self.clip_margin = clip_margin
+        # small shapes are drawn from the shared SpriteCache
+        self.sprites = sprites
+        # outlines are drawn antialiased
+        self.antialias = antialias
+        # vectors show their magnitude next to the arrow head
+        self.vector_labels = vector_labels
+        # only every n-th of the points a trajectory would draw is drawn
+        self.trajectory_stride = trajectory_stride
+        # fraction of the predicted trajectory that is computed and drawn
+        self.prediction_length = prediction_length
+
+
+render_quality = RenderQuality()
+
+
+def draw_outline(
+    surface: pygame.Surface, points: Sequence[Sequence[float]], color
+) -> None:
+    """Polygon outline, antialiased unless the render quality is lowered."""
+    if render_quality.antialias:
+        pygame.gfxdraw.aapolygon(surface, points, color)
+    else:
+        pygame.gfxdraw.polygon(surface, points, color)
+
+
+def draw_circle_outline(
+    surface: pygame.Surface, x: int, y: int, radius: int, color
+) -> None:
+    """Circle outline, antialiased unless the render quality is lowered."""
+    if render_quality.antialias:
+        pygame.gfxdraw.aacircle(surface, x, y, radius, color)
+    else:
+        pygame.gfxdraw.circle(surface, x, y, radius, color)
+
+
+class PixelBatch:
+    """Collects sub-pixel shapes and writes them with one surfarray access."""
+
+    def __init__(self) -> None:
+        self._xs: list[int] = []
+        self._ys: list[int] = []
+        self._colors: list[tuple[int, int, int]] = []
+
+    def add(self, position: Sequence[float], color: Sequence[float]) -> None:
+        self._xs.append(int(position[0]))
+        self._ys.append(int(position[1]))
+        self._colors.append((int(color[0]), int(color[1]), int(color[2])))
+
+    def flush(self, surface: pygame.Surface) -> None:
+        if not self._xs:
+            return
+        xs = np.array(self._xs)
+        ys = np.array(self._ys)
+        colors = self._colors
+        self._xs, self._ys, self._colors = [], [], []
+
+        width, height = surface.get_size()
+        keep = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        if not keep.any():
+            return
+        mapped = {color: surface.map_rgb(color) for color in set(colors)}
+        values = np.array([mapped[color] for color in colors], dtype=np.uint32)
+        if surface.get_bytesize() == 3:
+            # 24-bit surfaces have no 2D pixel view
+            for x, y, i in zip(xs[keep], ys[keep], np.flatnonzero(keep)):
+                surface.set_at((int(x), int(y)), colors[i])
+            return
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[xs[keep], ys[keep]] = values[keep]
+        del pixels  # unlocks the surface
+
+
+pixel_batch = PixelBatch()
+
+
+def screen_bounds(surface: pygame.Surface) -> pygame.Rect:
+    """Screen rect grown by the clip margin."""
+    margin = render_quality.clip_margin
+    return surface.get_rect().inflate(2 * margin, 2 * margin)
+
+
+def needs_clipping(points: Sequence[Sequence[float]], bounds: pygame.Rect) -> bool:
+    """True if a polygon reaches past the bounds far enough to matter."""
+    for x, y in points:
+        if (
+            x < bounds.left
+            or x > bounds.right
+            or y < bounds.top
+            or y > bounds.bottom
+            or abs(x) > MAX_RASTER_COORD
+            or abs(y) > MAX_RASTER_COORD
+        ):
+            return True
+    return False
+
+
+def clip_polygon(
+    points: Sequence[Sequence[float]], bounds: pygame.Rect
+) -> list[tuple[float, float]]:
+    """Sutherland-Hodgman clipping of a convex or simple polygon to a rect."""
+    result = [(float(x), float(y)) for x, y in points]
+    for axis, limit, keep_above in (
+        (0, bounds.left, True),
+        (0, bounds.right, False),
+        (1, bounds.top, True),
+        (1, bounds.bottom, False),
+    ):
+        if not result:
+            break
+        source, result = result, []
+        prev = source[-1]
+        prev_in = (prev[axis] >= limit) == keep_above
+        for point in source:
+            point_in = (point[axis] >= limit) == keep_above
+            if point_in != prev_in:
+                t = (limit - prev[axis]) / (point[axis] - prev[axis])
+                crossing = (
+                    prev[0] + (point[0] - prev[0]) * t,
+                    prev[1] + (point[1] - prev[1]) * t,
+                )
+                result.append(crossing)
+            if point_in:
+                result.append(point)
+            prev, prev_in = point, point_in
+    return result
+
+
+def circle_polygon(
+    center: Sequence[float], radius: float, bounds: pygame.Rect
+) -> Optional[list[tuple[float, float]]]:
+    """
+    Huge circle as a polygon clipped to the bounds, with segments short enough
+    to stay within half a pixel of the arc. None if nothing is visible.
+    """
+    cx, cy = center
+    # closest point of the bounds to the centre; the circle misses them if far
+    nx = min(max(cx, bounds.left), bounds.right)
+    ny = min(max(cy, bounds.top), bounds.bottom)
+    if math.hypot(nx - cx, ny - cy) > radius:
+        return None
+    corners = (bounds.topleft, bounds.topright, bounds.bottomright, bounds.bottomleft)
+    if all(math.hypot(x - cx, y - cy) <= radius for x, y in corners):
+        # the screen lies inside the circle
+        return [tuple(map(float, corner)) for corner in corners]
+    step = 2 * math.acos(max(-1.0, 1 - 0.5 / radius))
+    count = max(8, math.ceil(2 * math.pi / step))
+    points = [
+        (
+            cx + radius * math.cos(2 * math.pi * i / count),
+            cy + radius * math.sin(2 * math.pi * i / count),
+        )
+        for i in range(count)
+    ]
+    clipped = clip_polygon(points, bounds)
+    return clipped if len(clipped) >= 3 else None
@@ -1,10 +1,12 @@
 import math
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame  # type: ignore
 import pygame.gfxdraw
 from obj.camera import Camera
 from obj.drawn.empty import Empty
+from obj.drawn.lod import draw_circle_outline, render_quality
+from obj.drawn.spritecache import SPRITE_PADDING, sprite_cache
 
 
 class PointParticle(Empty):
@@ -28,23 +30,37 @@ class PointParticle(Empty):
         self.is_visible: bool = True
 
     def draw(self) -> None:
-        if not self.update():
+        if not self.refresh():
             return
-        pygame.gfxdraw.filled_circle(
-            self.surface,
-            int(self.screen_center.x),
-            int(self.screen_center.y),
-            int(self.radius),
-            self.color,
-        )
+        x, y = int(self.screen_center.x), int(self.screen_center.y)
+        if render_quality.sprites:
+            # every particle has the same size, so one sprite per color
+            center = int(self.radius) + SPRITE_PADDING
+            side = 2 * center + 1
+            sprite = sprite_cache.get(
+                (
+                    "point_particle",
+                    tuple(map(int, self.color)),
+                    render_quality.antialias,
+                ),
+                (side, side),
+                lambda sprite: self._raster(sprite, center, center),
+            )
+            sprite_cache.queue(sprite, (x - center, y - center))
+            return
+        sprite_cache.flush(self.surface)
+        self._raster(self.surface, x, y)
+
+    def _raster(self, surface: pygame.Surface, x: int, y: int) -> None:
+        pygame.gfxdraw.filled_circle(surface, x, y, int(self.radius), self.color)
+        draw_circle_outline(surface, x, y, int(self.radius), self.border_color)
 
-        pygame.gfxdraw.aacircle(
-            self.surface,
-            int(self.screen_center.x),
-            int(self.screen_center.y),
-            int(self.radius),
-            self.border_color,
-        )
+    def screen_rect(self) -> Optional[pygame.Rect]:
+        if not self.is_visible:
+            return None
+        r = int(self.radius) + 1
+        x, y = int(self.screen_center.x), int(self.screen_center.y)
+        return pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1)
 
     def move(self, vec: pygame.Vector2) -> None:
         """Move the rectangle by dx, dy in world coordinates."""
@@ -1,10 +1,25 @@
 import math
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame
 import pygame.gfxdraw
 from obj.camera import Camera
+from obj.dirtyrenderer import points_rect
 from obj.drawn.empty import Empty
+from obj.drawn.lod import (
+    clip_polygon,
+    draw_outline,
+    needs_clipping,
+    pixel_batch,
+    render_quality,
+    screen_bounds,
+)
+from obj.drawn.spritecache import (
+    ANGLE_STEP,
+    SPRITE_PADDING,
+    angle_bucket,
+    sprite_cache,
+)
 
 
 class Rectangle(Empty):
@@ -43,6 +58,10 @@ class Rectangle(Empty):
         self.border_width = 4
         self.is_visible: bool = True
         self.points_screen: list[tuple[float, float]] = []  # rotated points on screen
+        self.screen_center = pygame.Vector2(0, 0)
+        self.screen_size: tuple[float, float] = (0.0, 0.0)
+        # larger side on screen in pixels, picks the level of detail
+        self.screen_extent: float = 0.0
 
     # ------------------------------------------------------
     def rotate_point(
@@ -79,6 +98,9 @@ class Rectangle(Empty):
         screen_center = self.cam.world_to_screen(world_pos_px)
         screen_size = world_size_px * self.cam.zoom
         w, h = screen_size.x, screen_size.y
+        self.screen_center = screen_center
+        self.screen_size = (abs(w), abs(h))
+        self.screen_extent = max(abs(w), abs(h))
 
         # --- base corners (centered rectangle before rotation) ---
         half_w, half_h = w / 2, h / 2
@@ -119,12 +141,69 @@ class Rectangle(Empty):
     # ------------------------------------------------------
     def draw(self) -> None:
         """Draw the rectangle if visible."""
-        if not self.update():
+        if not self.refresh():
             return
+        if self.screen_extent < render_quality.pixel_size:
+            pixel_batch.add(self.screen_center, self.color)
+            return
+        outline = self.screen_extent >= render_quality.outline_size
+        if self._draw_sprite(outline):
+            return
+
+        sprite_cache.flush(self.surface)
+        points = self.points_screen
+        bounds = screen_bounds(self.surface)
+        if needs_clipping(points, bounds):
+            points = clip_polygon(points, bounds)
+            if len(points) < 3:
+                return
+        self._raster(self.surface, points, outline)
+
+    def _raster(self, surface: pygame.Surface, points: list, outline: bool) -> None:
+        pygame.gfxdraw.filled_polygon(surface, points, self.color)
+        if outline:
+            draw_outline(surface, points, self.color)
+            draw_outline(surface, points, self.border_color)
+
+    def _draw_sprite(self, outline: bool) -> bool:
+        """Queues a shared sprite of the rectangle; False if it is drawn directly."""
+        if not render_quality.sprites or self.screen_extent > sprite_cache.max_size:
+            return False
+        w, h = round(self.screen_size[0]), round(self.screen_size[1])
+        bucket = angle_bucket(self.angle)
+        side = math.ceil(math.hypot(w, h)) + 2 * SPRITE_PADDING
+        key = (
+            "rectangle",
+            w,
+            h,
+            tuple(map(int, self.color)),
+            bucket,
+            outline,
+            render_quality.antialias,
+        )
+
+        def raster(sprite: pygame.Surface) -> None:
+            center = pygame.Vector2(side / 2, side / 2)
+            corners = [
+                center + (-w / 2, -h / 2),
+                center + (w / 2, -h / 2),
+                center + (w / 2, h / 2),
+                center + (-w / 2, h / 2),
+            ]
+            angle = bucket * ANGLE_STEP
+            points = [self.rotate_point(p, center, angle) for p in corners]
+            self._raster(sprite, points, outline)
+
+        sprite = sprite_cache.get(key, (side, side), raster)
+        sprite_cache.queue(
+            sprite, (self.screen_center.x - side / 2, self.screen_center.y - side / 2)
+        )
+        return True
 
-        pygame.gfxdraw.filled_polygon(self.surface, self.points_screen, self.color)
-        pygame.gfxdraw.aapolygon(self.surface, self.points_screen, self.color)
-        pygame.gfxdraw.aapolygon(self.surface, self.points_screen, self.border_color)
+    def screen_rect(self) -> Optional[pygame.Rect]:
+        if not self.is_visible:
+            return None
+        return points_rect(self.points_screen)
 
     # ------------------------------------------------------
     def move(self, vec: pygame.Vector2) -> None:
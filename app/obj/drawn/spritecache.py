@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Sequence
+
+import numpy as np
+import pygame  # type: ignore
+
+# rotation buckets of cached sprites, in degrees
+ANGLE_STEP = 2.0
+# space around the geometry for anti-aliased edges
+SPRITE_PADDING = 2
+
+
+def angle_bucket(angle_deg: float) -> int:
+    return int(round((angle_deg % 360) / ANGLE_STEP)) % int(round(360 / ANGLE_STEP))
+
+
+class SpriteCache:
+    """
+    Flyweight store of pre-rasterized shapes. Shapes that look the same on
+    screen (shape, size in pixels, color, rotation bucket) share one sprite,
+    and all queued sprites are drawn with a single Surface.blits call.
+    Everything is dropped when the zoom changes, as pixel sizes do.
+    """
+
+    def __init__(self, max_size: int = 64, max_entries: int = 1024) -> None:
+        # larger shapes are rasterized directly
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self._sprites: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self._zoom: Optional[float] = None
+        self._queue: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        # builds during the current zoom, for tuning max_entries
+        self.misses: int = 0
+
+    def begin_frame(self, zoom: float) -> None:
+        if zoom != self._zoom:
+            self._sprites.clear()
+            self._zoom = zoom
+            self.misses = 0
+
+    def get(
+        self,
+        key: Hashable,
+        size: tuple[int, int],
+        raster: Callable[[pygame.Surface], None],
+    ) -> pygame.Surface:
+        """Returns the sprite for `key`, calling `raster` on a new one if needed."""
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+        sprite = _rasterize(size, raster)
+        self._sprites[key] = sprite
+        self.misses += 1
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def queue(self, sprite: pygame.Surface, position: Sequence[float]) -> None:
+        self._queue.append((sprite, (round(position[0]), round(position[1]))))
+
+    def flush(self, surface: pygame.Surface) -> None:
+        """Draws the queued sprites; called before anything drawn directly."""
+        if self._queue:
+            surface.blits(self._queue, doreturn=False)
+            self._queue = []
+
+
+sprite_cache = SpriteCache()
+
+
+def _rasterize(
+    size: tuple[int, int], raster: Callable[[pygame.Surface], None]
+) -> pygame.Surface:
+    """
+    Draws `raster` over black and over white and recovers color and coverage
+    from the two. gfxdraw blends correctly only onto opaque pixels, so this
+    gives sprites that look the same as shapes drawn directly.
+    """
+    black = pygame.Surface(size)
+    black.fill((0, 0, 0))
+    raster(black)
+    white = pygame.Surface(size)
+    white.fill((255, 255, 255))
+    raster(white)
+    on_black = pygame.surfarray.array3d(black).astype(np.float32)
+    on_white = pygame.surfarray.array3d(white).astype(np.float32)
+    alpha = np.clip(255.0 - (on_white - on_black).mean(axis=2), 0.0, 255.0)
+    color = on_black * (255.0 / np.maximum(alpha, 1.0))[:, :, None]
+
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(sprite)[:] = np.clip(color + 0.5, 0, 255).astype(np.uint8)
+    pygame.surfarray.pixels_alpha(sprite)[:] = (alpha + 0.5).astype(np.uint8)
+    return sprite
@@ -1,10 +1,25 @@
 import math
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame  # type: ignore
 import pygame.gfxdraw
 from obj.camera import Camera
+from obj.dirtyrenderer import points_rect
 from obj.drawn.empty import Empty
+from obj.drawn.lod import (
+    clip_polygon,
+    draw_outline,
+    needs_clipping,
+    pixel_batch,
+    render_quality,
+    screen_bounds,
+)
+from obj.drawn.spritecache import (
+    ANGLE_STEP,
+    SPRITE_PADDING,
+    angle_bucket,
+    sprite_cache,
+)
 
 
 class Triangle(Empty):
@@ -38,21 +53,81 @@ class Triangle(Empty):
         self.border_color: pygame.Vector3 = pygame.Vector3(color / 2)
         self.border_width: int = 2
         self.screen_points: list[pygame.Vector2] = []
+        # screen position of `position`, the origin of the vertices
+        self.screen_origin = pygame.Vector2(0, 0)
+        # larger side of the screen bounding box in pixels, picks the level of detail
+        self.screen_extent: float = 0.0
         self.is_visible: bool = True
 
     # ------------------------------------------------------------
     def draw(self) -> None:
-        if not self.update():
+        if not self.refresh():
+            return
+        if self.screen_extent < render_quality.pixel_size:
+            pixel_batch.add(self.screen_points[0], self.color)
+            return
+        outline = self.screen_extent >= render_quality.outline_size
+        if self._draw_sprite(outline):
             return
 
-        points_int = [(int(p.x), int(p.y)) for p in self.screen_points]
+        sprite_cache.flush(self.surface)
+        points = self.screen_points
+        bounds = screen_bounds(self.surface)
+        if needs_clipping(points, bounds):
+            points = clip_polygon(points, bounds)
+            if len(points) < 3:
+                return
+        self._raster(self.surface, points, outline)
+
+    def _raster(self, surface: pygame.Surface, points: list, outline: bool) -> None:
+        points_int = [(int(x), int(y)) for x, y in points]
 
         # Fill (antialiased polygon)
-        pygame.gfxdraw.filled_polygon(self.surface, points_int, self.color)
-        pygame.gfxdraw.aapolygon(self.surface, points_int, self.color)
+        pygame.gfxdraw.filled_polygon(surface, points_int, self.color)
+        if not outline:
+            return
+        draw_outline(surface, points_int, self.color)
 
         # Outline (border)
-        pygame.gfxdraw.aapolygon(self.surface, points_int, self.border_color)
+        draw_outline(surface, points_int, self.border_color)
+
+    def _draw_sprite(self, outline: bool) -> bool:
+        """Queues a shared sprite of the triangle; False if it is drawn directly."""
+        if not render_quality.sprites or self.screen_extent > sprite_cache.max_size:
+            return False
+        scale = self.base_cell_size_world * self.cam.zoom
+        local = tuple((round(v.x * scale), round(v.y * scale)) for v in self.vertices)
+        bucket = angle_bucket(self.angle)
+        key = (
+            "triangle",
+            local,
+            tuple(map(int, self.color)),
+            bucket,
+            outline,
+            render_quality.antialias,
+        )
+
+        angle = bucket * ANGLE_STEP
+        rotated = [self._rotate_vertex(pygame.Vector2(v), angle) for v in local]
+        min_x = min(p.x for p in rotated) - SPRITE_PADDING
+        min_y = min(p.y for p in rotated) - SPRITE_PADDING
+        width = math.ceil(max(p.x for p in rotated) - min_x) + SPRITE_PADDING + 1
+        height = math.ceil(max(p.y for p in rotated) - min_y) + SPRITE_PADDING + 1
+
+        def raster(sprite: pygame.Surface) -> None:
+            points = [(p.x - min_x, p.y - min_y) for p in rotated]
+            self._raster(sprite, points, outline)
+
+        sprite = sprite_cache.get(key, (width, height), raster)
+        sprite_cache.queue(
+            sprite, (self.screen_origin.x + min_x, self.screen_origin.y + min_y)
+        )
+        return True
+
+    def screen_rect(self) -> Optional[pygame.Rect]:
+        if not self.is_visible:
+            return None
+        return points_rect(self.screen_points)
 
     # ------------------------------------------------------------
     def move(self, vec: pygame.Vector2) -> None:
@@ -83,6 +158,9 @@ class Triangle(Empty):
         Returns False if the triangle is fully outside the screen.
         """
         self.screen_points = []
+        self.screen_origin = self.cam.world_to_screen(
+            self.position * self.base_cell_size_world
+        )
 
         for v in self.vertices:
             # Rotate local vertex
@@ -100,6 +178,7 @@ class Triangle(Empty):
         ys = [p.y for p in self.screen_points]
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
+        self.screen_extent = max(max_x - min_x, max_y - min_y)
 
         screen_w, screen_h = self.surface.get_size()
         visible = max_x >= 0 and min_x <= screen_w and max_y >= 0 and min_y <= screen_h
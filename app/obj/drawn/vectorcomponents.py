@@ -1,7 +1,10 @@
+from typing import Optional
+
 import pygame
 from Box2D import b2Vec2
 from obj.camera import Camera
-from obj.drawn.visualvector import VisualVector
+from obj.dirtyrenderer import union_rect
+from obj.drawn.visualvector import ScaleFactor, VisualVector
 
 
 class VectorComponents:
@@ -12,39 +15,55 @@ class VectorComponents:
         color: pygame.Color,
         camera: Camera,
         base_cell_size,
+        surface: Optional[pygame.Surface] = None,
     ) -> None:
         self.components_color = color
         self.vector: VisualVector = VisualVector(
-            att_point, value, color, camera, base_cell_size
+            att_point, value, color, camera, base_cell_size, surface
         )
         self.vec_x: VisualVector = VisualVector(
-            att_point, b2Vec2(value.x, 0), self.components_color, camera, base_cell_size
+            att_point,
+            b2Vec2(value.x, 0),
+            self.components_color,
+            camera,
+            base_cell_size,
+            surface,
         )
         self.vec_y: VisualVector = VisualVector(
-            att_point, b2Vec2(0, value.y), self.components_color, camera, base_cell_size
+            att_point,
+            b2Vec2(0, value.y),
+            self.components_color,
+            camera,
+            base_cell_size,
+            surface,
         )
 
-    def draw(self) -> None:
+    def draw(self) -> Optional[pygame.Rect]:
         if not self.vector.visible:
-            return
-        if self.vector.value == b2Vec2(0, 0):
-            return
-        self.vector.draw()
-        if self.show_comp:
-            self.vec_x.draw()
-            self.vec_y.draw()
+            return None
+        value = self.vector.value
+        if value.x == 0 and value.y == 0:
+            return None
+        drawn = self.vector.draw()
+        if self.vec_x.visible and self.vec_y.visible:
+            drawn = union_rect(drawn, self.vec_x.draw())
+            drawn = union_rect(drawn, self.vec_y.draw())
+        return drawn
 
     def set_value(self, val: b2Vec2) -> None:
-        self.vector.set_value(val)
-        self.vec_x.set_value(b2Vec2(val.x, 0))
-        self.vec_y.set_value(b2Vec2(0, val.y))
+        self.set_xy(val.x, val.y)
+
+    def set_xy(self, x: float, y: float) -> None:
+        """Updates the vector and its components in place."""
+        self.vector.value.Set(x, y)
+        self.vec_x.value.Set(x, 0.0)
+        self.vec_y.value.Set(0.0, y)
 
     def update(self, att_p: b2Vec2, val: b2Vec2) -> None:
         self.set_value(val)
         self.vector.attachment_point = att_p
         self.vec_x.attachment_point = att_p
         self.vec_y.attachment_point = att_p
-        self.show_comp = self.vec_x.visible and self.vec_y.visible
 
     def show_vector(self):
         self.vector.visible = True
@@ -72,5 +91,8 @@ class VectorComponents:
         self.vec_x.scale_factor = factor
         self.vec_y.scale_factor = factor
 
+    def share_scale(self, scale: ScaleFactor) -> None:
+        self.vector.scale = self.vec_x.scale = self.vec_y.scale = scale
+
     def set_unit(self, unit: str):
         self.vector.unit = self.vec_x.unit = self.vec_y.unit = unit
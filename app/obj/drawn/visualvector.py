@@ -1,8 +1,33 @@
 import math
+from typing import Optional
 
 import pygame
 from Box2D import b2Vec2
 from obj.camera import Camera
+from obj.drawn.lod import render_quality
+
+_label_font: Optional[pygame.font.Font] = None
+# bumped whenever a vector is shown or hidden, see VectorScale
+_visibility_version: int = 0
+
+
+def label_font() -> pygame.font.Font:
+    """Returns the font shared by all vector labels, loading it on first use."""
+    global _label_font
+    if _label_font is None:
+        _label_font = pygame.font.SysFont("consolas", 14)
+    return _label_font
+
+
+def visibility_version() -> int:
+    return _visibility_version
+
+
+class ScaleFactor:
+    """Length scale that a group of vectors shares, so it is set once for all."""
+
+    def __init__(self, value: float = 1.0) -> None:
+        self.value = value
 
 
 class VisualVector:
@@ -13,29 +38,49 @@ class VisualVector:
         color: pygame.Color,
         camera: Camera,
         base_cell_size: int,
+        surface: Optional[pygame.Surface] = None,
     ) -> None:
-        self.screen = pygame.display.get_surface()
+        self.screen = surface or pygame.display.get_surface()
+        # may be shared with other vectors of the object, which move it in place
         self.attachment_point = att_point
-        self.value = value
+        # owned by the vector and only ever updated in place
+        self.value = b2Vec2(value)
         self.color = color
         self.camera = camera
         self.base_cell_size = base_cell_size
-        self.visible: bool = False
+        self._visible: bool = False
         self.line_thikness: int = 3
 
-        self.scale_factor: float = 1.0
+        self.scale: ScaleFactor = ScaleFactor()
         self.label: str = ""
         self.unit: str = "Unit"
 
-        # <-- ADDED: preloaded font
-        self.font = pygame.font.SysFont("consolas", 14)
+    @property
+    def scale_factor(self) -> float:
+        return self.scale.value
+
+    @scale_factor.setter
+    def scale_factor(self, value: float) -> None:
+        self.scale.value = value
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        global _visibility_version
+        if value != self._visible:
+            self._visible = value
+            _visibility_version += 1
 
     def set_value(self, val: b2Vec2) -> None:
-        self.value = val
+        self.value.Set(val.x, val.y)
 
-    def draw(self) -> None:
+    def draw(self) -> Optional[pygame.Rect]:
+        """Draws the arrow and its label; returns the screen area it covered."""
         if not self.visible:
-            return
+            return None
 
         start_world = pygame.Vector2(self.attachment_point.x, self.attachment_point.y)
         start_screen = (
@@ -58,9 +103,9 @@ class VisualVector:
             or not math.isfinite(end_screen.y)
         ):
             print("INVALID VECTOR:", start_screen, scaled_value, end_screen, self.value)
-            return
+            return None
 
-        pygame.draw.line(
+        drawn = pygame.draw.line(
             self.screen,
             self.color,
             (int(start_screen.x), int(start_screen.y)),
@@ -79,27 +124,32 @@ class VisualVector:
             left_head = end_screen - direction * head_length + perp * head_width
             right_head = end_screen - direction * head_length - perp * head_width
 
-            pygame.draw.polygon(
-                self.screen,
-                self.color,
-                [
-                    (int(end_screen.x), int(end_screen.y)),
-                    (int(left_head.x), int(left_head.y)),
-                    (int(right_head.x), int(right_head.y)),
-                ],
+            drawn.union_ip(
+                pygame.draw.polygon(
+                    self.screen,
+                    self.color,
+                    [
+                        (int(end_screen.x), int(end_screen.y)),
+                        (int(left_head.x), int(left_head.y)),
+                        (int(right_head.x), int(right_head.y)),
+                    ],
+                )
             )
+            if not render_quality.vector_labels:
+                return drawn
             self._prep_label()
             if self.label:
-                text_surface = self.font.render(self.label, True, self.color)
+                text_surface = label_font().render(self.label, True, self.color)
                 offset = pygame.Vector2(10, -10)
                 label_pos = end_screen + offset
                 bg = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
                 bg.fill((255, 255, 255, 120))  # półprzezroczyste tło
                 self.screen.blit(bg, label_pos)
-                self.screen.blit(text_surface, label_pos)
+                drawn.union_ip(self.screen.blit(text_surface, label_pos))
+        return drawn
 
     def update(self, att_point: b2Vec2, value: b2Vec2) -> None:
-        self.value = value
+        self.value.Set(value.x, value.y)
         self.attachment_point = att_point
 
     def _prep_label(self):
@@ -3,13 +3,17 @@ from typing import Any
 from Box2D import b2Vec2
 from obj.impulsecollector import ImpulseCollector
 
+# bumped whenever an applied force is set, see ActiveSets
+_applied_force_version: int = 0
+
+
+def applied_force_version() -> int:
+    return _applied_force_version
+
 
 class ForceManager:
-    def __init__(
-        self, body: Any, impulse_collector: ImpulseCollector, dt: float = 1 / 200
-    ):
+    def __init__(self, body: Any, impulse_collector: ImpulseCollector):
         self.body = body
-        self.dt = dt
         self.prev_velocity = body.linearVelocity
 
         self.collector = impulse_collector
@@ -20,18 +24,43 @@ class ForceManager:
         self.total_force = b2Vec2(0, 0)
         self.net_force = b2Vec2(0, 0)
 
+    @property
+    def applied_force(self) -> b2Vec2:
+        return self._applied_force
+
+    @applied_force.setter
+    def applied_force(self, value: b2Vec2) -> None:
+        global _applied_force_version
+        self._applied_force = value
+        _applied_force_version += 1
+
+    def has_applied_force(self) -> bool:
+        force = self._applied_force
+        return force.x != 0 or force.y != 0
+
     def update(self):
-        dt = self.dt
+        """
+        Recomputes gravity and total force. Runs every frame for objects with
+        shown vectors, so the vectors are updated in place and sums are kept
+        in floats instead of allocating b2Vec2 temporaries.
+        """
         g = self.body.world.gravity
-        self.gravity_force = g * self.body.mass
-
-        contact_list = self.collector.impulses.pop(self.body, [])
-        F_contact = sum(contact_list, b2Vec2(0, 0)) * (1.0 / dt)
+        mass = self.body.mass
+        gx, gy = g.x * mass, g.y * mass
+        self.gravity_force.Set(gx, gy)
 
-        continuous_force = self.applied_force + self.gravity_force
+        fx = fy = 0.0
+        for impulse in self.collector.impulses.get(self.body.userData, ()):
+            fx += impulse.x
+            fy += impulse.y
+        # the impulses add up over the whole last frame, not one solver step
+        inv_dt = 1.0 / self.collector.duration
 
-        tf = continuous_force + F_contact
-        self.total_force = b2Vec2(round(tf.x, 3), round(tf.y, 3))
+        applied = self.applied_force
+        self.total_force.Set(
+            round(applied.x + gx + fx * inv_dt, 3),
+            round(applied.y + gy + fy * inv_dt, 3),
+        )
 
     def apply_force(self):
         if self.applied_force != (0, 0) and self.body.awake:
@@ -31,10 +31,10 @@ class Grid:
         self.color = color
         self.camera = camera
         self.visible = True
+        # thin lines between the main ones; dropped on slow frames
+        self.show_helpers = True
         self.base_cell_size = cell_size
-        self.surface = pygame.Surface(
-            pygame.display.get_desktop_sizes()[0], pygame.SRCALPHA
-        )
+        self.surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
 
     def draw(self):
         if not self.visible or self.camera is None:
@@ -60,7 +60,7 @@ class Grid:
         first_y_idx = math.floor((-oy) / step_px) - 1
         last_y_idx = math.ceil((height - oy) / step_px) + 1
 
-        if helper_px is not None and helper_px >= 2:
+        if self.show_helpers and helper_px is not None and helper_px >= 2:
             # rysuj pionowe helpery
             for i in range(first_x_idx * helper_count, last_x_idx * helper_count):
                 x = ox + (i / helper_count) * step_px
@@ -33,6 +33,7 @@ class PopInfo:
         self.camera = camera
         self.objectsmanager = objectsmanager
         self.selected_obj: Optional[RealObject] = None
+        self.shown: bool = False
 
         self.hide()
 
@@ -43,17 +44,21 @@ class PopInfo:
         body = rlobj.physics.body
         if not body:
             return 'No physics body'
-        pos = body.position
+        state = rlobj.state()
+        pos = Vector2(state.x, state.y)
 
-        lv = vector_to_scalar(body.linearVelocity)
+        lv = math.hypot(state.vx, state.vy)
         lv = lv if lv != 0.00 else 0.00
 
-        av = body.fixtures[0].body.angularVelocity
+        av = state.angular_velocity
         av = av if av != 0.00 else 0.00
 
-        acc = (
-            vector_to_scalar(rlobj.vector_manager.forcemanager.total_force) / body.mass
-        )
+        fm = rlobj.forcemanager
+        if fm is None:
+            return 'No force data'
+        if not rlobj.needs_forces():
+            fm.update()
+        acc = vector_to_scalar(fm.total_force) / body.mass
         acc = acc if acc != 0.00 else 0.00
 
         ek = 0.5 * body.mass * lv * lv
@@ -86,10 +91,12 @@ class PopInfo:
         if not body:
             self.hide()
             return
-        world_pos = Vector2(body.position.x, body.position.y)
+        state = self.selected_obj.state()
+        world_pos = Vector2(state.x, state.y)
 
         screen_pos = self.camera.world_to_screen(world_pos * self.cell_size)
-        self.pos = screen_pos
+        # the box is part of the GUI, which is drawn at window resolution
+        self.pos = self.camera.to_window(screen_pos)
 
     def update(self, rlobj: Optional[RealObject]):
         """Wywoływane, gdy użytkownik wybiera obiekt."""
@@ -111,20 +118,33 @@ class PopInfo:
         self.time_left -= 1
         if len(self.objectsmanager.objects) > 0:
             if not self.selected_obj in self.objectsmanager.objects:
-                self.selected_obj = self.objectsmanager.objects[-1]
+                self.selected_obj = self.objectsmanager.objects.last()
                 self.time_left = self.cooldown
 
         self._position()
+        self.shown = True
 
         if self.selected_obj:
-            self.tp_text.set_text(self._text_gen(self.selected_obj))
+            # re-rendering the text can wait a few frames
+            self.objectsmanager.tasks.schedule(
+                "pop info text", self._refresh_text, priority=2, deadline=10
+            )
 
         final = self.pos + self.offset
         self.box.set_topleft(final.x, final.y)
 
+    def _refresh_text(self) -> None:
+        if self.shown and self.selected_obj:
+            self.tp_text.set_text(self._text_gen(self.selected_obj))
+
+    def is_active(self) -> bool:
+        """True while the box is shown and its values keep changing."""
+        return self.shown
+
     def get(self):
         return self.box
 
     def hide(self):
         x, y = pygame.display.get_window_size()
         self.box.set_topleft(x, y)
+        self.shown = False
@@ -0,0 +1,201 @@
+from typing import Callable, Optional
+
+import pygame
+import thorpy as tp
+from obj.savemanager import FileJob, SaveManager
+from obj.sceneindex import THUMBNAIL_BACKGROUND, THUMBNAIL_SIZE, SceneIndex
+
+# saved scenes listed on one page of the browser
+ROWS_PER_PAGE = 6
+
+
+class SceneBrowser:
+    """
+    Window listing the scenes in the save directory, drawn with the rest of
+    the GUI so the simulation keeps running while it is open. Scenes are
+    listed from SceneIndex, with a thumbnail and a summary each. Files are
+    read and written by SaveManager in the background; the browser shows the
+    progress of the current job.
+    """
+
+    def __init__(
+        self,
+        save_manager: SaveManager,
+        index: SceneIndex,
+        get_scene: Callable[[], Optional[dict]],
+        apply_scene: Callable[[dict], None],
+    ) -> None:
+        self.save_manager = save_manager
+        self.index = index
+        self.get_scene = get_scene
+        self.apply_scene = apply_scene
+        self.screen: pygame.Surface = pygame.display.get_surface()
+        self.visible: bool = False
+        self.scenes: list[str] = []
+        self.page: int = 0
+        # set when the file list has to be read again
+        self._stale: bool = True
+        # status text and progress of the last finished job
+        self._outcome: tuple[str, float] = ("", 0.0)
+
+        self.name_input = tp.TextInput("autosave.json", placeholder="file name")
+        self._blank = pygame.Surface(THUMBNAIL_SIZE)
+        self._blank.fill(THUMBNAIL_BACKGROUND)
+        self.rows: list[tp.Group] = []
+        self.row_texts: list[tp.Group] = []
+        self.row_images: list[tp.Image] = []
+        self.row_names: list[tp.Button] = []
+        self.row_infos: list[tp.Text] = []
+        for i in range(ROWS_PER_PAGE):
+            image = tp.Image(self._blank)
+            name = tp.Button("")
+            name.default_at_unclick = lambda i=i: self._select(i)
+            info = tp.Text("", font_size=11)
+            self.row_images.append(image)
+            self.row_names.append(name)
+            self.row_infos.append(info)
+            texts = tp.Group([name, info], "v", gap=2, align="left")
+            self.row_texts.append(texts)
+            self.rows.append(tp.Group([image, texts], "h"))
+        self.row_list = tp.Group(self.rows, "v", gap=4, align="left")
+        self.page_text = tp.Text("1/1", font_size=12)
+        btn_prev = tp.Button("<")
+        btn_prev.default_at_unclick = lambda: self._turn_page(-1)
+        btn_next = tp.Button(">")
+        btn_next.default_at_unclick = lambda: self._turn_page(1)
+
+        btn_save = tp.Button("Save")
+        btn_save.default_at_unclick = self._save
+        btn_load = tp.Button("Load")
+        btn_load.default_at_unclick = self._load
+        btn_close = tp.Button("Close")
+        btn_close.default_at_unclick = self.hide
+
+        self.status = tp.Text("", font_size=12)
+        self.progress = tp.Lifebar("", 240, initial_value=0.0)
+
+        self.box = tp.Box(
+            [
+                tp.Text("Scenes", font_size=14),
+                self.row_list,
+                tp.Group([btn_prev, self.page_text, btn_next], "h"),
+                tp.Group([tp.Text("File:", font_size=12), self.name_input], "h"),
+                tp.Group([btn_save, btn_load, btn_close], "h"),
+                self.status,
+                self.progress,
+            ]
+        )
+        self.box.set_bck_color((0, 0, 0))
+        self.hide()
+        # the index is usually current before the browser is first opened
+        self.index.refresh()
+
+    def get(self) -> tp.Box:
+        return self.box
+
+    def show(self) -> None:
+        self.visible = True
+        self._stale = True
+        self.index.refresh()
+        self.tick()
+        self.box.center_on(self.screen)
+
+    def hide(self) -> None:
+        x, y = pygame.display.get_window_size()
+        self.box.set_topleft(x, y)
+        self.visible = False
+
+    def is_animating(self) -> bool:
+        """True while a file is read or written, so its progress is redrawn."""
+        return self.save_manager.busy() or (self.visible and self.index.busy())
+
+    def takes_keys(self) -> bool:
+        """True while keys go to the browser, e.g. to edit the file name."""
+        return self.visible or self.name_input.focused
+
+    def tick(self) -> None:
+        """Called every frame: finishes jobs and refreshes the file list."""
+        self.save_manager.poll()
+        if self.index.poll():
+            self._stale = True
+        job = self.save_manager.job or (self.index.job if self.visible else None)
+        if job is not None:
+            self._set_status(f"{job.description}...", job.progress)
+        else:
+            self._set_status(*self._outcome)
+        if self.visible and self._stale:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        self._stale = False
+        self.scenes = self.index.scenes()
+        pages = max(1, -(-len(self.scenes) // ROWS_PER_PAGE))
+        self.page = min(self.page, pages - 1)
+        first = self.page * ROWS_PER_PAGE
+        for i, row in enumerate(self.rows):
+            if first + i < len(self.scenes):
+                scene = self.scenes[first + i]
+                # hidden elements only resize at their next draw
+                row.set_invisible(False, recursive=True)
+                image = self.row_images[i]
+                image.img = self.index.thumbnail(scene) or self._blank
+                image.generate_surfaces()
+                self.row_names[i].set_text(scene)
+                self.row_infos[i].set_text(self.index.describe(scene))
+            else:
+                row.set_invisible(True, recursive=True)
+        self.page_text.set_text(f"{self.page + 1}/{pages}")
+        # new texts change the widths, so the layout is redone inside out
+        for texts, row in zip(self.row_texts, self.rows):
+            texts.sort_children("v", gap=2, align="left")
+            row.sort_children("h")
+        self.row_list.sort_children("v", gap=4, align="left")
+        self.box.sort_children()
+        if self.visible:
+            self.box.center_on(self.screen)
+
+    def _turn_page(self, step: int) -> None:
+        self.page = max(0, self.page + step)
+        self._stale = True
+
+    def _select(self, row: int) -> None:
+        i = self.page * ROWS_PER_PAGE + row
+        if i < len(self.scenes):
+            self.name_input.value = self.scenes[i]
+
+    def _set_status(self, text: str, progress: float) -> None:
+        self.status.set_text(text)
+        if progress != self.progress.get_value():
+            self.progress.set_value(progress)
+
+    def _save(self) -> None:
+        # the scene is copied only if the save can start
+        if not self.save_manager.busy():
+            self.save_manager.save_to_json(
+                self.get_scene(), self.name_input.get_value(), on_done=self._saved
+            )
+
+    def _load(self) -> None:
+        self.save_manager.load_from_json(
+            self.name_input.get_value(), on_done=self._loaded
+        )
+
+    def _saved(self, job: FileJob) -> None:
+        if job.error:
+            self._outcome = (f"Could not save: {job.error}", 0.0)
+            return
+        self._outcome = (f"Saved {job.file_name}", 1.0)
+        self.index.refresh()
+
+    def _loaded(self, job: FileJob) -> None:
+        if job.error:
+            self._outcome = (f"Could not load: {job.error}", 0.0)
+            return
+        try:
+            self.apply_scene(job.result)
+        except Exception as e:
+            # a file that parses but is not a scene must not stop the app
+            self._outcome = (f"Could not load: {type(e).__name__}: {e}", 0.0)
+            return
+        self._outcome = (f"Loaded {job.file_name}", 1.0)
+        self.hide()
@@ -35,6 +35,8 @@ class PointParticleSideBar:
         self.width: int = 365
         self.height: int = 165
         self.offset: int = self.width
+        # True while the last update() still moved the bar
+        self.sliding: bool = False
 
         # --- Thorpy Elements ---
         ico_path = "app/assets/icons/x-square.svg"
@@ -246,12 +248,18 @@ class PointParticleSideBar:
         self.visible = False
         self.reset_inputs()
 
+    def is_animating(self) -> bool:
+        """True while the bar is sliding in or out."""
+        return self.sliding
+
     def update(self) -> None:
         target_offset = 0 if self.visible else self.screen.get_width()
+        previous_offset = self.offset
         if abs(self.offset - target_offset) > 1:
             self.offset += int((target_offset - self.offset) / self.speed)
         else:
             self.offset = target_offset
+        self.sliding = self.offset != previous_offset
         x = self.screen.get_width() - self.width + int(self.offset)
         self.box.set_topleft(x, self.top_margin)
 
@@ -274,21 +282,26 @@ class PointParticleSideBar:
         )
         self.start_velocity_y.value = str(vy)
 
-        if rlobjct.trajectory and rlobjct.vector_manager:
-            self.show_trajectory.value = rlobjct.trajectory.visible
-            lv = rlobjct.vector_manager.lineral_velocity
+        # the overlays are built when first shown; asking for them here must
+        # not build them
+        trajectory = rlobjct.get_trajectory(create=False)
+        self.show_trajectory.value = trajectory is not None and trajectory.visible
+        vectors = rlobjct.get_vector_manager(create=False)
+        if vectors is not None:
+            lv = vectors.lineral_velocity
             self.show_lineral_velocity.value = lv.vector.visible
             self.show_lineral_v_comp.value = lv.vec_x.visible
-            self.show_gravity_force.value = (
-                rlobjct.vector_manager.gravity_force.vector.visible
-            )
-            self.show_applied_force.value = (
-                rlobjct.vector_manager.applied_force.vector.visible
-            )
-            self.show_resultant_force.value = (
-                rlobjct.vector_manager.total_force.vector.visible
-            )
-            af = rlobjct.vector_manager.forcemanager.applied_force
+            self.show_gravity_force.value = vectors.gravity_force.vector.visible
+            self.show_applied_force.value = vectors.applied_force.vector.visible
+            self.show_resultant_force.value = vectors.total_force.vector.visible
+        else:
+            self.show_lineral_velocity.value = False
+            self.show_lineral_v_comp.value = False
+            self.show_gravity_force.value = False
+            self.show_applied_force.value = False
+            self.show_resultant_force.value = False
+        if rlobjct.forcemanager is not None:
+            af = rlobjct.forcemanager.applied_force
             self.applied_force_x.value = str(round(af.x, 3))
             afy = -1 * round(af.y, 3) if round(af.y, 3) != 0 else 00.000
             self.applied_force_y.value = str(afy)
@@ -352,20 +365,30 @@ class PointParticleSideBar:
         if self.show_trajectory.value:
             if new_obj.trajectory:
                 new_obj.trajectory.visible = True
-        if new_obj.vector_manager:
+        checkboxes = [
+            self.show_lineral_velocity,
+            self.show_lineral_v_comp,
+            self.show_applied_force,
+            self.show_gravity_force,
+            self.show_resultant_force,
+        ]
+        # vector visuals are only built when one of them is shown
+        vm = new_obj.vector_manager if any(c.value for c in checkboxes) else None
+        if vm:
             if self.show_lineral_velocity.value:
-                new_obj.vector_manager.lineral_velocity.show_vector()
+                vm.lineral_velocity.show_vector()
             if self.show_lineral_v_comp.value:
-                new_obj.vector_manager.lineral_velocity.show_components()
+                vm.lineral_velocity.show_components()
             if self.show_applied_force.value:
-                new_obj.vector_manager.applied_force.show_vector()
+                vm.applied_force.show_vector()
             if self.show_gravity_force.value:
-                new_obj.vector_manager.gravity_force.show_vector()
+                vm.gravity_force.show_vector()
             if self.show_resultant_force.value:
-                new_obj.vector_manager.total_force.show_vector()
+                vm.total_force.show_vector()
+        if new_obj.forcemanager:
             x = safe_float(self.applied_force_x.value)
             y = -1 * safe_float(self.applied_force_y.value)
-            new_obj.vector_manager.forcemanager.applied_force = b2Vec2(x, y)
+            new_obj.forcemanager.applied_force = b2Vec2(x, y)
 
         return new_obj
 
@@ -373,12 +396,7 @@ class PointParticleSideBar:
         if self.obj:
             new_obj = self.apply_to_real_obj(self.obj)
             if new_obj:
-                for i, old_obj in enumerate(self.objectmanager.objects):
-                    if old_obj == self.obj:
-                        self.objectmanager.objects[i].destroy()
-                        self.objectmanager.objects.pop(i)
-                        self.objectmanager.objects.append(new_obj)
-                        break
+                self.objectmanager.replace_object(self.obj, new_obj)
         self.hide()
 
     def reset_inputs(self) -> None:
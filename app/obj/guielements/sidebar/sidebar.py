@@ -105,6 +105,8 @@ class SideBar:
         self.width: int = 300
         self.height: int = 165
         self.offset: int = self.width
+        # True while the last update() still moved the bar
+        self.sliding: bool = False
         # --- Size Bars ---
         self.size_rectangle = SideSize("rectangle")
         self.size_triangle = SideSize("triangle")
@@ -234,12 +236,18 @@ class SideBar:
         self.selectortype.hide()
         self.featurespanel.hide()
 
+    def is_animating(self) -> bool:
+        """True while the bar is sliding in or out."""
+        return self.sliding
+
     def update(self) -> None:
         target_offset = 0 if self.visible else self.screen.get_width()
+        previous_offset = self.offset
         if abs(self.offset - target_offset) > 1:
             self.offset += int((target_offset - self.offset) / self.speed)
         else:
             self.offset = target_offset
+        self.sliding = self.offset != previous_offset
         x = self.screen.get_width() - self.width + int(self.offset)
         self.box.set_topleft(x, self.top_margin)
 
@@ -294,23 +302,29 @@ class SideBar:
             self.featurespanel.set_data_from_obj(
                 body, self.obj.start_linearVelocity, self.obj.start_angularVelocity
             )
-            if rlobjct.trajectory and rlobjct.vector_manager:
-                self.featurespanel.show_trajectory.value = rlobjct.trajectory.visible
-                lv = rlobjct.vector_manager.lineral_velocity
-                self.featurespanel.show_lineral_velocity.value = lv.vector.visible
-                self.featurespanel.show_lineral_v_comp.value = lv.vec_x.visible
-                self.featurespanel.show_gravity_force.value = (
-                    rlobjct.vector_manager.gravity_force.vector.visible
-                )
-                self.featurespanel.show_applied_force.value = (
-                    rlobjct.vector_manager.applied_force.vector.visible
-                )
-                self.featurespanel.show_resultant_force.value = (
-                    rlobjct.vector_manager.total_force.vector.visible
-                )
-                af = rlobjct.vector_manager.forcemanager.applied_force
-                self.featurespanel.applied_force_x.value = str(round(af.x, 3))
-                self.featurespanel.applied_force_y.value = str(round(-1 * af.y, 3))
+            # the overlays are built when first shown; asking for them here
+            # must not build them
+            panel = self.featurespanel
+            trajectory = rlobjct.get_trajectory(create=False)
+            panel.show_trajectory.value = trajectory is not None and trajectory.visible
+            vectors = rlobjct.get_vector_manager(create=False)
+            if vectors is not None:
+                lv = vectors.lineral_velocity
+                panel.show_lineral_velocity.value = lv.vector.visible
+                panel.show_lineral_v_comp.value = lv.vec_x.visible
+                panel.show_gravity_force.value = vectors.gravity_force.vector.visible
+                panel.show_applied_force.value = vectors.applied_force.vector.visible
+                panel.show_resultant_force.value = vectors.total_force.vector.visible
+            else:
+                panel.show_lineral_velocity.value = False
+                panel.show_lineral_v_comp.value = False
+                panel.show_gravity_force.value = False
+                panel.show_applied_force.value = False
+                panel.show_resultant_force.value = False
+            if rlobjct.forcemanager is not None:
+                af = rlobjct.forcemanager.applied_force
+                panel.applied_force_x.value = str(round(af.x, 3))
+                panel.applied_force_y.value = str(round(-1 * af.y, 3))
 
     def reset_width(self) -> None:
         panels: list[PanelType] = [
@@ -467,20 +481,30 @@ class SideBar:
             if self.featurespanel.show_trajectory.value:
                 if new_obj.trajectory:
                     new_obj.trajectory.visible = True
-            if new_obj.vector_manager:
+            checkboxes = [
+                self.featurespanel.show_lineral_velocity,
+                self.featurespanel.show_lineral_v_comp,
+                self.featurespanel.show_applied_force,
+                self.featurespanel.show_gravity_force,
+                self.featurespanel.show_resultant_force,
+            ]
+            # vector visuals are only built when one of them is shown
+            vm = new_obj.vector_manager if any(c.value for c in checkboxes) else None
+            if vm:
                 if self.featurespanel.show_lineral_velocity.value:
-                    new_obj.vector_manager.lineral_velocity.show_vector()
+                    vm.lineral_velocity.show_vector()
                 if self.featurespanel.show_lineral_v_comp.value:
-                    new_obj.vector_manager.lineral_velocity.show_components()
+                    vm.lineral_velocity.show_components()
                 if self.featurespanel.show_applied_force.value:
-                    new_obj.vector_manager.applied_force.show_vector()
+                    vm.applied_force.show_vector()
                 if self.featurespanel.show_gravity_force.value:
-                    new_obj.vector_manager.gravity_force.show_vector()
+                    vm.gravity_force.show_vector()
                 if self.featurespanel.show_resultant_force.value:
-                    new_obj.vector_manager.total_force.show_vector()
+                    vm.total_force.show_vector()
+            if new_obj.forcemanager:
                 x = safe_float(self.featurespanel.applied_force_x.value)
                 y = -1 * safe_float(self.featurespanel.applied_force_y.value)
-                new_obj.vector_manager.forcemanager.applied_force = b2Vec2(x, y)
+                new_obj.forcemanager.applied_force = b2Vec2(x, y)
 
         return new_obj
 
@@ -488,10 +512,5 @@ class SideBar:
         if self.obj:
             new_obj = self.apply_to_real_obj(self.obj)
             if new_obj:
-                for i, old_obj in enumerate(self.objectmanager.objects):
-                    if old_obj == self.obj:
-                        self.objectmanager.objects[i].destroy()
-                        self.objectmanager.objects.pop(i)
-                        self.objectmanager.objects.append(new_obj)
-                        break
+                self.objectmanager.replace_object(self.obj, new_obj)
         self.hide()
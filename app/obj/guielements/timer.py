@@ -29,7 +29,7 @@ class Timer:
         return self.timer
 
     def update(self):
-        total_ms = self.objectsmanager.time
+        total_ms = int(round(self.objectsmanager.display_time * 1000))
 
         ms = total_ms % 1000
         sec = (total_ms // 1000) % 60
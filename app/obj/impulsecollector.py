@@ -5,8 +5,15 @@ class ImpulseCollector(b2ContactListener):
     def __init__(self):
         super().__init__()
         self.impulses = {}
+        # simulated seconds the collected impulses span, see start_frame
+        self.duration = 1 / 200
         self.collision_detected = False
 
+    def start_frame(self, duration):
+        """Drops the impulses of the last frame before one `duration` long."""
+        self.impulses.clear()
+        self.duration = duration
+
     def PostSolve(self, contact, impulse):
         bodyA = contact.fixtureA.body
         bodyB = contact.fixtureB.body
@@ -14,14 +21,19 @@ class ImpulseCollector(b2ContactListener):
         Jn = sum(impulse.normalImpulses)
         Jt = sum(impulse.tangentImpulses)
 
-        normal = contact.worldManifold.normal
-        tangent = b2Vec2(-normal.y, normal.x)
+        # the manifold is a temporary; its normal is only valid while it lives
+        manifold = contact.worldManifold
+        normal = b2Vec2(manifold.normal)
+        # the normal points from A to B and the tangent is cross(normal, 1),
+        # as in Box2D's solver: the impulse pushes B along them, A the other way
+        tangent = b2Vec2(normal.y, -normal.x)
 
-        FA = normal * Jn + tangent * Jt
-        FB = -FA
+        FB = normal * Jn + tangent * Jt
+        FA = -FB
 
-        self.impulses.setdefault(bodyA, []).append(FA)
-        self.impulses.setdefault(bodyB, []).append(FB)
+        # keyed by the object id ObjectRegistry stores in body.userData
+        self.impulses.setdefault(bodyA.userData, []).append(FA)
+        self.impulses.setdefault(bodyB.userData, []).append(FB)
 
     def BeginContact(self, contact):
         self.collision_detected = True
@@ -0,0 +1,122 @@
+from typing import Any, Iterable, Iterator, Optional
+
+from obj.body_area import body_area
+from obj.realobject import RealObject
+
+
+class ObjectRegistry:
+    """
+    Keeps scene objects in draw order and indexes them by a stable integer id.
+    The id is also stored as the Box2D body's userData, so an object can be
+    found from its body without a search.
+    """
+
+    def __init__(self) -> None:
+        self._objects: dict[int, RealObject] = {}
+        self._areas: dict[int, float] = {}
+        self._next_id: int = 1
+        # bumped on every change of membership
+        self.version: int = 0
+        # bumped when static geometry may have changed, see touch_static
+        self.static_version: int = 0
+
+    # -------------------------------------------------------
+    def __iter__(self) -> Iterator[RealObject]:
+        return iter(self._objects.values())
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj: Any) -> bool:
+        obj_id = getattr(obj, "id", None)
+        return obj_id is not None and self._objects.get(obj_id) is obj
+
+    # -------------------------------------------------------
+    def add(self, obj: RealObject, area: Optional[float] = None) -> int:
+        """Registers an object at the end of the draw order and returns its id."""
+        obj_id = self._next_id
+        self._next_id += 1
+        self._attach(obj_id, obj, area)
+        self.version += 1
+        if obj.obj_type == "static":
+            self.static_version += 1
+        return obj_id
+
+    def extend(self, objs: list[RealObject]) -> None:
+        for obj in objs:
+            self.add(obj)
+
+    def remove(self, obj: RealObject) -> Optional[RealObject]:
+        """Unregisters an object. The caller is responsible for its body."""
+        if obj not in self:
+            return None
+        assert obj.id is not None
+        del self._objects[obj.id]
+        del self._areas[obj.id]
+        self.version += 1
+        if obj.obj_type == "static":
+            self.static_version += 1
+        return obj
+
+    def replace(self, old: RealObject, new: RealObject) -> bool:
+        """
+        Puts `new` in place of `old`, keeping the id and the draw order.
+        Returns False if `old` is not registered.
+        """
+        if old not in self:
+            return False
+        assert old.id is not None
+        self._attach(old.id, new, None)
+        old.id = None
+        self.version += 1
+        if old.obj_type == "static" or new.obj_type == "static":
+            self.static_version += 1
+        return True
+
+    def clear(self) -> None:
+        self._objects.clear()
+        self._areas.clear()
+        self.version += 1
+        self.static_version += 1
+
+    def touch_static(self) -> None:
+        """Records that a static object was moved or edited in place."""
+        self.static_version += 1
+
+    # -------------------------------------------------------
+    def get(self, obj_id: Optional[int]) -> Optional[RealObject]:
+        if obj_id is None:
+            return None
+        return self._objects.get(obj_id)
+
+    def from_body(self, body: Any) -> Optional[RealObject]:
+        if body is None:
+            return None
+        return self._objects.get(body.userData)
+
+    def in_order(self, ids: Iterable[int]) -> list[RealObject]:
+        """
+        Registered objects among `ids`, in draw order. Ids are handed out in
+        increasing order and replace() keeps both id and position, so draw
+        order is id order.
+        """
+        objects = self._objects
+        return [objects[i] for i in sorted(ids) if i in objects]
+
+    def last(self) -> Optional[RealObject]:
+        return next(reversed(self._objects.values()), None)
+
+    def area(self, obj: RealObject) -> float:
+        """Cached area of the object's body (bodies never change shape in place)."""
+        if obj.id is None:
+            return body_area(obj.physics.body)
+        return self._areas.get(obj.id, 0.0)
+
+    # -------------------------------------------------------
+    def _attach(self, obj_id: int, obj: RealObject, area: Optional[float]) -> None:
+        body = obj.physics.body
+        obj.id = obj_id
+        if body is not None:
+            body.userData = obj_id
+        self._objects[obj_id] = obj
+        self._areas[obj_id] = area if area is not None else body_area(body)
@@ -1,16 +1,72 @@
 import math
-from typing import Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pygame
-from Box2D import b2CircleShape, b2PolygonShape, b2Vec2, b2World
-from obj.body_area import body_area
+from Box2D import (
+    b2AABB,
+    b2CircleShape,
+    b2PolygonShape,
+    b2QueryCallback,
+    b2Vec2,
+    b2World,
+)
+from obj.activesets import ActiveSets
+from obj.analyticmotion import AnalyticMotion, is_contact_free
+from obj.body_area import body_area, body_min_extent, shape_area
+from obj.bodylifecycle import BodyLifecycle
+from obj.bodystate import VX, VY, BodyState, BodyStateMirror, lerp_angle
 from obj.camera import Camera
+from obj.drawn.lod import pixel_batch
+from obj.drawn.spritecache import sprite_cache
 from obj.guielements.stoper import Stoper
 from obj.impulsecollector import ImpulseCollector
+from obj.objectregistry import ObjectRegistry
 from obj.physicobject import Features
+from obj.physicsworker import (
+    ANGLE,
+    RUNNING,
+    STOPER_REACHED,
+    PhysicsWorker,
+    describe_body,
+)
+from obj.solversettings import SolverSettings, quality_preset
+from obj.taskqueue import TaskQueue
+from obj.vectorscale import VectorScale
 
 from .realobject import RealObject
 
+# tolerance of the float clock, far below the smallest stoper unit (10 ms)
+TIME_EPSILON = 1e-9
+
+# screen margin of the culling query: fixed-size visuals (point particles are
+# 10 px wide at any zoom), anti-aliasing and interpolation reach past bodies
+CULL_MARGIN_PX = 24
+
+# rendered frames per second the simulation speed is set for: each of them
+# advances the scene by frame_time
+FRAME_RATE_HZ = 100
+# a stalled frame catches up at most this many frames, so slow frames do not
+# pile up ever more physics work
+MAX_CATCHUP_FRAMES = 5
+
+
+class _VisibleIds(b2QueryCallback):
+    """Collects the object ids of fixtures reported by world.QueryAABB."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ids: set[int] = set()
+
+    def ReportFixture(self, fixture) -> bool:
+        # baked static fixtures carry their object's id themselves
+        obj_id = fixture.userData
+        if obj_id is None:
+            obj_id = fixture.body.userData
+        if obj_id is not None:
+            self.ids.add(obj_id)
+        return True
+
 
 class ObjectsManager:
     def __init__(
@@ -24,13 +80,41 @@ class ObjectsManager:
         self.surface: pygame.Surface = surface
         self.camera: Camera = camera
         self.cell_size: int = cell_size
-        self.objects: list[RealObject] = []
+        self.objects: ObjectRegistry = ObjectRegistry()
+        # dynamic, forced and overlay-showing objects, kept up to date on edit
+        self.active: ActiveSets = ActiveSets(self.objects)
+        self.body_states: BodyStateMirror = BodyStateMirror()
         self.is_simulation_running: bool = False
         self.stop_simulation_at_collision: bool = False
-        self.time_step: float = 1 / 200
-        self.velocity_iterations: int = 10
-        self.position_iterations: int = 5
-        self.time: int = 0
+        self.solver: SolverSettings = SolverSettings()
+        # preset used for scenes saved without solver settings
+        self.default_quality: str = "normal"
+        # simulated seconds advanced per rendered frame at FRAME_RATE_HZ, split
+        # into solver steps
+        self.frame_time: float = 1 / 200
+        # physics advances once every `physics_frames` rendered frames, by
+        # physics_frames * frame_time; with `interpolate` the frames in between
+        # show a blend of the last two physics states
+        self.physics_frames: int = 1
+        self.interpolate: bool = False
+        self._accumulator: float = 0.0
+        # False until the first frame after play, whose elapsed time includes
+        # the wait before it
+        self._frame_clock_running: bool = False
+        # simulation clock in seconds
+        self.time: float = 0.0
+        self._last_frame_dt: float = 0.0
+        # sub-steps used for the last frame, as chosen by _substeps
+        self.last_substeps: int = 0
+        self._min_extent: float = math.inf
+        self._min_extent_version: int = -1
+        self._solid_rows: list[int] = []
+        self.lifecycle: BodyLifecycle = BodyLifecycle()
+        # optional: step the world in a separate process while playing
+        self.use_physics_worker: bool = False
+        self._worker: Optional[PhysicsWorker] = None
+        self._worker_objects: list[RealObject] = []
+        self._worker_key: Optional[tuple] = None
         self.selected_obj: Optional[RealObject] = None
         self.selected_obj_is_being_dragged: bool = False
         self.stoper: Optional[Stoper] = None
@@ -39,6 +123,18 @@ class ObjectsManager:
         self.world.contactListener = self.collector
         self.skip_force: bool = True
         self._time_ms_carry: int = 0
+        # closed-form motions of contact-free bodies, keyed by object id
+        self._analytic: dict[int, AnalyticMotion] = {}
+        self._analytic_key: Optional[tuple] = None
+        self._all_analytic: bool = False
+        # all static shapes merged into one body while simulating, see bake_statics
+        self._baked_body: Optional[Any] = None
+        self._baked_version: int = -1
+        # ids drawn in the last pass, to hide objects that leave the view
+        self._drawn_ids: dict[bool, set[int]] = {True: set(), False: set()}
+        # derived data refreshed in the background, see schedule_tasks
+        self.tasks: TaskQueue = TaskQueue()
+        self.vector_scale: VectorScale = VectorScale()
 
     def add_object(
         self,
@@ -49,7 +145,7 @@ class ObjectsManager:
         angle: float,
         color: pygame.Vector3,
         features: Optional[Features] = None,
-    ) -> None:
+    ) -> Optional[RealObject]:
         new_object = RealObject(
             world=self.world,
             surface=self.surface,
@@ -64,84 +160,685 @@ class ObjectsManager:
             impulse_collector=self.collector,
             features=features,
         )
-        if body_area(new_object.physics.body) > 4e-6:
-            self.objects.append(new_object)
+        area = body_area(new_object.physics.body)
+        if area > 4e-6:
+            self.objects.add(new_object, area)
+            return new_object
+        new_object.destroy()
+        return None
+
+    def add_objects(
+        self,
+        obj_types: Sequence[str],
+        shape_types: Sequence[str],
+        sizes: Sequence[Union[Tuple[float, float], float, List[Tuple[float, float]]]],
+        positions: Sequence[Tuple[float, float]],
+        angles: Sequence[float],
+        colors: Sequence[pygame.Vector3],
+        features: Optional[Sequence[Optional[Features]]] = None,
+    ) -> list[RealObject]:
+        """
+        Creates many objects at once. All arguments are parallel sequences,
+        one entry per object. Dust is rejected from the requested size before
+        any Box2D body is created. Returns the objects that were added.
+        """
+        count = len(shape_types)
+        columns = [obj_types, sizes, positions, angles, colors]
+        if features is not None:
+            columns.append(features)
+        if any(len(column) != count for column in columns):
+            raise ValueError("add_objects expects sequences of equal length.")
+
+        world = self.world
+        surface = self.surface
+        camera = self.camera
+        cell_size = self.cell_size
+        collector = self.collector
+        added: list[RealObject] = []
+        for i in range(count):
+            shape_type = shape_types[i]
+            size = sizes[i]
+            area = shape_area(shape_type, size)
+            if area <= 4e-6:
+                continue
+            x, y = positions[i]
+            new_object = RealObject(
+                world=world,
+                surface=surface,
+                camera=camera,
+                obj_type=obj_types[i],
+                shape_type=shape_type,
+                size=size,
+                position=(float(x), float(y)),
+                angle=float(angles[i]),
+                color=colors[i],
+                cell_size=cell_size,
+                impulse_collector=collector,
+                features=features[i] if features is not None else None,
+            )
+            self.objects.add(new_object, area)
+            added.append(new_object)
+        return added
+
+    def remove_object(self, obj: RealObject) -> None:
+        """Removes an object from the scene and destroys its body."""
+        if self.objects.remove(obj) is None:
+            return
+        obj.destroy()
+        if self.selected_obj is obj:
+            self.selected_obj = None
+
+    def replace_object(self, old: RealObject, new: RealObject) -> None:
+        """Swaps an edited object in, keeping the id and draw order of the old one."""
+        if not self.objects.replace(old, new):
+            self.objects.add(new)
+        old.destroy()
 
-    def step_simulation(self) -> None:
+    def clear_objects(self) -> None:
+        self._stop_worker()
+        self.unbake_statics()
+        for obj in self.objects:
+            obj.destroy()
+        self.objects.clear()
+        self.selected_obj = None
+        self.tasks.clear()
+
+    def set_solver_settings(self, settings: SolverSettings) -> None:
+        self.solver = settings
+        self.world.warmStarting = settings.warm_starting
+        self.world.continuousPhysics = settings.continuous_physics
+
+    def set_lifecycle(self, lifecycle: BodyLifecycle) -> None:
+        self.lifecycle = lifecycle
+        self.world.allowSleeping = lifecycle.allow_sleeping
+
+    def set_quality(self, name: str, default: bool = False) -> None:
+        """
+        Switches to one of the QUALITY_PRESETS (draft / normal / precise);
+        with `default` it is also used for scenes loaded without settings.
+        """
+        self.set_solver_settings(quality_preset(name))
+        if default:
+            self.default_quality = name
+
+    def step_simulation(self, elapsed: Optional[float] = None) -> None:
+        """
+        Advances the scene by the rendered frames that fit in `elapsed`
+        wall-clock seconds, or by one frame when it is None.
+        """
+        if (
+            self.use_physics_worker
+            and self._worker is None
+            and self.is_simulation_running
+            and not self.selected_obj_is_being_dragged
+        ):
+            self._start_worker()
+        if self._worker is not None:
+            self._step_from_worker()
+            return
+
+        if not self.is_simulation_running:
+            self.body_states.alpha = 1.0
+            self._step_physics_frame()
+            return
+        for _ in range(self._physics_frames_due(elapsed)):
+            self._step_physics_frame()
+            if not self.is_simulation_running:
+                break
+
+    def _step_physics_frame(self) -> None:
+        step_time = self.physics_frame_time
 
         if self.stoper and self.stoper.value != 0:
-            next_time = self.time + 5
-            if next_time > self.stoper.value:
-                remaining_ms = self.stoper.value - self.time
-                final_dt = remaining_ms / 1000.0
-
-                if final_dt > 0:
-                    self._apply_forces()
-
-                    self.world.Step(
-                        final_dt,
-                        self.velocity_iterations,
-                        self.position_iterations,
-                    )
+            stoper_time = self.stoper.value / 1000.0
+            next_time = self.time + step_time
+            if next_time > stoper_time + TIME_EPSILON:
+                self.body_states.alpha = 1.0
+                final_dt = stoper_time - self.time
+
+                if final_dt > TIME_EPSILON:
+                    if self.is_simulation_running:
+                        self._begin_frame(final_dt)
+                        self._advance_frame(final_dt)
+                    else:
+                        self._apply_forces()
+                        self.world.Step(
+                            final_dt,
+                            self.solver.velocity_iterations,
+                            self.solver.position_iterations,
+                        )
+                        self.body_states.capture(self.objects)
 
-                if self.is_simulation_running and self.time < self.stoper.value:
-                    self.time = self.stoper.value
+                if self.is_simulation_running and self.time < stoper_time:
+                    self.time = stoper_time
                 self.is_simulation_running = False
                 if self.un_play:
                     self.un_play()
                 return
 
         if self.is_simulation_running:
-            for obj in self.objects:
-                obj.save_state_before_step()
-            self._apply_forces()
-            self.world.Step(
-                self.time_step,
-                self.velocity_iterations,
-                self.position_iterations,
-            )
-            self.time += 5
+            self._begin_frame(step_time)
+            self._advance_frame(step_time)
+            self._update_lifecycle(step_time)
 
         if self.collector.collision_detected and self.stop_simulation_at_collision:
             self.is_simulation_running = False
             self.collector.collision_detected = False
             if self.un_play:
                 self.un_play()
-            for obj in self.objects:
+            self.body_states.mark_dirty()
+            for obj in self.active.dynamic:
                 obj.restore_state()
                 obj.sync()
             self.skip_force = True
-            self.time -= 5
+            self.time = max(0.0, self.time - self._last_frame_dt)
+            self._invalidate_analytic()
             return
 
         self.collector.collision_detected = False
 
+    def _begin_frame(self, duration: float) -> None:
+        """
+        Prepares a stepped frame: a fresh impulse collection, the states a
+        collision rolls back to and the states interpolation blends from.
+        """
+        self.collector.start_frame(duration)
+        for obj in self.active.dynamic:
+            obj.save_state_before_step()
+        self.body_states.keep_previous()
+
+    @property
+    def physics_frame_time(self) -> float:
+        """Simulated seconds advanced by one physics frame."""
+        return self.frame_time * max(1, self.physics_frames)
+
+    @property
+    def display_time(self) -> float:
+        """Clock of the rendered state, which lags physics when interpolating."""
+        states = self.body_states
+        if not self.is_simulation_running or states.previous is None:
+            return self.time
+        return max(0.0, self.time - (1.0 - states.alpha) * self._last_frame_dt)
+
+    def _physics_frames_due(self, elapsed: Optional[float]) -> int:
+        """
+        Adds the rendered frames in `elapsed` seconds (one when None) to the
+        accumulator. Returns how many physics frames have to be stepped and
+        sets the blend factor for rendering.
+        """
+        if elapsed is None or not self._frame_clock_running:
+            frames = 1.0
+            self._frame_clock_running = True
+        else:
+            frames = min(elapsed * FRAME_RATE_HZ, MAX_CATCHUP_FRAMES)
+        step_time = self.physics_frame_time
+        self._accumulator += self.frame_time * frames
+        due = int((self._accumulator + TIME_EPSILON) // step_time)
+        self._accumulator = max(0.0, self._accumulator - due * step_time)
+        self.body_states.alpha = (
+            min(1.0, self._accumulator / step_time) if self.interpolate else 1.0
+        )
+        return due
+
+    def seek(self, t: float) -> None:
+        """
+        Moves the scene to `t` seconds counted from the start. Scenes made only
+        of contact-free bodies are evaluated in closed form; anything else is
+        reset and stepped forward.
+        """
+        t = max(0.0, float(t))
+        self.body_states.mark_dirty()
+        self._analytic_motions(self.time)
+        # a withheld force (see skip_force) is only honoured by stepping
+        if (
+            self._all_analytic
+            and not self.stop_simulation_at_collision
+            and not self.skip_force
+        ):
+            for obj_id, motion in self._analytic.items():
+                obj = self.objects.get(obj_id)
+                if obj is not None:
+                    motion.apply(obj.physics.body, t)
+            self.time = t
+            self.body_states.capture(self.objects)
+            return
+        if t < self.time:
+            self.reset_simulation()
+        while t - self.time > TIME_EPSILON:
+            duration = min(self.frame_time, t - self.time)
+            self.collector.start_frame(duration)
+            for obj in self.active.dynamic:
+                obj.save_state_before_step()
+            self._advance_frame(duration)
+            if self.collector.collision_detected and self.stop_simulation_at_collision:
+                break
+
+    def _advance_frame(self, duration: float) -> None:
+        """Advances the clock by `duration` seconds in steps of at most solver.dt."""
+        self.bake_statics()
+        steps = self._substeps(duration)
+        self.last_substeps = steps
+        dt = duration / steps
+        start = self.time
+        for i in range(1, steps + 1):
+            self._advance(dt, start + dt * i)
+        self.time = start + duration
+        self._last_frame_dt = duration
+
+    # -------------------------------------------------------
+    def bake_statics(self) -> None:
+        """
+        Merges the static objects into a single static body with one fixture
+        per shape and takes their own bodies out of the broadphase. The baked
+        body is kept until a static object changes (objects.static_version)
+        or the simulation is paused. Each baked fixture's userData is the id
+        of the object it comes from.
+        """
+        version = self.objects.static_version
+        if version == self._baked_version:
+            return
+        self.unbake_statics()
+        self._baked_version = version
+        statics = [
+            obj
+            for obj in self.objects
+            if obj.obj_type == "static" and obj.physics.body is not None
+        ]
+        if len(statics) < 2:
+            return
+        baked = self.world.CreateStaticBody()
+        for obj in statics:
+            body = obj.physics.body
+            for fixture in body.fixtures:
+                shape = fixture.shape
+                if isinstance(shape, b2CircleShape):
+                    world_shape = b2CircleShape(
+                        radius=shape.radius, pos=body.GetWorldPoint(shape.pos)
+                    )
+                else:
+                    world_shape = b2PolygonShape(
+                        vertices=[body.GetWorldPoint(v) for v in shape.vertices]
+                    )
+                    world_shape.radius = shape.radius
+                baked.CreateFixture(
+                    shape=world_shape,
+                    density=fixture.density,
+                    friction=fixture.friction,
+                    restitution=fixture.restitution,
+                    isSensor=fixture.sensor,
+                    userData=obj.id,
+                )
+            body.active = False
+        self._baked_body = baked
+
+    def unbake_statics(self) -> None:
+        """Gives the static objects their own bodies back."""
+        self._baked_version = -1
+        if self._baked_body is None:
+            return
+        self.world.DestroyBody(self._baked_body)
+        self._baked_body = None
+        for obj in self.objects:
+            if obj.obj_type == "static" and obj.physics.body is not None:
+                obj.physics.body.active = True
+
+    # -------------------------------------------------------
+    def _worker_scene_key(self) -> tuple:
+        gravity = self.world.gravity
+        return (self.objects.version, gravity.x, gravity.y)
+
+    def _start_worker(self) -> None:
+        """Hands the current state of the scene over to a PhysicsWorker."""
+        # the worker builds its own world from the individual bodies
+        self.unbake_statics()
+        objects = [obj for obj in self.objects if obj.physics.body is not None]
+        bodies = []
+        for obj in objects:
+            fm = obj.forcemanager
+            force = (fm.applied_force.x, fm.applied_force.y) if fm else (0.0, 0.0)
+            bodies.append(describe_body(obj.physics.body, force))
+        stoper_value = self.stoper.value if self.stoper else 0
+        solver = self.solver
+        scene = {
+            "bodies": bodies,
+            "gravity": (self.world.gravity.x, self.world.gravity.y),
+            "dt": solver.dt,
+            "velocity_iterations": solver.velocity_iterations,
+            "position_iterations": solver.position_iterations,
+            "warm_starting": solver.warm_starting,
+            "continuous_physics": solver.continuous_physics,
+            "frame_time": self.frame_time,
+            "time": self.time,
+            "stoper": stoper_value / 1000.0 if stoper_value else None,
+            "stop_at_collision": self.stop_simulation_at_collision,
+        }
+        self._worker = PhysicsWorker(scene)
+        self._worker_objects = objects
+        self._worker_key = self._worker_scene_key()
+
+    def _stop_worker(self) -> None:
+        """Takes the newest state back from the worker and shuts it down."""
+        worker = self._worker
+        if worker is None:
+            return
+        self._worker = None
+        worker.poll()
+        worker.close()
+        if worker.current is not None:
+            self._apply_worker_states(worker.current)
+            self.time = worker.current_time
+        self._worker_objects = []
+        self._invalidate_analytic()
+
+    def _step_from_worker(self) -> None:
+        worker = self._worker
+        assert worker is not None
+        if self._worker_key != self._worker_scene_key():
+            # the scene was edited while playing: restart from its new state
+            self._stop_worker()
+            self._start_worker()
+            return
+        worker.poll()
+        status = worker.status
+        if status != RUNNING:
+            self._stop_worker()
+            if status == STOPER_REACHED and self.stoper:
+                self.time = self.stoper.value / 1000.0
+            self.is_simulation_running = False
+            if self.un_play:
+                self.un_play()
+            return
+        if worker.current is None or worker.previous is None:
+            return
+        alpha = worker.alpha()
+        blended = worker.previous + (worker.current - worker.previous) * alpha
+        blended[:, ANGLE] = lerp_angle(
+            worker.previous[:, ANGLE], worker.current[:, ANGLE], alpha
+        )
+        self._apply_worker_states(blended)
+        self.time = (
+            worker.previous_time + (worker.current_time - worker.previous_time) * alpha
+        )
+
+    def _apply_worker_states(self, states: np.ndarray) -> None:
+        for obj, (x, y, angle, vx, vy, av) in zip(self._worker_objects, states):
+            if obj.obj_type == "static" or obj.physics.body is None:
+                continue
+            body = obj.physics.body
+            body.transform = ((x, y), angle)
+            body.linearVelocity = (vx, vy)
+            body.angularVelocity = av
+        self.body_states.capture(self.objects)
+
+    def _update_lifecycle(self, dt: float) -> None:
+        """Applies the kill plane and the sleep thresholds after a frame."""
+        lifecycle = self.lifecycle
+        states = self.body_states
+        lost = lifecycle.out_of_bounds(self.active.dynamic, states)
+        for obj in lost:
+            if lifecycle.mode == "remove":
+                lifecycle.log(self.time, obj, "removed")
+                self.remove_object(obj)
+            else:
+                obj.deactivate()
+                lifecycle.log(self.time, obj, "deactivated")
+        if lost:
+            self.body_states.mark_dirty()
+            self._invalidate_analytic()
+        for obj in lifecycle.sleepy(self.objects, states, dt):
+            obj.physics.body.awake = False
+            lifecycle.log(self.time, obj, "slept")
+
+    def _substeps(self, duration: float) -> int:
+        """
+        Number of solver steps for `duration` seconds. In adaptive mode more
+        steps are taken while max |v| * dt exceeds cfl * the smallest solid
+        fixture extent, up to solver.max_substeps.
+        """
+        solver = self.solver
+        steps = max(1, math.ceil(duration / solver.dt - TIME_EPSILON))
+        if not solver.adaptive or steps >= solver.max_substeps:
+            return steps
+        states = self.body_states
+        states.refresh(self.objects)
+        extent, rows = self._solid_extent()
+        if not rows or math.isinf(extent):
+            return steps
+        # sensors never tunnel, so only solid bodies count towards max |v|
+        speeds = np.hypot(states.column(VX)[rows], states.column(VY)[rows])
+        needed = math.ceil(float(speeds.max()) * duration / (solver.cfl * extent))
+        return max(steps, min(needed, solver.max_substeps))
+
+    def _solid_extent(self) -> Tuple[float, list[int]]:
+        """Smallest solid fixture extent and the mirror rows of solid dynamic bodies."""
+        if self._min_extent_version != self.objects.version:
+            extent = math.inf
+            rows = []
+            for obj in self.objects:
+                body_extent = body_min_extent(obj.physics.body)
+                extent = min(extent, body_extent)
+                if (
+                    obj.obj_type != "static"
+                    and not math.isinf(body_extent)
+                    and obj.state_mirror is self.body_states
+                ):
+                    rows.append(obj.state_index)
+            self._min_extent = extent
+            self._solid_rows = rows
+            self._min_extent_version = self.objects.version
+        return self._min_extent, self._solid_rows
+
+    def _advance(self, dt: float, t: float) -> None:
+        """
+        One step of `dt` seconds ending at time `t`. Contact-free bodies are
+        placed at their exact position; Box2D is skipped when nothing else
+        moves and collisions do not have to be detected.
+        """
+        if self.skip_force:
+            # the closed-form motions include the applied force, which this
+            # step withholds: Box2D steps every body and the motions are
+            # anchored again at the state it reaches
+            self._apply_forces()
+            self.world.Step(
+                dt, self.solver.velocity_iterations, self.solver.position_iterations
+            )
+            self._invalidate_analytic()
+            self.body_states.capture(self.objects)
+            return
+        motions = self._analytic_motions(t - dt)
+        self._apply_forces()
+        if not self._all_analytic or self.stop_simulation_at_collision:
+            self.world.Step(
+                dt, self.solver.velocity_iterations, self.solver.position_iterations
+            )
+        for obj_id, motion in motions.items():
+            obj = self.objects.get(obj_id)
+            if obj is not None:
+                motion.apply(obj.physics.body, t)
+        self.body_states.capture(self.objects)
+
+    def _analytic_motions(self, t0: float) -> dict[int, AnalyticMotion]:
+        """Anchors the closed-form motions at time `t0` when stale."""
+        gravity = self.world.gravity
+        key = (self.objects.version, gravity.x, gravity.y)
+        if key == self._analytic_key:
+            return self._analytic
+        self._analytic = {}
+        all_analytic = True
+        for obj in self.objects:
+            body = obj.physics.body
+            if body is None or obj.obj_type == "static":
+                continue
+            if not is_contact_free(body) or not body.awake or body.mass <= 0:
+                all_analytic = False
+                continue
+            force = (
+                obj.forcemanager.applied_force
+                if obj.forcemanager is not None
+                else b2Vec2(0, 0)
+            )
+            scale = body.gravityScale
+            acceleration = (
+                gravity.x * scale + force.x / body.mass,
+                gravity.y * scale + force.y / body.mass,
+            )
+            self._analytic[obj.id] = AnalyticMotion(
+                BodyState.read(body), acceleration, t0, body.fixedRotation
+            )
+        self._all_analytic = all_analytic
+        self._analytic_key = key
+        return self._analytic
+
+    def _invalidate_analytic(self) -> None:
+        self._analytic_key = None
+
+    def schedule_tasks(self) -> None:
+        """
+        Queues the per-frame work that may lag a few frames behind: the
+        predicted trajectories.
+        """
+        for obj in self.active.with_trajectories:
+            trajectory = obj.get_trajectory(create=False)
+            if trajectory is not None:
+                self.tasks.schedule(
+                    ("prediction", obj.id),
+                    trajectory.update_prediction,
+                    priority=1,
+                    deadline=3,
+                )
+
     def draw_objects(self) -> None:
+        sprite_cache.begin_frame(self.camera.zoom)
+        self.body_states.refresh(self.objects)
         self._vectors_scale()
-        for obj in self.objects:
+        for obj in self._objects_in_view(static=True):
+            obj.draw()
+        for obj in self._objects_in_view(static=False):
+            obj.draw()
+        self._flush_batches()
+
+    def draw_static_objects(self) -> None:
+        """Draws only static objects, e.g. into a cached background."""
+        sprite_cache.begin_frame(self.camera.zoom)
+        for obj in self._objects_in_view(static=True):
             obj.draw()
+        self._flush_batches()
+
+    def draw_dynamic_objects(self) -> list[Optional[pygame.Rect]]:
+        """Draws non-static objects and returns the screen area of each."""
+        sprite_cache.begin_frame(self.camera.zoom)
+        self.body_states.refresh(self.objects)
+        self._vectors_scale()
+        drawn = [obj.draw() for obj in self._objects_in_view(static=False)]
+        self._flush_batches()
+        return drawn
+
+    def visible_ids(self) -> set[int]:
+        """
+        Ids of objects with a fixture in the camera's view, found through the
+        world's broadphase instead of by transforming every object.
+        """
+        width, height = self.surface.get_size()
+        return self._ids_in_screen_rect(
+            (-CULL_MARGIN_PX, -CULL_MARGIN_PX),
+            (width + CULL_MARGIN_PX, height + CULL_MARGIN_PX),
+        )
+
+    def _ids_in_screen_rect(
+        self, top_left: Tuple[float, float], bottom_right: Tuple[float, float]
+    ) -> set[int]:
+        """Ids of objects with a fixture in the given screen rectangle."""
+        if self._baked_body is not None:
+            # a static moved since the last step would be found at its old
+            # place through the baked fixtures
+            self.bake_statics()
+        lower = self.camera.screen_to_world(top_left) / self.cell_size
+        upper = self.camera.screen_to_world(bottom_right) / self.cell_size
+        aabb = b2AABB(lowerBound=(lower.x, lower.y), upperBound=(upper.x, upper.y))
+        query = _VisibleIds()
+        self.world.QueryAABB(query, aabb)
+        return query.ids
+
+    def _objects_in_view(self, static: bool) -> list[RealObject]:
+        """
+        Static or non-static objects to draw this frame, in draw order. Objects
+        showing a trajectory or vectors are kept, as those reach past the body.
+        """
+        ids = self.visible_ids()
+        if not static:
+            ids.update(obj.id for obj in self.active.with_vectors)
+            ids.update(obj.id for obj in self.active.with_trajectories)
+        result = [
+            obj
+            for obj in self.objects.in_order(ids)
+            if (obj.obj_type == "static") == static
+        ]
+        drawn = {obj.id for obj in result}
+        for obj_id in self._drawn_ids[static] - drawn:
+            obj = self.objects.get(obj_id)
+            if obj is not None:
+                obj.hide()
+        self._drawn_ids[static] = drawn
+        return result
+
+    def _flush_batches(self) -> None:
+        """Draws what shapes queued in the shared sprite and pixel batches."""
+        sprite_cache.flush(self.surface)
+        pixel_batch.flush(self.surface)
 
     def reset_simulation(self) -> None:
+        self._stop_worker()
         self.remove_dust()
+        self.body_states.mark_dirty()
         for obj in self.objects:
             obj.reset()
-        self.time = 0
+        self.objects.touch_static()
+        self.time = 0.0
+        self._accumulator = 0.0
+        self._frame_clock_running = False
+        self.body_states.alpha = 1.0
+        self.lifecycle.restart()
+        self._invalidate_analytic()
 
     def run_simulation(self, run: bool) -> None:
+        self._stop_worker()
         self.remove_dust()
         if run:
-            for obj in self.objects:
-                if obj.physics.body is None:
-                    continue
-                obj.physics.body.awake = True
+            # bodies are woken where they are affected (reset, edit, drag,
+            # gravity change), so resting ones stay asleep across play
+            self.body_states.mark_dirty()
+            self._invalidate_analytic()
+            self._accumulator = 0.0
+            self._frame_clock_running = False
             self.is_simulation_running = True
         else:
             self.is_simulation_running = False
+            # while paused, statics are edited and queried through their own
+            # bodies; the bake is rebuilt on the next step
+            self.unbake_statics()
 
     def select_object_at_position(
         self, position: Tuple[int, int]
     ) -> Optional[RealObject]:
-        for obj in self.objects:
+        # objects drawn in the last frame are tested first, with the screen
+        # geometry they were drawn with
+        drawn = self._drawn_ids[True] | self._drawn_ids[False]
+        for obj in self.objects.in_order(drawn):
+            if obj.is_point_inside(position):
+                self.selected_obj = obj
+                return obj
+        # objects added since the last frame, or missed by its culling, are
+        # found through the broadphase and get their screen geometry first
+        x, y = position
+        near = self._ids_in_screen_rect(
+            (x - CULL_MARGIN_PX, y - CULL_MARGIN_PX),
+            (x + CULL_MARGIN_PX, y + CULL_MARGIN_PX),
+        )
+        for obj in self.objects.in_order(near - drawn):
+            if obj.physics.body is None or obj.out_of_world:
+                continue
+            obj.sync()
+            obj.visual.update()
             if obj.is_point_inside(position):
                 self.selected_obj = obj
                 return obj
@@ -161,39 +858,60 @@ class ObjectsManager:
         if obj.physics is None or obj.physics.body is None:
             print("Selected object has no physics body (deleted?)")
             return
+        # the worker is started again from the new state once dragging ends
+        self._stop_worker()
         obj.start_position = obj.physics.body.position.copy()
+        if obj.obj_type == "static":
+            self.objects.touch_static()
+        self.body_states.mark_dirty()
+        obj.physics.body.awake = True
         obj.move(vec)
         obj.sync()
+        self._invalidate_analytic()
 
     def set_gravity_force(self, val: float = 0.0):
         self.world.gravity = b2Vec2(0.0, val)
+        # gravity vectors of resting bodies must be recomputed
+        for obj in self.objects:
+            obj.invalidate_sync()
+            if obj.obj_type != "static" and not obj.out_of_world:
+                obj.physics.body.awake = True
 
     def remove_dust(self):
-        for i, obj in enumerate(self.objects):
-            if body_area(obj.physics.body) < 4e-6:
-                self.objects[i].destroy()
-                self.objects.pop(i)
+        dust = [obj for obj in self.objects if self.objects.area(obj) < 4e-6]
+        for obj in dust:
+            self.remove_object(obj)
 
     def _apply_forces(self):
         if self.skip_force:
             self.skip_force = False
             return
-        for obj in self.objects:
-            if obj.vector_manager:
-                obj.vector_manager.forcemanager.apply_force()
+        for obj in self.active.forced:
+            # forces of closed-form bodies are already in their acceleration
+            if obj.id not in self._analytic:
+                obj.forcemanager.apply_force()
 
     def transfer_to_json(self) -> dict:
         return {
             "cell_size": self.cell_size,
             "gravity": tuple(self.world.gravity),
             "stoper": self.stoper.value if self.stoper else None,
+            "solver": self.solver.transfer_to_json(),
+            "lifecycle": self.lifecycle.transfer_to_json(),
             "objects": [obj.transfer_to_json() for obj in self.objects],
         }
 
     def load_from_json(self, data: dict) -> None:
-        self.objects.clear()
         if data is None:
+            self.clear_objects()
             return
+        # ustawienia są czytane przed wyczyszczeniem bieżącej sceny
+        # sceny zapisane przed ustawieniami solvera dostają domyślne
+        solver = SolverSettings.from_json(
+            data.get("solver"), default=quality_preset(self.default_quality)
+        )
+        lifecycle = BodyLifecycle.from_json(data.get("lifecycle"))
+        self.clear_objects()
 
         # -----------------------------
         # Wczytaj parametry managera
@@ -203,10 +921,17 @@ class ObjectsManager:
         self.cell_size = int(cell_size) if isinstance(cell_size, (int, float)) else 100
 
         gravity = data.get("gravity")
-        if isinstance(gravity, (list, tuple)) and len(gravity) > 1:
+        if (
+            isinstance(gravity, (list, tuple))
+            and len(gravity) > 1
+            and isinstance(gravity[1], (int, float))
+        ):
             g = gravity[1]
             self.set_gravity_force(round(g, 4))
 
+        self.set_solver_settings(solver)
+        self.set_lifecycle(lifecycle)
+
         stoper_val = data.get("stoper")
         if self.stoper is not None:
             self.stoper.value = int(stoper_val) if isinstance(stoper_val, (int)) else 0
@@ -248,7 +973,7 @@ class ObjectsManager:
                     size = [tuple(pt) for pt in size]
 
             # ---------- TWORZENIE OBIEKTU ----------
-            self.add_object(
+            obj = self.add_object(
                 obj_type=obj_data["obj_type"],
                 shape_type=obj_data["shape_type"],
                 size=size,
@@ -257,12 +982,14 @@ class ObjectsManager:
                 color=color_vec,
                 features=features,
             )
+            if obj is None:
+                continue
 
             # ============================================================
             #  ODTWARZANIE DANYCH FIZYCZNYCH DLA OBIEKTÓW DYNAMICZNYCH
             # ============================================================
             if obj_data["obj_type"] != "static":
-                body = self.objects[-1].physics.body
+                body = obj.physics.body
 
                 # prędkości startowe
                 lin_vel = obj_data.get("linear_velocity")
@@ -281,67 +1008,50 @@ class ObjectsManager:
                     pass
 
                 # siła przyłożona
-                if "applied_force" in obj_data:
+                if "applied_force" in obj_data and obj.forcemanager is not None:
                     fx, fy = obj_data["applied_force"]
-                    self.objects[-1].vector_manager.forcemanager.applied_force = b2Vec2(
-                        fx, fy
-                    )
+                    obj.forcemanager.applied_force = b2Vec2(fx, fy)
 
                 # ============================================================
                 #  ODTWARZANIE WIDOCZNOŚCI WEKTORÓW I TRAJEKTORII
                 # ============================================================
                 vis = obj_data
 
-                obj = self.objects[-1]
+                # wizualizacje tworzone tylko gdy coś ma być widoczne
+                if vis.get("show_trajectory", False) and obj.trajectory:
+                    obj.trajectory.visible = True
 
-                obj.trajectory.visible = vis.get("show_trajectory", False)
-                obj.vector_manager.gravity_force.vector.visible = vis.get(
-                    "show_gravity_force", False
-                )
-                obj.vector_manager.applied_force.vector.visible = vis.get(
-                    "show_applied_force", False
-                )
-                obj.vector_manager.total_force.vector.visible = vis.get(
-                    "show_total_force", False
+                vector_keys = [
+                    "show_gravity_force",
+                    "show_applied_force",
+                    "show_total_force",
+                    "show_velocity",
+                    "show_velocity_x",
+                    "show_velocity_y",
+                ]
+                vm = (
+                    obj.vector_manager
+                    if any(vis.get(key, False) for key in vector_keys)
+                    else None
                 )
+                if vm is None:
+                    continue
+                vm.gravity_force.vector.visible = vis.get("show_gravity_force", False)
+                vm.applied_force.vector.visible = vis.get("show_applied_force", False)
+                vm.total_force.vector.visible = vis.get("show_total_force", False)
 
-                obj.vector_manager.lineral_velocity.vector.visible = vis.get(
-                    "show_velocity", False
-                )
-                obj.vector_manager.lineral_velocity.vec_x.visible = vis.get(
-                    "show_velocity_x", False
-                )
-                obj.vector_manager.lineral_velocity.vec_y.visible = vis.get(
-                    "show_velocity_y", False
-                )
+                vm.lineral_velocity.vector.visible = vis.get("show_velocity", False)
+                vm.lineral_velocity.vec_x.visible = vis.get("show_velocity_x", False)
+                vm.lineral_velocity.vec_y.visible = vis.get("show_velocity_y", False)
 
-    def _vectors_scale(self):
-        vals = []
-        vals_v = []
-        for obj in self.objects:
-            if obj.vector_manager:
-                vecs = [
-                    obj.vector_manager.gravity_force,
-                    obj.vector_manager.applied_force,
-                    obj.vector_manager.total_force,
-                ]
-                for vec in vecs:
-                    vals.append(vec.vector._vector_value(vec.vector.value))
-                    vals.append(vec.vector._vector_value(vec.vec_x.value))
-                    vals.append(vec.vector._vector_value(vec.vec_y.value))
-                vel = obj.vector_manager.lineral_velocity
-                vals_v.append(vel.vector._vector_value(vel.vector.value))
-                vals_v.append(vel.vector._vector_value(vel.vec_x.value))
-                vals_v.append(vel.vector._vector_value(vel.vec_y.value))
-        screen_height = pygame.display.get_surface().get_height()
-        limit = screen_height * 0.45
-        max_val = max(vals) if vals else 1.0
-        d = max_val * self.cell_size * self.camera.zoom
-        scale_factor = limit / d if d != 0 else 1.0
-        max_val_v = max(vals_v) if vals_v else 1.0
-        dv = max_val_v * self.cell_size * self.camera.zoom
-        scale_factor_v = limit / dv if dv != 0 else 1.0
-        for obj in self.objects:
-            if obj.vector_manager:
-                obj.vector_manager.scale_forces(scale_factor)
-                obj.vector_manager.scale_velocity(scale_factor_v)
+    def _vectors_scale(self) -> None:
+        """Scales shown vectors to the largest shown force and speed."""
+        self.vector_scale.update(
+            self.active,
+            self.body_states,
+            self.world.gravity,
+            self.collector.impulses,
+            self.collector.duration,
+            limit=self.surface.get_height() * 0.45,
+            pixels_per_unit=self.cell_size * self.camera.zoom,
+        )
@@ -5,11 +5,13 @@ import thorpy as tp
 from obj.drawassistance import DrawAssistance
 from obj.guielements.colorpalette import ColorPalette
 from obj.guielements.numinputoncheckbox import NumberInputOnCheckbox
+from obj.guielements.scenebrowser import SceneBrowser
 from obj.guielements.stoper import Stoper
 from obj.guielements.timer import Timer
 from obj.guielements.toggleimagebutton import ToggleImageButton
 from obj.objectsmanager import ObjectsManager
 from obj.savemanager import SaveManager
+from obj.sceneindex import SceneIndex
 
 
 class Panel_GUI:
@@ -37,6 +39,12 @@ class Panel_GUI:
         self.is_rubber_on: bool = False
         self.save_manager = SaveManager()
         self.on_init()
+        self.scene_browser = SceneBrowser(
+            self.save_manager,
+            SceneIndex(self.save_manager.save_dir),
+            get_scene=self.objectsmanager.transfer_to_json,
+            apply_scene=self.load_scene,
+        )
 
     def on_init(self):
 
@@ -173,12 +181,7 @@ class Panel_GUI:
         helper = tp.Helper('Save', btn_save, countdown=30, offset=(0, 40))
         helper.set_font_size(12)
 
-        def on_save():
-            data = self.objectsmanager.transfer_to_json()
-            save_dir = "./app/local_save"
-            self.save_manager.save_to_json(data, save_dir)
-
-        btn_save.default_at_unclick = on_save
+        btn_save.default_at_unclick = lambda: self.scene_browser.show()
         # -- Load ---
         img = pygame.image.load("app/assets/icons/load.svg")
         img = pygame.transform.smoothscale(img, (25, 25))
@@ -189,19 +192,7 @@ class Panel_GUI:
         helper = tp.Helper('Load file', btn_load, countdown=30, offset=(0, 40))
         helper.set_font_size(12)
 
-        def on_load():
-            save_dir = "./app/local_save"
-            data = self.save_manager.load_from_json(save_dir)
-            if data:
-                self.gravity_input.input.value = str(round(data.get("gravity")[1], 4))
-                self.objectsmanager.load_from_json(data)
-                self.objectsmanager.reset_simulation()
-                if self.stoper:
-                    self.stoper.display.set_value(
-                        self.stoper._prep_text(self.stoper.value)
-                    )
-
-        btn_load.default_at_unclick = on_load
+        btn_load.default_at_unclick = lambda: self.scene_browser.show()
         save_group = tp.Group([btn_save, btn_load], 'h', gap=10)
         # --- Clear Btn ---
         img = pygame.image.load("app/assets/icons/clear.svg")
@@ -214,9 +205,7 @@ class Panel_GUI:
         helper.set_font_size(12)
 
         def clear_all():
-            for obj in self.objectsmanager.objects:
-                obj.destroy()
-            self.objectsmanager.objects.clear()
+            self.objectsmanager.clear_objects()
             self.objectsmanager.reset_simulation()
 
         btn_clr.default_at_unclick = clear_all
@@ -270,6 +259,21 @@ class Panel_GUI:
         self.mainbox.set_topleft(0, 0)
         self.mainbox.set_bck_color((0, 0, 0))
 
+    def load_scene(self, data: dict) -> None:
+        if not isinstance(data, dict) or not isinstance(data.get("objects", []), list):
+            raise ValueError("the file is not a scene")
+        gravity = data.get("gravity")
+        if (
+            isinstance(gravity, (list, tuple))
+            and len(gravity) > 1
+            and isinstance(gravity[1], (int, float))
+        ):
+            self.gravity_input.input.value = str(round(gravity[1], 4))
+        self.objectsmanager.load_from_json(data)
+        self.objectsmanager.reset_simulation()
+        if self.stoper:
+            self.stoper.display.set_value(self.stoper._prep_text(self.stoper.value))
+
     def after_update(self):
         self.draw_assistance.set_color(self.color_palette.selected_color)
         self.color_palette.update_color_preview()
@@ -0,0 +1,292 @@
+import math
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+import numpy as np
+from Box2D import b2CircleShape, b2ContactListener, b2PolygonShape, b2World
+
+# how many frames per second the worker advances, matching the UI's 100 FPS
+WORKER_RATE_HZ = 100
+
+# values published for every body
+X, Y, ANGLE, VX, VY, ANGULAR_VELOCITY = range(6)
+STATE_SIZE = 6
+
+# shared header: per slot (sequence, sim time, wall time), then latest slot, status
+_SEQ, _TIME, _WALL = range(3)
+_LATEST = 6
+_STATUS = 7
+HEADER_SIZE = 8
+
+RUNNING, STOPER_REACHED, COLLISION, FINISHED = range(4)
+
+
+def describe_body(body: Any, applied_force: tuple[float, float]) -> dict:
+    """Plain, picklable copy of a Box2D body, enough to rebuild it exactly."""
+    fixtures = []
+    for fixture in body.fixtures:
+        shape = fixture.shape
+        if isinstance(shape, b2CircleShape):
+            geometry = ("circle", shape.radius, (shape.pos.x, shape.pos.y))
+        elif isinstance(shape, b2PolygonShape):
+            geometry = ("polygon", shape.radius, [tuple(v) for v in shape.vertices])
+        else:
+            raise TypeError(f"Unsupported shape: {type(shape).__name__}")
+        fixtures.append(
+            {
+                "geometry": geometry,
+                "density": fixture.density,
+                "friction": fixture.friction,
+                "restitution": fixture.restitution,
+                "sensor": fixture.sensor,
+            }
+        )
+    return {
+        "type": body.type,
+        "position": (body.position.x, body.position.y),
+        "angle": body.angle,
+        "linear_velocity": (body.linearVelocity.x, body.linearVelocity.y),
+        "angular_velocity": body.angularVelocity,
+        "linear_damping": body.linearDamping,
+        "angular_damping": body.angularDamping,
+        "fixed_rotation": body.fixedRotation,
+        "gravity_scale": body.gravityScale,
+        "active": body.active,
+        "awake": body.awake,
+        "fixtures": fixtures,
+        "applied_force": applied_force,
+    }
+
+
+def _build_body(world: b2World, desc: dict) -> Any:
+    body = world.CreateBody(
+        type=desc["type"],
+        position=desc["position"],
+        angle=desc["angle"],
+        linearVelocity=desc["linear_velocity"],
+        angularVelocity=desc["angular_velocity"],
+        linearDamping=desc["linear_damping"],
+        angularDamping=desc["angular_damping"],
+        fixedRotation=desc["fixed_rotation"],
+        gravityScale=desc["gravity_scale"],
+        active=desc["active"],
+        awake=desc["awake"],
+    )
+    for fixture in desc["fixtures"]:
+        kind, radius, data = fixture["geometry"]
+        if kind == "circle":
+            shape = b2CircleShape(radius=radius, pos=data)
+        else:
+            shape = b2PolygonShape(vertices=data)
+            shape.radius = radius
+        body.CreateFixture(
+            shape=shape,
+            density=fixture["density"],
+            friction=fixture["friction"],
+            restitution=fixture["restitution"],
+            isSensor=fixture["sensor"],
+        )
+    return body
+
+
+class _ContactFlag(b2ContactListener):
+    def __init__(self) -> None:
+        super().__init__()
+        self.hit = False
+
+    def BeginContact(self, contact):
+        self.hit = True
+
+
+def _read_states(bodies: list, out: np.ndarray) -> None:
+    for i, body in enumerate(bodies):
+        p = body.position
+        v = body.linearVelocity
+        out[i] = (p.x, p.y, body.angle, v.x, v.y, body.angularVelocity)
+
+
+def _publish(
+    shared: np.ndarray, slots: np.ndarray, states: np.ndarray, t: float
+) -> None:
+    """Writes into the slot that is not the latest one (seqlock per slot)."""
+    slot = 1 - int(shared[_LATEST])
+    base = slot * 3
+    shared[base + _SEQ] += 1  # odd: being written
+    slots[slot] = states
+    shared[base + _TIME] = t
+    shared[base + _WALL] = time.perf_counter()
+    shared[base + _SEQ] += 1
+    shared[_LATEST] = slot
+
+
+def _worker_main(shm_name: str, scene: dict, conn: Any) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        count = len(scene["bodies"])
+        shared = np.ndarray(
+            (HEADER_SIZE + 2 * count * STATE_SIZE,), dtype=np.float64, buffer=shm.buf
+        )
+        slots = shared[HEADER_SIZE:].reshape(2, count, STATE_SIZE)
+
+        world = b2World(gravity=scene["gravity"])
+        world.warmStarting = scene["warm_starting"]
+        world.continuousPhysics = scene["continuous_physics"]
+        contacts = _ContactFlag()
+        world.contactListener = contacts
+        bodies = [_build_body(world, desc) for desc in scene["bodies"]]
+        forces = [
+            (body, desc["applied_force"])
+            for body, desc in zip(bodies, scene["bodies"])
+            if desc["applied_force"] != (0.0, 0.0)
+        ]
+
+        frame_time = scene["frame_time"]
+        steps = max(1, math.ceil(frame_time / scene["dt"] - 1e-9))
+        iterations = (scene["velocity_iterations"], scene["position_iterations"])
+        stoper = scene["stoper"]
+        stop_at_collision = scene["stop_at_collision"]
+        t = scene["time"]
+
+        states = np.empty((count, STATE_SIZE))
+        previous = np.empty((count, STATE_SIZE))
+        _read_states(bodies, states)
+        _publish(shared, slots, states, t)
+
+        period = 1.0 / WORKER_RATE_HZ
+        next_frame = time.perf_counter()
+        status = RUNNING
+        while status == RUNNING:
+            if conn.poll():
+                break
+            now = time.perf_counter()
+            if now < next_frame:
+                time.sleep(min(next_frame - now, 0.002))
+                continue
+            # a stalled process catches up at most a few frames
+            next_frame = max(next_frame + period, now - 5 * period)
+
+            duration = frame_time
+            if stoper is not None and t + duration > stoper:
+                duration = stoper - t
+                status = STOPER_REACHED
+            if duration > 0:
+                previous[:] = states
+                dt = duration / steps
+                for _ in range(steps):
+                    for body, force in forces:
+                        if body.awake:
+                            body.ApplyForceToCenter(force, True)
+                    world.Step(dt, *iterations)
+                _read_states(bodies, states)
+                t += duration
+                if contacts.hit and stop_at_collision:
+                    # same as the UI: keep the state from before the colliding frame
+                    states[:] = previous
+                    t -= duration
+                    status = COLLISION
+                contacts.hit = False
+            _publish(shared, slots, states, t)
+        shared[_STATUS] = status if status != RUNNING else FINISHED
+        del slots, shared
+    finally:
+        shm.close()
+
+
+class PhysicsWorker:
+    """
+    Runs a copy of the scene's b2World in a separate process at a fixed rate.
+    Body states come back through a shared-memory double buffer; the UI keeps
+    the last two of them and blends between them for rendering.
+    """
+
+    def __init__(self, scene: dict) -> None:
+        count = len(scene["bodies"])
+        size = (HEADER_SIZE + 2 * count * STATE_SIZE) * 8
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 8))
+        self._shared = np.ndarray(
+            (HEADER_SIZE + 2 * count * STATE_SIZE,),
+            dtype=np.float64,
+            buffer=self._shm.buf,
+        )
+        self._shared[:] = 0.0
+        self._shared[_LATEST] = 1  # the first publish goes to slot 0
+        self._slots = self._shared[HEADER_SIZE:].reshape(2, count, STATE_SIZE)
+
+        self.previous: Optional[np.ndarray] = None
+        self.current: Optional[np.ndarray] = None
+        self.previous_time: float = scene["time"]
+        self.current_time: float = scene["time"]
+        self._previous_wall: float = 0.0
+        self._current_wall: float = 0.0
+        self._seen: tuple[int, float] = (-1, -1.0)
+        self._closed: bool = False
+
+        context = mp.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self._shm.name, scene, child_conn),
+            daemon=True,
+        )
+        self._process.start()
+
+    @property
+    def status(self) -> int:
+        return int(self._shared[_STATUS])
+
+    def poll(self) -> bool:
+        """Takes the newest published state if there is one. Returns True if so."""
+        slot = int(self._shared[_LATEST])
+        base = slot * 3
+        for _ in range(3):
+            seq = self._shared[base + _SEQ]
+            if seq == 0 or int(seq) % 2:
+                return False
+            if (slot, seq) == self._seen:
+                return False
+            states = self._slots[slot].copy()
+            t = float(self._shared[base + _TIME])
+            wall = float(self._shared[base + _WALL])
+            if self._shared[base + _SEQ] == seq:
+                break
+        else:
+            return False
+        self._seen = (slot, seq)
+        self.previous = self.current if self.current is not None else states
+        self.previous_time = self.current_time if self.current is not None else t
+        self._previous_wall = self._current_wall if self.current is not None else wall
+        self.current, self.current_time, self._current_wall = states, t, wall
+        return True
+
+    def alpha(self) -> float:
+        """
+        Blend factor between previous and current state. Rendering lags one
+        worker frame behind, so the newest state is reached just as the next
+        one is due.
+        """
+        interval = self._current_wall - self._previous_wall
+        if interval <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (time.perf_counter() - self._current_wall) / interval))
+
+    def close(self) -> None:
+        """Stops the process and releases the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._process.is_alive():
+            try:
+                self._conn.send("stop")
+            except (BrokenPipeError, EOFError):
+                # finished on its own (stoper, collision) in the meantime
+                pass
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+        # drop views before releasing the buffer
+        del self._slots, self._shared
+        self._shm.close()
+        self._shm.unlink()
@@ -0,0 +1,99 @@
+from typing import Callable, Optional
+
+# frame time that keeps the 100 FPS target
+FRAME_BUDGET_MS = 10.0
+
+
+class QualityStep:
+    """One feature that can be switched off to save frame time."""
+
+    def __init__(self, name: str, apply: Callable[[bool], None]) -> None:
+        self.name = name
+        # called with False to lower the quality and with True to restore it
+        self.apply = apply
+
+
+class QualityController:
+    """
+    Watches the measured frame time and lowers the rendering quality while it
+    stays over budget, one step at a time in the order the steps were added.
+    Steps come back in reverse order once frames have enough headroom again.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = FRAME_BUDGET_MS,
+        smoothing: float = 0.1,
+        headroom: float = 0.7,
+        lower_after: int = 10,
+        restore_after: int = 120,
+    ) -> None:
+        self.budget_ms = budget_ms
+        # weight of the newest frame in the moving average
+        self.smoothing = smoothing
+        # steps are restored only while frames take less than this part of the
+        # budget, so a restored feature does not push them straight back over
+        self.headroom = headroom
+        # frames in a row over budget before a step is lowered
+        self.lower_after = lower_after
+        # frames in a row with headroom before a step is restored
+        self.restore_after = restore_after
+        self.enabled: bool = True
+        self.steps: list[QualityStep] = []
+        # number of steps currently lowered, from the start of `steps`
+        self.level: int = 0
+        self.average_ms: Optional[float] = None
+        self._over: int = 0
+        self._under: int = 0
+
+    def add_step(self, name: str, apply: Callable[[bool], None]) -> None:
+        self.steps.append(QualityStep(name, apply))
+
+    @property
+    def lowered(self) -> list[str]:
+        """Names of the steps that are currently switched off."""
+        return [step.name for step in self.steps[: self.level]]
+
+    def frame(self, ms: float) -> bool:
+        """
+        Records the time of one rendered frame. Returns True if the quality
+        level changed, which means the next frame has to be drawn in full.
+        """
+        if not self.enabled:
+            return False
+        if self.average_ms is None:
+            self.average_ms = ms
+        else:
+            self.average_ms += self.smoothing * (ms - self.average_ms)
+
+        if self.average_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+        elif self.average_ms < self.budget_ms * self.headroom:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= self.lower_after and self.level < len(self.steps):
+            self.steps[self.level].apply(False)
+            self.level += 1
+            self._over = 0
+            return True
+        if self._under >= self.restore_after and self.level > 0:
+            self.level -= 1
+            self.steps[self.level].apply(True)
+            self._under = 0
+            return True
+        return False
+
+    def pause(self) -> None:
+        """Forgets the running measurement, e.g. after the app was idle."""
+        self.average_ms = None
+        self._over = self._under = 0
+
+    def restore_all(self) -> None:
+        while self.level > 0:
+            self.level -= 1
+            self.steps[self.level].apply(True)
+        self.pause()
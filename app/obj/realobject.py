@@ -3,8 +3,12 @@ from typing import Any, List, Optional, Tuple, Union
 
 import pygame  # type: ignore
 from Box2D import b2Vec2, b2World
+from obj.bodystate import BodyState, BodyStateMirror
 from obj.camera import Camera
+from obj.dirtyrenderer import union_rect
 from obj.drawn.drawnobject import DrawnObject
+from obj.drawn.spritecache import sprite_cache
+from obj.forcemanager import ForceManager
 from obj.grid import nice_world_step
 from obj.impulsecollector import ImpulseCollector
 from obj.physicobject import Features, PhysicObject
@@ -34,6 +38,13 @@ class RealObject:
         features: Optional[Features] = None,
     ) -> None:
         self.my_manager: Optional[Any] = None
+        # set by ObjectRegistry, also stored as the body's userData
+        self.id: Optional[int] = None
+        # row of this body in the scene's BodyStateMirror
+        self.state_mirror: Optional[BodyStateMirror] = None
+        self.state_index: int = 0
+        # set when the body left the world bounds and was deactivated
+        self.out_of_world: bool = False
 
         self.shape_type = shape_type
         self.obj_type = obj_type if shape_type != "point_particle" else 'dynamic'
@@ -77,28 +88,91 @@ class RealObject:
             camera=camera,
             cell_size=cell_size,
         )
-        self.vector_manager: VectorManager = VectorManager(self, impulse_collector)
-        self.trajectory: Trajectory = Trajectory(
-            camera,
-            color,
-            self.cell_size,
-            self.physics.body,
-            self.vector_manager.forcemanager,
+        self.forcemanager: Optional[ForceManager] = (
+            None
+            if self.physics.is_static
+            else ForceManager(self.physics.body, impulse_collector)
         )
+        # Vector and trajectory visuals are built on first access.
+        self._vector_manager: Optional[VectorManager] = None
+        self._trajectory: Optional[Trajectory] = None
 
-        body = self.physics.body
-        self._prev_pos = body.position.copy()
-        self._prev_angle = body.angle
-        self._prev_linear_velocity = body.linearVelocity.copy()
-        self._prev_angular_velocity = body.angularVelocity
+        self._prev_state: BodyState = BodyState.read(self.physics.body)
+        # body transform applied by the last sync()
+        self._synced_transform: Optional[Tuple[float, float, float]] = None
 
         self.sync()
 
+    @property
+    def vector_manager(self) -> Optional[VectorManager]:
+        return self.get_vector_manager()
+
+    @property
+    def trajectory(self) -> Optional[Trajectory]:
+        return self.get_trajectory()
+
+    def get_vector_manager(self, create: bool = True) -> Optional[VectorManager]:
+        """
+        Returns the vector visuals of a dynamic object, building them on first
+        use unless `create` is False. Static objects have none.
+        """
+        if self._vector_manager is None and create and self.forcemanager is not None:
+            self._vector_manager = VectorManager(self, self.forcemanager)
+            self.forcemanager.update()
+            self._vector_manager.update(self.state())
+        return self._vector_manager
+
+    def get_trajectory(self, create: bool = True) -> Optional[Trajectory]:
+        """
+        Returns the trajectory of a dynamic object, building it on first use
+        unless `create` is False. Static objects have none.
+        """
+        if self._trajectory is None and create and self.forcemanager is not None:
+            self._trajectory = Trajectory(
+                self.visual.camera,
+                self.color,
+                self.cell_size,
+                self.physics.body,
+                self.forcemanager,
+                self.state,
+                self.visual.surface,
+            )
+        return self._trajectory
+
+    def state(self) -> BodyState:
+        """Current body state, taken from the scene's mirror while it is fresh."""
+        mirror = self.state_mirror
+        if mirror is not None and not mirror.dirty:
+            return mirror.rows[self.state_index]
+        return BodyState.read(self.physics.body)
+
+    def rendered_state(self) -> BodyState:
+        """Like state(), but blended between physics frames when interpolating."""
+        mirror = self.state_mirror
+        if mirror is not None and not mirror.dirty:
+            return mirror.blended(self.state_index)
+        return BodyState.read(self.physics.body)
+
+    def needs_forces(self) -> bool:
+        """True if a visible vector or trajectory reads the force bookkeeping."""
+        if self._trajectory is not None and self._trajectory.visible:
+            return True
+        return self._vector_manager is not None and self._vector_manager.any_visible()
+
     def destroy(self):
         if self.physics and self.physics.body and self.physics.world:
             self.physics.world.DestroyBody(self.physics.body)
             self.physics.body = None
 
+    def deactivate(self) -> None:
+        """Takes the body out of the simulation until the next reset."""
+        body = self.physics.body
+        if body is None:
+            return
+        body.awake = False
+        body.active = False
+        self.out_of_world = True
+
     # -------------------------------------------------------
     def sync(self) -> None:
         """
@@ -109,37 +183,66 @@ class RealObject:
         if body is None:
             return
 
-        pos = pygame.Vector2(body.position.x, body.position.y)
-        angle = math.degrees(body.angle)
+        state = self.rendered_state()
+        transform = (state.x, state.y, state.angle)
+        if transform == self._synced_transform and (
+            self.physics.is_static or not state.awake
+        ):
+            # resting or static body: visuals already match the physics
+            return
+        self._synced_transform = transform
+
+        pos = pygame.Vector2(state.x, state.y)
+        angle = math.degrees(state.angle)
 
         self.visual.object.set_position(pos)
         self.visual.object.set_angle(angle)
-        if self.vector_manager:
-            self.vector_manager.update()
+        if self.forcemanager is not None and self.needs_forces():
+            self.forcemanager.update()
+            if self._vector_manager is not None:
+                self._vector_manager.update(state)
+
+    def hide(self) -> None:
+        """Marks the visual as off screen after culling skipped drawing it."""
+        self.visual.hide()
+        self._synced_transform = None
+
+    def invalidate_sync(self) -> None:
+        """Forces the next sync() to run even if the body has not moved."""
+        self._synced_transform = None
 
     # -------------------------------------------------------
-    def draw(self) -> None:
-        if self.physics.body is None:
-            return
+    def draw(self) -> Optional[pygame.Rect]:
+        """Draws the object with its overlays; returns the screen area covered."""
+        if self.physics.body is None or self.out_of_world:
+            return None
         self.sync()
         self.visual.draw()
-        if self.trajectory:
+        drawn = self.visual.screen_rect()
+        if self._trajectory is not None or self._vector_manager is not None:
+            # overlays go over the body, so its queued sprite is drawn first
+            sprite_cache.flush(self.visual.surface)
+        if self._trajectory is not None:
             pos = pygame.Vector2(self.start_position.x, self.start_position.y)
-            self.trajectory.draw_trajectory(pos)
-        if self.vector_manager:
-            self.vector_manager.draw()
+            drawn = union_rect(drawn, self._trajectory.draw_trajectory(pos))
+        if self._vector_manager is not None:
+            drawn = union_rect(drawn, self._vector_manager.draw())
+        return drawn
 
     # -------------------------------------------------------
     def reset(self) -> None:
         """Resets the object to its initial position and angle."""
         body = self.physics.body
+        if self.out_of_world:
+            body.active = True
+            self.out_of_world = False
         body.position = self.start_position
         body.angle = self.start_angle
         body.linearVelocity = self.start_linearVelocity
         body.angularVelocity = self.start_angularVelocity
         body.awake = True
-        if self.trajectory:
-            self.trajectory.clear_track()
+        if self._trajectory is not None:
+            self._trajectory.clear_track()
         self.sync()
 
     def is_point_inside(self, position) -> bool:
@@ -176,8 +279,8 @@ class RealObject:
 
         if not self.physics.is_static:
             body.awake = True
-        if self.trajectory:
-            self.trajectory.clear_track()
+        if self._trajectory is not None:
+            self._trajectory.clear_track()
         self.visual.object.move(vec)
 
     def transfer_to_json(self) -> Optional[dict]:
@@ -195,8 +298,10 @@ class RealObject:
                 "features": self.features.transfer_to_json() if self.features else None,
             }
         else:
-            if self.vector_manager is None or self.trajectory is None:
+            if self.forcemanager is None:
                 return None
+            trajectory = self._trajectory
+            vm = self._vector_manager
             return {
                 "obj_type": self.obj_type,
                 "shape_type": self.shape_type,
@@ -215,31 +320,28 @@ class RealObject:
                 ],
                 "angular_velocity": self.start_angularVelocity,
                 "applied_force": [
-                    float(self.vector_manager.forcemanager.applied_force.x),
-                    float(self.vector_manager.forcemanager.applied_force.y),
+                    float(self.forcemanager.applied_force.x),
+                    float(self.forcemanager.applied_force.y),
                 ],
-                "show_trajectory": self.trajectory.visible,
-                "show_gravity_force": self.vector_manager.gravity_force.vector.visible,
-                "show_applied_force": self.vector_manager.applied_force.vector.visible,
-                "show_total_force": self.vector_manager.total_force.vector.visible,
-                "show_velocity": self.vector_manager.lineral_velocity.vector.visible,
-                "show_velocity_x": self.vector_manager.lineral_velocity.vec_x.visible,
-                "show_velocity_y": self.vector_manager.lineral_velocity.vec_y.visible,
+                "show_trajectory": bool(trajectory and trajectory.visible),
+                "show_gravity_force": bool(vm and vm.gravity_force.vector.visible),
+                "show_applied_force": bool(vm and vm.applied_force.vector.visible),
+                "show_total_force": bool(vm and vm.total_force.vector.visible),
+                "show_velocity": bool(vm and vm.lineral_velocity.vector.visible),
+                "show_velocity_x": bool(vm and vm.lineral_velocity.vec_x.visible),
+                "show_velocity_y": bool(vm and vm.lineral_velocity.vec_y.visible),
             }
 
     def save_state_before_step(self):
-        body = self.physics.body
-        self._prev_pos = body.position.copy()
-        self._prev_angle = body.angle
-        self._prev_linear_velocity = body.linearVelocity.copy()
-        self._prev_angular_velocity = body.angularVelocity
+        self._prev_state = self.state()
 
     def restore_state(self):
         body = self.physics.body
-        body.position = self._prev_pos
-        body.angle = self._prev_angle
-        body.linearVelocity = self._prev_linear_velocity
-        body.angularVelocity = self._prev_angular_velocity
+        prev = self._prev_state
+        body.position = (prev.x, prev.y)
+        body.angle = prev.angle
+        body.linearVelocity = (prev.vx, prev.vy)
+        body.angularVelocity = prev.angular_velocity
 
     def _round_size(
         self, size, zoom, cell_size
@@ -1,10 +1,13 @@
 import json
 import os
-from tkinter import filedialog as fd
-from typing import Any
+import threading
+from typing import Any, Callable, Optional
 
 import pygame
-import thorpy as tp
+
+SAVE_DIR = "./app/local_save"
+# bytes read at a time when loading, between progress reports
+READ_CHUNK = 64 * 1024
 
 
 def to_json_safe(value):
@@ -32,122 +35,163 @@ def to_json_safe(value):
     return value
 
 
-class SaveManager:
-    def __init__(self):
-        self.tk_dialog = fd.asksaveasfilename
-        cls_text = tp.Text
-        self.initial_value = 'autosave.json'
-        self.tk_dialog_value = cls_text('autosave.json')
-        self.tk_dialog_value.hand_cursor = True
-        self.basename = True
-        self.extension = True
-        self.filetypes = [("JSON files", ".json")]
-        self.initial_dir = "./app/local_save"
-
-    def save_at_unclick(self):
-        self.tk_dialog = fd.asksaveasfilename
-        if self.filetypes:
-            try:
-                value = self.tk_dialog(
-                    initialdir=self.initial_dir,
-                    filetypes=self.filetypes,
-                    initialfile=self.initial_value,
-                )
-            except:
-                value = self.tk_dialog(
-                    initialdir=self.initial_dir, filetypes=self.filetypes
-                )
-        else:
-            try:
-                value = self.tk_dialog(
-                    initialdir=self.initial_dir, initialfile=self.initial_value
-                )
-            except:
-                value = self.tk_dialog(initialdir=self.initial_dir)
-        if not (isinstance(value, str)):
-            value = [self.clean_value(v) for v in value]
-            value = "\n".join(value)
-        else:
-            value = self.clean_value(value)
-        self.tk_dialog_value.set_text(value)
-
-    def load_at_unclick(self):
-        self.tk_dialog = fd.askopenfilename
-        if self.filetypes:
-            try:
-                value = self.tk_dialog(
-                    initialdir=self.initial_dir,
-                    filetypes=self.filetypes,
-                    initialfile=self.initial_value,
-                )
-            except:
-                value = self.tk_dialog(
-                    initialdir=self.initial_dir, filetypes=self.filetypes
-                )
-        else:
-            try:
-                value = self.tk_dialog(
-                    initialdir=self.initial_dir, initialfile=self.initial_value
-                )
-            except:
-                value = self.tk_dialog(initialdir=self.initial_dir)
-        if not (isinstance(value, str)):
-            value = [self.clean_value(v) for v in value]
-            value = "\n".join(value)
-        else:
-            value = self.clean_value(value)
-        self.tk_dialog_value.set_text(value)
-
-    def clean_value(self, value):
-        if self.basename:
-            value = os.path.basename(value)
-        if not self.extension:
-            e = value.split(".")[-1]
-            value = value.replace("." + e, "")
-        return value
-
-    def get_value(self):
-        return self.tk_dialog_value.get_value()
-
-    def save_to_json(self, data: Any, save_dir: str):
-        if data is None:
-            return
-
-        data = to_json_safe(data)  # <-- DODAJ TO
-
-        self.save_at_unclick()
-        file_name = str(self.get_value()).strip()
-        if len(file_name) == 0:
-            return
-
-        if not file_name.endswith(".json"):
-            file_name += ".json"
-        if file_name:
-            file_path = os.path.join(save_dir, file_name)
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
-
-    def load_from_json(self, save_dir: str):
-        self.load_at_unclick()
-
-        file_name = self.get_value()
-        data = None
-
-        if not file_name:
-            return None
+def scene_file_name(name: str) -> str:
+    """File name of a scene typed by the user: no directories, `.json` added."""
+    name = os.path.basename(name.strip())
+    if name and not name.endswith(".json"):
+        name += ".json"
+    return name
+
+
+class _ReportingList(list):
+    """List that reports how far the JSON encoder got through it."""
+
+    def __init__(self, items: list, report: Callable[[float], None]) -> None:
+        super().__init__(items)
+        self.report = report
+
+    def __iter__(self):
+        count = len(self)
+        for i, item in enumerate(super().__iter__()):
+            self.report(i / count)
+            yield item
+
+
+class FileJob:
+    """
+    Reading or writing of one scene file on a background thread. `progress`
+    and the outcome are only written by the thread and read by the main loop
+    once `finished()`.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        description: str,
+        work: Callable[[Callable[[float], None]], Any],
+        on_done: Optional[Callable[["FileJob"], None]] = None,
+    ) -> None:
+        self.file_name = file_name
+        self.description = description
+        self.work = work
+        self.on_done = on_done
+        self.progress: float = 0.0
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def finished(self) -> bool:
+        return self._finished.is_set()
+
+    def _report(self, progress: float) -> None:
+        self.progress = progress
+
+    def _run(self) -> None:
+        try:
+            self.result = self.work(self._report)
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self.progress = 1.0
+            self._finished.set()
 
-        file_path = os.path.join(save_dir, file_name)
 
-        if not os.path.exists(file_path):
-            print(f"[ERROR] Plik {file_path} nie istnieje!")
+class SaveManager:
+    """
+    Scene files in `save_dir`. Encoding, reading and writing run on a
+    background thread, one job at a time; the main loop calls poll() every
+    frame, which hands a finished job to its callback.
+    """
+
+    def __init__(self, save_dir: str = SAVE_DIR) -> None:
+        self.save_dir = save_dir
+        self.job: Optional[FileJob] = None
+
+    def busy(self) -> bool:
+        return self.job is not None
+
+    def poll(self) -> Optional[FileJob]:
+        """Returns the job if it finished since the last call, after its callback."""
+        job = self.job
+        if job is None or not job.finished():
             return None
+        self.job = None
+        if job.on_done:
+            job.on_done(job)
+        return job
+
+    def _start(self, job: FileJob) -> bool:
+        if self.busy():
+            return False
+        self.job = job
+        job.start()
+        return True
+
+    def save_to_json(
+        self,
+        data: Any,
+        file_name: str,
+        on_done: Optional[Callable[[FileJob], None]] = None,
+    ) -> bool:
+        """
+        Starts writing `data` to `file_name`; False if there is nothing to save
+        or another file is being read or written.
+        """
+        file_name = scene_file_name(file_name)
+        if data is None or not file_name:
+            return False
+        # a plain copy, so the scene can change while the copy is written
+        data = to_json_safe(data)
+        path = os.path.join(self.save_dir, file_name)
+
+        def write(report: Callable[[float], None]) -> None:
+            if isinstance(data.get("objects"), list):
+                data["objects"] = _ReportingList(data["objects"], report)
+            os.makedirs(self.save_dir, exist_ok=True)
+            # written next to the target and swapped in, so an interrupted save
+            # never leaves a broken scene behind
+            temp_path = path + ".part"
+            try:
+                with open(temp_path, "w") as f:
+                    for chunk in json.JSONEncoder(indent=4).iterencode(data):
+                        f.write(chunk)
+                os.replace(temp_path, path)
+            except BaseException:
+                # nothing half-written is left next to the scenes
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+        return self._start(FileJob(file_name, f"Saving {file_name}", write, on_done))
+
+    def load_from_json(
+        self, file_name: str, on_done: Callable[[FileJob], None]
+    ) -> bool:
+        """
+        Starts reading `file_name`; the scene data is the result of the job
+        passed to `on_done`. False if another file is being read or written.
+        """
+        file_name = scene_file_name(file_name)
+        if not file_name:
+            return False
+        path = os.path.join(self.save_dir, file_name)
+
+        def read(report: Callable[[float], None]) -> Any:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"File {file_name} does not exist.")
+            size = max(os.path.getsize(path), 1)
+            content = bytearray()
+            with open(path, "rb") as f:
+                while chunk := f.read(READ_CHUNK):
+                    content += chunk
+                    report(len(content) / size)
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                raise ValueError(f"File {file_name} contains broken JSON.")
 
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            print(f"[ERROR] Plik {file_path} zawiera uszkodzony JSON.")
-        except Exception as e:
-            print(f"[ERROR] Nie udało się wczytać pliku: {e}")
-
-        return data
+        return self._start(FileJob(file_name, f"Loading {file_name}", read, on_done))
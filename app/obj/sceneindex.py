@@ -0,0 +1,255 @@
+import base64
+import io
+import json
+import math
+import os
+from typing import Any, Callable, Optional
+
+import pygame
+from obj.savemanager import SAVE_DIR, FileJob
+
+# kept next to the scenes; not a .json file, so it is never listed as one
+INDEX_FILE = "scenes.index"
+# bumped when the entries change shape, so old index files are rebuilt
+INDEX_VERSION = 1
+THUMBNAIL_SIZE = (64, 40)
+THUMBNAIL_BACKGROUND = (220, 220, 220)
+
+
+def _object_outline(obj: dict) -> tuple[list[tuple[float, float]], float]:
+    """World points of an object and the radius drawn around them."""
+    x, y = obj.get("position", (0.0, 0.0))
+    shape = obj.get("shape_type")
+    size = obj.get("size")
+    angle = obj.get("angle") or 0.0
+    if shape == "rectangle":
+        w, h = size
+        local = [(-w / 2, -h / 2), (w / 2, -h / 2), (w / 2, h / 2), (-w / 2, h / 2)]
+    elif shape == "triangle":
+        local = [tuple(v) for v in size]
+    elif shape == "circle":
+        return [(x, y)], float(size)
+    else:
+        return [(x, y)], 0.0
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    return [
+        (x + vx * cos_a - vy * sin_a, y + vx * sin_a + vy * cos_a) for vx, vy in local
+    ], 0.0
+
+
+def render_thumbnail(data: dict) -> pygame.Surface:
+    """Small picture of a scene, drawn from its JSON without building bodies."""
+    surface = pygame.Surface(THUMBNAIL_SIZE)
+    surface.fill(THUMBNAIL_BACKGROUND)
+    shapes = []
+    for obj in data.get("objects", []):
+        if not obj:
+            continue
+        try:
+            points, radius = _object_outline(obj)
+        except (TypeError, ValueError):
+            continue
+        shapes.append((points, radius, obj.get("color", (0, 0, 0))))
+    if not shapes:
+        return surface
+
+    xs = [p[0] + s * r for points, r, _ in shapes for p in points for s in (-1, 1)]
+    ys = [p[1] + s * r for points, r, _ in shapes for p in points for s in (-1, 1)]
+    margin = 3
+    width, height = THUMBNAIL_SIZE
+    span = max(
+        (max(xs) - min(xs)) / (width - 2 * margin),
+        (max(ys) - min(ys)) / (height - 2 * margin),
+        1e-6,
+    )
+    cx, cy = (max(xs) + min(xs)) / 2, (max(ys) + min(ys)) / 2
+
+    def to_pixels(p: tuple[float, float]) -> tuple[int, int]:
+        return (
+            round(width / 2 + (p[0] - cx) / span),
+            round(height / 2 + (p[1] - cy) / span),
+        )
+
+    for points, radius, color in shapes:
+        color = [max(0, min(255, int(c))) for c in color]
+        if len(points) > 2:
+            pygame.draw.polygon(surface, color, [to_pixels(p) for p in points])
+        else:
+            pygame.draw.circle(
+                surface, color, to_pixels(points[0]), max(1, round(radius / span))
+            )
+    return surface
+
+
+def summarize_scene(data: dict) -> dict:
+    """Index entry of a scene: object counts, gravity, stoper time, thumbnail."""
+    shapes: dict[str, int] = {}
+    types: dict[str, int] = {}
+    for obj in data.get("objects", []):
+        if not obj:
+            continue
+        shape, obj_type = obj.get("shape_type"), obj.get("obj_type")
+        shapes[shape] = shapes.get(shape, 0) + 1
+        types[obj_type] = types.get(obj_type, 0) + 1
+    gravity = data.get("gravity")
+    stoper = data.get("stoper")
+
+    buffer = io.BytesIO()
+    pygame.image.save(render_thumbnail(data), buffer, "thumbnail.png")
+    return {
+        "shapes": shapes,
+        "types": types,
+        "gravity": (
+            round(gravity[1], 4)
+            if isinstance(gravity, list) and len(gravity) > 1
+            else None
+        ),
+        "stoper": stoper if isinstance(stoper, int) else 0,
+        "thumbnail": base64.b64encode(buffer.getvalue()).decode("ascii"),
+    }
+
+
+class SceneIndex:
+    """
+    Metadata and thumbnails of the scenes in `save_dir`, cached in a single
+    index file. refresh() starts a background pass that parses only scenes
+    whose modification time or size changed since they were indexed and
+    drops removed ones; the browser lists scenes from the cached entries.
+    """
+
+    def __init__(self, save_dir: str = SAVE_DIR) -> None:
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, INDEX_FILE)
+        # scene file name -> entry, replaced as a whole when a pass finishes
+        self.entries: dict[str, dict] = {}
+        self.job: Optional[FileJob] = None
+        self._loaded: bool = False
+        # set by refresh() during a pass, whose listing may predate the change
+        self._rescan: bool = False
+        self._thumbnails: dict[str, tuple[str, pygame.Surface]] = {}
+
+    def busy(self) -> bool:
+        return self.job is not None
+
+    def refresh(self) -> None:
+        """
+        Starts a pass over the save directory; while one is running, another
+        is started once it finishes.
+        """
+        if self.job is not None:
+            self._rescan = True
+            return
+        self._rescan = False
+        known = self.entries if self._loaded else None
+        self.job = FileJob(
+            INDEX_FILE, "Indexing scenes", lambda report: self._scan(report, known)
+        )
+        self.job.start()
+
+    def poll(self) -> bool:
+        """True if a pass finished since the last call and changed the entries."""
+        job = self.job
+        if job is None or not job.finished():
+            return False
+        self.job = None
+        self._loaded = True
+        changed = not job.error and job.result != self.entries
+        if changed:
+            self.entries = job.result
+            self._thumbnails = {
+                name: cached
+                for name, cached in self._thumbnails.items()
+                if name in self.entries
+            }
+        if self._rescan:
+            self.refresh()
+        return changed
+
+    def scenes(self) -> list[str]:
+        """Names of the indexed scenes, newest first."""
+        return sorted(
+            self.entries, key=lambda name: self.entries[name]["mtime"], reverse=True
+        )
+
+    def describe(self, name: str) -> str:
+        entry = self.entries.get(name)
+        if entry is None:
+            return ""
+        if "error" in entry:
+            return entry["error"]
+        types = ", ".join(f"{n} {t}" for t, n in sorted(entry["types"].items()))
+        text = types or "empty"
+        if entry["gravity"] is not None:
+            text += f"  g {entry['gravity']:g}"
+        if entry["stoper"]:
+            text += f"  stop {entry['stoper'] / 1000:.2f}s"
+        return text
+
+    def thumbnail(self, name: str) -> Optional[pygame.Surface]:
+        """Thumbnail of a scene, decoded on first use."""
+        entry = self.entries.get(name)
+        if entry is None or "thumbnail" not in entry:
+            return None
+        cached = self._thumbnails.get(name)
+        if cached is None or cached[0] != entry["thumbnail"]:
+            raw = base64.b64decode(entry["thumbnail"])
+            image = pygame.image.load(io.BytesIO(raw), "thumbnail.png")
+            cached = (entry["thumbnail"], image)
+            self._thumbnails[name] = cached
+        return cached[1]
+
+    def _read_index(self) -> dict[str, dict]:
+        try:
+            with open(self.path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            return {}
+        return index.get("scenes", {})
+
+    def _write_index(self, entries: dict[str, dict]) -> None:
+        temp_path = self.path + ".part"
+        with open(temp_path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "scenes": entries}, f)
+        os.replace(temp_path, self.path)
+
+    def _scan(
+        self, report: Callable[[float], None], known: Optional[dict[str, dict]]
+    ) -> dict[str, dict]:
+        """Runs on the job's thread; returns the new entries."""
+        if known is None:
+            known = self._read_index()
+        try:
+            files = [
+                entry
+                for entry in os.scandir(self.save_dir)
+                if entry.is_file() and entry.name.endswith(".json")
+            ]
+        except FileNotFoundError:
+            return {}
+        entries: dict[str, dict] = {}
+        for i, file in enumerate(files):
+            stat = file.stat()
+            entry = known.get(file.name)
+            if (
+                entry is None
+                or entry["mtime"] != stat.st_mtime
+                or entry["size"] != stat.st_size
+            ):
+                entry = self._index_file(file.path)
+                entry["mtime"] = stat.st_mtime
+                entry["size"] = stat.st_size
+            entries[file.name] = entry
+            report((i + 1) / len(files))
+        if entries != known or not os.path.exists(self.path):
+            self._write_index(entries)
+        return entries
+
+    def _index_file(self, path: str) -> dict[str, Any]:
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            return summarize_scene(data)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {"error": "unreadable scene"}
@@ -0,0 +1,133 @@
+import math
+from typing import Any, Optional
+
+
+class SolverSettings:
+    """Box2D solver parameters of a scene, stored in its save file."""
+
+    def __init__(
+        self,
+        dt: float = 1 / 200,
+        velocity_iterations: int = 10,
+        position_iterations: int = 5,
+        warm_starting: bool = True,
+        continuous_physics: bool = True,
+        adaptive: bool = False,
+        max_substeps: int = 8,
+        cfl: float = 0.5,
+        quality: Optional[str] = "normal",
+    ) -> None:
+        if dt <= 0:
+            raise ValueError("Solver time step must be positive.")
+        if velocity_iterations < 1 or position_iterations < 1:
+            raise ValueError("Solver iterations must be at least 1.")
+        if max_substeps < 1:
+            raise ValueError("Solver needs at least one sub-step.")
+        if cfl <= 0:
+            raise ValueError("CFL factor must be positive.")
+        self.dt = float(dt)
+        self.velocity_iterations = int(velocity_iterations)
+        self.position_iterations = int(position_iterations)
+        self.warm_starting = bool(warm_starting)
+        self.continuous_physics = bool(continuous_physics)
+        # adaptive sub-stepping: per step no body may travel more than
+        # cfl * (smallest fixture extent); at most max_substeps steps per frame
+        self.adaptive = bool(adaptive)
+        self.max_substeps = int(max_substeps)
+        self.cfl = float(cfl)
+        # name of the preset the values came from, None once edited by hand
+        self.quality = quality
+
+    def transfer_to_json(self) -> dict:
+        return {
+            "dt": self.dt,
+            "velocity_iterations": self.velocity_iterations,
+            "position_iterations": self.position_iterations,
+            "warm_starting": self.warm_starting,
+            "continuous_physics": self.continuous_physics,
+            "adaptive": self.adaptive,
+            "max_substeps": self.max_substeps,
+            "cfl": self.cfl,
+            "quality": self.quality,
+        }
+
+    @classmethod
+    def from_json(
+        cls, data: Any, default: Optional["SolverSettings"] = None
+    ) -> "SolverSettings":
+        """
+        Reads settings saved by transfer_to_json. Missing or invalid values
+        come from the saved preset, or else from `default` (normal quality if
+        not given), so a damaged block never makes a scene unloadable.
+        """
+        if default is None:
+            default = cls()
+        if not isinstance(data, dict):
+            return default
+        quality = data.get("quality")
+        if isinstance(quality, str) and quality in QUALITY_PRESETS:
+            base = quality_preset(quality)
+        else:
+            base = default
+            quality = None
+
+        def number(key: str, kind: type, minimum: float, exclusive: bool = False):
+            value = data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if math.isfinite(value) and (
+                    value > minimum if exclusive else value >= minimum
+                ):
+                    return kind(value)
+            return getattr(base, key)
+
+        def flag(key: str) -> bool:
+            value = data.get(key)
+            return value if isinstance(value, bool) else getattr(base, key)
+
+        return cls(
+            dt=number("dt", float, 0.0, exclusive=True),
+            velocity_iterations=number("velocity_iterations", int, 1),
+            position_iterations=number("position_iterations", int, 1),
+            warm_starting=flag("warm_starting"),
+            continuous_physics=flag("continuous_physics"),
+            adaptive=flag("adaptive"),
+            max_substeps=number("max_substeps", int, 1),
+            cfl=number("cfl", float, 0.0, exclusive=True),
+            quality=quality,
+        )
+
+
+# draft: fewer solver iterations, no TOI sweeps — cheap for light scenes
+# normal: the historical 1/200 s step with 10/5 iterations
+# precise: four steps per frame, twice the iterations and adaptive sub-steps
+QUALITY_PRESETS: dict[str, dict] = {
+    "draft": dict(
+        dt=1 / 200,
+        velocity_iterations=4,
+        position_iterations=2,
+        warm_starting=True,
+        continuous_physics=False,
+    ),
+    "normal": dict(
+        dt=1 / 200,
+        velocity_iterations=10,
+        position_iterations=5,
+        warm_starting=True,
+        continuous_physics=True,
+    ),
+    "precise": dict(
+        dt=1 / 800,
+        velocity_iterations=20,
+        position_iterations=10,
+        warm_starting=True,
+        continuous_physics=True,
+        adaptive=True,
+        max_substeps=32,
+    ),
+}
+
+
+def quality_preset(name: str) -> SolverSettings:
+    if name not in QUALITY_PRESETS:
+        raise ValueError(f"Unknown quality preset: {name}")
+    return SolverSettings(quality=name, **QUALITY_PRESETS[name])
@@ -0,0 +1,42 @@
+from typing import Hashable, Optional
+
+import pygame  # type: ignore
+
+
+class StaticLayer:
+    """
+    Copy of the part of the frame that only changes with the camera or with
+    static geometry: background, grid, axes and static objects. It is drawn
+    once per key and blitted afterwards.
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        self.screen = screen
+        self.surface: Optional[pygame.Surface] = None
+        self.key: Optional[Hashable] = None
+
+    def invalidate(self) -> None:
+        self.key = None
+
+    def is_valid(self, key: Hashable) -> bool:
+        return (
+            key == self.key
+            and self.surface is not None
+            and self.surface.get_size() == self.screen.get_size()
+        )
+
+    def capture(self, key: Hashable) -> None:
+        """Keeps what was just drawn on screen as the layer for `key`."""
+        if self.surface is None or self.surface.get_size() != self.screen.get_size():
+            self.surface = self.screen.copy()
+        else:
+            self.surface.blit(self.screen, (0, 0))
+        self.key = key
+
+    def restore(self, rect: Optional[pygame.Rect] = None) -> None:
+        """Puts the layer back on screen, all of it or only `rect`."""
+        assert self.surface is not None
+        if rect is None:
+            self.screen.blit(self.surface, (0, 0))
+        else:
+            self.screen.blit(self.surface, rect, rect)
@@ -0,0 +1,92 @@
+import itertools
+import time
+from typing import Callable, Hashable, Iterator, Optional
+
+# time given to background jobs in an animated frame
+TASK_SLICE_MS = 2.0
+
+
+class Task:
+    def __init__(
+        self, job: Callable[[], object], priority: int, deadline: int, order: int
+    ) -> None:
+        self.job = job
+        self.priority = priority
+        # frame by which the task runs even if the frame has no time left
+        self.deadline = deadline
+        self.order = order
+        # a job that returns a generator is resumed across frames
+        self.steps: Optional[Iterator] = None
+
+
+class TaskQueue:
+    """
+    Cooperative scheduler for work that does not have to happen in the frame
+    it was asked for. Each run() takes tasks by priority (lower first) until
+    the time slice is used up; a task past its deadline runs regardless.
+    Jobs returning a generator run one step at a time, so long jobs spread
+    over several frames. Tasks are keyed: scheduling a key that is still
+    pending keeps the pending task and its deadline.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, Task] = {}
+        self._order = itertools.count()
+        # number of run() calls so far; deadlines are counted in these
+        self.frame: int = 0
+
+    def schedule(
+        self,
+        key: Hashable,
+        job: Callable[[], object],
+        priority: int = 0,
+        deadline: int = 1,
+    ) -> None:
+        """Queues `job` to run within `deadline` frames, unless `key` is queued."""
+        if key not in self._tasks:
+            self._tasks[key] = Task(
+                job, priority, self.frame + deadline, next(self._order)
+            )
+
+    def cancel(self, key: Hashable) -> None:
+        self._tasks.pop(key, None)
+
+    def clear(self) -> None:
+        self._tasks.clear()
+
+    def pending(self) -> bool:
+        return bool(self._tasks)
+
+    def run(self, slice_ms: Optional[float] = TASK_SLICE_MS) -> None:
+        """Runs queued tasks for up to `slice_ms`; None runs all of them."""
+        self.frame += 1
+        if not self._tasks:
+            return
+        end = None if slice_ms is None else time.perf_counter() + slice_ms / 1000
+        queued = sorted(
+            self._tasks.items(),
+            key=lambda item: (
+                item[1].deadline > self.frame,
+                item[1].priority,
+                item[1].order,
+            ),
+        )
+        for key, task in queued:
+            due = end is None or task.deadline <= self.frame
+            if not due and time.perf_counter() >= end:
+                break
+            if self._step(task, None if due else end):
+                if self._tasks.get(key) is task:
+                    del self._tasks[key]
+
+    def _step(self, task: Task, end: Optional[float]) -> bool:
+        """Advances a task until it finishes or `end` passes. True if finished."""
+        if task.steps is None:
+            result = task.job()
+            if not isinstance(result, Iterator):
+                return True
+            task.steps = result
+        for _ in task.steps:
+            if end is not None and time.perf_counter() >= end:
+                return False
+        return True
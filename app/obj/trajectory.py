@@ -1,11 +1,24 @@
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pygame
 import pygame.gfxdraw
 from Box2D import b2Vec2
+from obj.bodystate import BodyState
 from obj.camera import Camera
+from obj.dirtyrenderer import points_rect, union_rect
+from obj.drawn.lod import render_quality
 from obj.forcemanager import ForceManager
 
+# points of a full trajectory prediction, 1/200 s apart
+PREDICTION_STEPS = 200
+
+# bumped whenever a trajectory is shown or hidden, see ActiveSets
+_visibility_version: int = 0
+
+
+def trajectory_visibility_version() -> int:
+    return _visibility_version
+
 
 def _vectors_are_close(
     p1: pygame.Vector2, p2: pygame.Vector2, eps: float = 1e-2
@@ -21,17 +34,34 @@ class Trajectory:
         base_cell_size: int,
         body: Any,
         forcemanager: ForceManager,
+        read_state: Callable[[], BodyState],
+        surface: Optional[pygame.Surface] = None,
     ):
         self.camera = camera
         self.light_color = tuple(min(c + 100, 255) for c in color[:3])
         self.dark_color = tuple(max(c - 50, 0) for c in color[:3])
         self.line_thickness: int = 2
         self.base_cell_size = base_cell_size
-        self.surface: pygame.Surface = pygame.display.get_surface()
-        self.visible: bool = False
+        self.surface: pygame.Surface = surface or pygame.display.get_surface()
+        self._visible: bool = False
         self.trajectory_points: list[pygame.Vector2] = []
+        # last predicted path, refreshed by update_prediction
+        self.prediction: Optional[list[pygame.Vector2]] = None
+        self._has_prediction: bool = False
         self.body = body
         self.forcemanager = forcemanager
+        self.read_state = read_state
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        global _visibility_version
+        if value != self._visible:
+            self._visible = value
+            _visibility_version += 1
 
     def add_trajectory_point(self, point: pygame.Vector2) -> None:
         n_point = self._create_trajectory_point(point)
@@ -48,7 +78,7 @@ class Trajectory:
         if not _vectors_are_close(self.trajectory_points[0], start_point):
             return True
 
-        predict_tra = self._predict_trajectory(self.body)
+        predict_tra = self._predict_trajectory()
         if not predict_tra:
             return False
 
@@ -73,15 +103,16 @@ class Trajectory:
         w, h = self.surface.get_size()
         return 0 <= screen_pos.x <= w and 0 <= screen_pos.y <= h
 
-    def _predict_trajectory(self, body: Any, dt: float = 1 / 200, steps: int = 200):
-        if not body.awake:
+    def _predict_trajectory(self, dt: float = 1 / 200, steps: int = PREDICTION_STEPS):
+        state = self.read_state()
+        if not state.awake:
             return None
 
-        mass = body.mass
+        mass = self.body.mass
 
         # Initial state
-        pos = pygame.Vector2(body.worldCenter.x, body.worldCenter.y)
-        vel = pygame.Vector2(body.linearVelocity.x, body.linearVelocity.y)
+        pos = pygame.Vector2(state.cx, state.cy)
+        vel = pygame.Vector2(state.vx, state.vy)
 
         trajectory = [pos.copy()]
 
@@ -95,15 +126,23 @@ class Trajectory:
 
         return trajectory
 
-    def draw_predict_trajectory(self, skip: int = 2):
+    def update_prediction(self) -> None:
+        """Predicts the path ahead; queued as a background task while visible."""
+        steps = max(2, round(PREDICTION_STEPS * render_quality.prediction_length))
+        self.prediction = self._predict_trajectory(steps=steps)
+        self._has_prediction = True
+
+    def draw_predict_trajectory(self, skip: int = 2) -> Optional[pygame.Rect]:
         """
         Rysuje przewidywaną trajektorię obiektu.
         :param skip: liczba punktów do pominięcia (np. 2 = rysuj co 2 punkt)
         """
 
-        predict_tra = self._predict_trajectory(self.body)
+        if not self._has_prediction:
+            self.update_prediction()
+        predict_tra = self.prediction
         if predict_tra is None:
-            return
+            return None
 
         predict_tra = [self._create_trajectory_point(p) for p in predict_tra]
 
@@ -115,7 +154,7 @@ class Trajectory:
             points = points[::skip]
 
         if len(points) < 2:
-            return
+            return None
 
         int_points = [(int(p.x), int(p.y)) for p in points]
 
@@ -133,9 +172,13 @@ class Trajectory:
                 )
 
             pygame.gfxdraw.line(self.surface, x1, y1, x2, y2, self.light_color)
+        return points_rect(int_points)
 
-    def draw_track(self, start_point: pygame.Vector2, skip: int = 2):
-        pos = pygame.Vector2(self.body.worldCenter.x, self.body.worldCenter.y)
+    def draw_track(
+        self, start_point: pygame.Vector2, skip: int = 2
+    ) -> Optional[pygame.Rect]:
+        state = self.read_state()
+        pos = pygame.Vector2(state.cx, state.cy)
         self.add_trajectory_point(pos)
         points = [
             self._point_to_screen(p)
@@ -145,7 +188,7 @@ class Trajectory:
         if skip > 1:
             points = points[::skip]
         if len(points) < 2:
-            return
+            return None
 
         int_points = [(int(p.x), int(p.y)) for p in points]
 
@@ -162,12 +205,19 @@ class Trajectory:
                     self.line_thickness,
                 )
             pygame.gfxdraw.line(self.surface, x1, y1, x2, y2, self.dark_color)
+        return points_rect(int_points)
 
-    def draw_trajectory(self, start_point: pygame.Vector2, skip: int = 2):
+    def draw_trajectory(
+        self, start_point: pygame.Vector2, skip: int = 2
+    ) -> Optional[pygame.Rect]:
+        """Draws the track and the prediction; returns the screen area covered."""
         if not self.visible:
-            return
-        self.draw_track(start_point, skip)
-        self.draw_predict_trajectory(skip)
+            return None
+        skip *= render_quality.trajectory_stride
+        drawn = self.draw_track(start_point, skip)
+        return union_rect(drawn, self.draw_predict_trajectory(skip))
 
     def clear_track(self):
         self.trajectory_points = []
+        self.prediction = None
+        self._has_prediction = False
@@ -1,71 +1,85 @@
-from typing import Any
+from typing import Any, Optional
 
 from Box2D import b2Vec2
+from obj.bodystate import BodyState
+from obj.dirtyrenderer import union_rect
 from obj.drawn.vectorcomponents import VectorComponents
+from obj.drawn.visualvector import ScaleFactor
 from obj.forcemanager import ForceManager
-from obj.impulsecollector import ImpulseCollector
-from pygame import Color, Vector3
+from pygame import Color, Rect, Vector3
 
 
 class VectorManager:
-    def __init__(self, obj: Any, impulse_collector: ImpulseCollector):
+    def __init__(self, obj: Any, forcemanager: ForceManager):
         self.obj = obj.physics.body
+        # attachment point of every vector, moved in place by update()
+        self.center = b2Vec2(self.obj.worldCenter)
         self.lineral_velocity = VectorComponents(
-            b2Vec2(self.obj.worldCenter),
+            self.center,
             b2Vec2(self.obj.linearVelocity),
             Color(Vector3([max(c - 100, 20) for c in obj.visual.color[:3]])),
             obj.visual.camera,
             obj.visual.cell_size,
+            obj.visual.surface,
         )
         self.lineral_velocity.set_unit("m/s")
         self.lineral_velocity.set_components_color(Color(0, 0, 0))
-        self.forcemanager = ForceManager(self.obj, impulse_collector)
+        self.forcemanager = forcemanager
 
         self.gravity_force = VectorComponents(
-            b2Vec2(self.obj.worldCenter),
+            self.center,
             b2Vec2(self.forcemanager.gravity_force),
             Color(255, 0, 0),
             obj.visual.camera,
             obj.visual.cell_size,
+            obj.visual.surface,
         )
         self.gravity_force.set_unit("N")
         self.applied_force = VectorComponents(
-            b2Vec2(self.obj.worldCenter),
+            self.center,
             b2Vec2(self.forcemanager.applied_force),
             Color(0, 0, 255),
             obj.visual.camera,
             obj.visual.cell_size,
+            obj.visual.surface,
         )
         self.applied_force.set_unit("N")
         self.total_force = VectorComponents(
-            b2Vec2(self.obj.worldCenter),
+            self.center,
             b2Vec2(self.forcemanager.total_force),
             Color(Vector3([max(c - 100, 20) for c in obj.visual.color[:3]])),
             obj.visual.camera,
             obj.visual.cell_size,
+            obj.visual.surface,
         )
         self.total_force.set_unit("N")
 
-    def update(self):
-        self.lineral_velocity.update(
-            b2Vec2(self.obj.worldCenter), b2Vec2(self.obj.linearVelocity)
-        )
-        self.forcemanager.update()
-        self.gravity_force.update(
-            b2Vec2(self.obj.worldCenter), b2Vec2(self.forcemanager.gravity_force)
-        )
-        self.total_force.update(
-            b2Vec2(self.obj.worldCenter), b2Vec2(self.forcemanager.total_force)
-        )
-        self.applied_force.update(
-            b2Vec2(self.obj.worldCenter), b2Vec2(self.forcemanager.applied_force)
-        )
+    def update(self, state: BodyState):
+        """Moves all vectors to `state` without allocating new b2Vec2s."""
+        self.center.Set(state.cx, state.cy)
+        fm = self.forcemanager
+        self.lineral_velocity.set_xy(state.vx, state.vy)
+        self.gravity_force.set_value(fm.gravity_force)
+        self.total_force.set_value(fm.total_force)
+        self.applied_force.set_value(fm.applied_force)
+
+    def any_visible(self) -> bool:
+        """True if at least one vector or component is shown."""
+        for vec in (
+            self.lineral_velocity,
+            self.gravity_force,
+            self.applied_force,
+            self.total_force,
+        ):
+            if vec.vector.visible or vec.vec_x.visible or vec.vec_y.visible:
+                return True
+        return False
 
-    def draw(self):
-        self.lineral_velocity.draw()
-        self.gravity_force.draw()
-        self.applied_force.draw()
-        self.total_force.draw()
+    def draw(self) -> Optional[Rect]:
+        drawn = self.lineral_velocity.draw()
+        drawn = union_rect(drawn, self.gravity_force.draw())
+        drawn = union_rect(drawn, self.applied_force.draw())
+        return union_rect(drawn, self.total_force.draw())
 
     def scale(self, factor: float):
         self.lineral_velocity.scale(factor)
@@ -78,5 +92,12 @@ class VectorManager:
         self.applied_force.scale(factor)
         self.total_force.scale(factor)
 
+    def share_scales(self, forces: ScaleFactor, velocity: ScaleFactor) -> None:
+        """Makes the vectors follow scales shared with other objects."""
+        self.gravity_force.share_scale(forces)
+        self.applied_force.share_scale(forces)
+        self.total_force.share_scale(forces)
+        self.lineral_velocity.share_scale(velocity)
+
     def scale_velocity(self, factor: float):
         self.lineral_velocity.scale(factor)
@@ -0,0 +1,101 @@
+from typing import Any, Optional
+
+import numpy as np
+from obj.activesets import ActiveSets
+from obj.bodystate import VX, VY, BodyStateMirror
+from obj.drawn.visualvector import ScaleFactor, visibility_version
+from obj.vectormanager import VectorManager
+
+
+class VectorScale:
+    """
+    Common length scale of all shown vectors, set by the largest force and
+    the largest speed among objects that show any vector. Masses, applied
+    forces and state rows of those objects are kept in arrays, rebuilt only
+    when objects are added, removed or replaced or a vector is shown or
+    hidden. The shown vectors share two ScaleFactors, so a frame costs a few
+    array operations, a Python loop over bodies in contact and two stores.
+    """
+
+    def __init__(self) -> None:
+        self.managers: list[VectorManager] = []
+        # BodyStateMirror rows of the shown objects
+        self._rows: np.ndarray = np.zeros(0, dtype=int)
+        # object id -> position in the arrays below
+        self._index: dict[int, int] = {}
+        self._mass: np.ndarray = np.zeros(0)
+        self._applied: np.ndarray = np.zeros((0, 2))
+        self._max_applied: float = 0.0
+        self._key: Optional[tuple[int, int]] = None
+        self.forces: ScaleFactor = ScaleFactor()
+        self.velocity: ScaleFactor = ScaleFactor()
+
+    def _rebuild(self, shown: list[Any], mirror: BodyStateMirror) -> None:
+        self.managers = []
+        self._index = {}
+        rows, masses, applied = [], [], []
+        for obj in shown:
+            vm = obj.get_vector_manager(create=False)
+            if vm is None or obj.state_mirror is not mirror:
+                continue
+            fm = obj.forcemanager
+            self._index[obj.id] = len(self.managers)
+            self.managers.append(vm)
+            vm.share_scales(self.forces, self.velocity)
+            rows.append(obj.state_index)
+            masses.append(obj.physics.body.mass)
+            applied.append((fm.applied_force.x, fm.applied_force.y))
+        self._rows = np.array(rows, dtype=int)
+        self._mass = np.array(masses, dtype=float)
+        self._applied = np.array(applied, dtype=float).reshape(-1, 2)
+        self._max_applied = (
+            float(np.hypot(self._applied[:, 0], self._applied[:, 1]).max())
+            if rows
+            else 0.0
+        )
+
+    def update(
+        self,
+        active: ActiveSets,
+        mirror: BodyStateMirror,
+        gravity: Any,
+        impulses: dict,
+        impulse_time: float,
+        limit: float,
+        pixels_per_unit: float,
+    ) -> None:
+        """
+        Scales shown vectors so the largest force and the largest speed are
+        `limit` pixels long. `mirror` has to be fresh; `impulses` are the
+        contact impulses of the last frame, `impulse_time` seconds long, as
+        in ForceManager.update.
+        """
+        key = (active.objects.version, visibility_version())
+        if key != self._key:
+            self._rebuild(active.with_vectors, mirror)
+            self._key = key
+        if not self.managers:
+            return
+
+        vx = mirror.column(VX)[self._rows]
+        vy = mirror.column(VY)[self._rows]
+        max_speed = float(np.hypot(vx, vy).max())
+
+        # total force = applied + gravity + contact impulses / time, rounded
+        # like ForceManager.total_force
+        fx = self._applied[:, 0] + gravity.x * self._mass
+        fy = self._applied[:, 1] + gravity.y * self._mass
+        inv_dt = 1.0 / impulse_time
+        for obj_id, contact in impulses.items():
+            i = self._index.get(obj_id)
+            if i is not None and contact:
+                fx[i] += sum(v.x for v in contact) * inv_dt
+                fy[i] += sum(v.y for v in contact) * inv_dt
+        max_total = float(np.hypot(np.round(fx, 3), np.round(fy, 3)).max())
+        max_gravity = float(np.hypot(gravity.x, gravity.y) * self._mass.max())
+        max_force = max(max_total, max_gravity, self._max_applied)
+
+        d = max_force * pixels_per_unit
+        dv = max_speed * pixels_per_unit
+        self.forces.value = limit / d if d != 0 else 1.0
+        self.velocity.value = limit / dv if dv != 0 else 1.0
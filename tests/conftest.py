@@ -0,0 +1,24 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+import pytest
+
+
+@pytest.fixture
+def screen():
+    """Headless display; Camera reads the window size on construction."""
+    pygame.display.init()
+    surface = pygame.display.set_mode((400, 300))
+    yield surface
+    pygame.display.quit()
+
+
+@pytest.fixture
+def objectsmanager(screen):
+    from obj.camera import Camera
+    from obj.objectsmanager import ObjectsManager
+
+    return ObjectsManager(screen, Camera(), 100, gravity=(0.0, 10.0))
@@ -0,0 +1,78 @@
+import pytest
+from Box2D import b2Vec2, b2World
+from obj.analyticmotion import AnalyticMotion, is_contact_free
+from obj.bodystate import BodyState
+from pygame import Vector3
+
+
+def make_body(world, sensor=True, damping=0.0, type="dynamic"):
+    create = world.CreateDynamicBody if type == "dynamic" else world.CreateStaticBody
+    body = create(position=(1.0, 2.0))
+    body.CreateCircleFixture(radius=0.1, density=1.0, isSensor=sensor)
+    body.linearDamping = damping
+    return body
+
+
+def test_contact_free_requires_dynamic_sensor_body():
+    world = b2World(gravity=(0, 10))
+    assert is_contact_free(make_body(world))
+    assert not is_contact_free(make_body(world, sensor=False))
+    assert not is_contact_free(make_body(world, damping=0.5))
+    assert not is_contact_free(make_body(world, type="static"))
+    assert not is_contact_free(world.CreateDynamicBody())
+    assert not is_contact_free(None)
+
+
+def test_at_anchor_returns_initial_state():
+    world = b2World(gravity=(0, 10))
+    body = make_body(world)
+    body.linearVelocity = (3.0, -4.0)
+    motion = AnalyticMotion(BodyState.read(body), (0.0, 10.0), 2.0, True)
+    x, y, angle, vx, vy = motion.at(2.0)
+    assert (x, y, vx, vy) == pytest.approx((1.0, 2.0, 3.0, -4.0))
+
+
+def test_at_follows_constant_acceleration():
+    world = b2World(gravity=(0, 10))
+    body = make_body(world)
+    body.linearVelocity = (3.0, -4.0)
+    motion = AnalyticMotion(BodyState.read(body), (1.0, 10.0), 0.0, True)
+    x, y, _, vx, vy = motion.at(2.0)
+    assert (x, y) == pytest.approx((1.0 + 6.0 + 2.0, 2.0 - 8.0 + 20.0))
+    assert (vx, vy) == pytest.approx((5.0, 16.0))
+
+
+def test_matches_box2d_integration():
+    world = b2World(gravity=(0, 10))
+    body = make_body(world)
+    body.linearVelocity = (2.0, -5.0)
+    motion = AnalyticMotion(BodyState.read(body), (0.0, 10.0), 0.0, True)
+    dt = 1 / 200
+    for _ in range(200):
+        world.Step(dt, 8, 3)
+    x, y, _, vx, vy = motion.at(1.0)
+    # semi-implicit Euler drifts by O(dt) from the exact trajectory
+    assert body.position.x == pytest.approx(x, abs=1e-4)
+    assert body.position.y == pytest.approx(y, abs=0.05)
+    assert body.linearVelocity.x == pytest.approx(vx, abs=1e-4)
+    assert body.linearVelocity.y == pytest.approx(vy, abs=1e-3)
+
+
+def test_skip_force_withholds_applied_force_on_first_step(objectsmanager):
+    om = objectsmanager
+    particle = om.add_object(
+        "dynamic", "point_particle", 0.1, (0.0, 0.0), 0.0, Vector3(0, 0, 0)
+    )
+    body = particle.physics.body
+    # the applied force cancels gravity, but only from the second step on
+    particle.forcemanager.applied_force = b2Vec2(0, -body.mass * 10)
+    om.reset_simulation()
+    om.run_simulation(True)
+    assert om.skip_force
+
+    om.step_simulation()
+    velocity = body.linearVelocity.y
+    assert velocity == pytest.approx(10 * om.frame_time)
+    for _ in range(3):
+        om.step_simulation()
+    assert body.linearVelocity.y == pytest.approx(velocity)
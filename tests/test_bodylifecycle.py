@@ -0,0 +1,73 @@
+import math
+
+import pytest
+from obj.bodylifecycle import BodyLifecycle
+from pygame import Vector3
+
+
+def test_round_trip():
+    lifecycle = BodyLifecycle(
+        bounds=(-5.0, -6.0, 7.0, 8.0),
+        mode="remove",
+        allow_sleeping=False,
+        linear_sleep_tolerance=0.02,
+        angular_sleep_tolerance=0.1,
+        time_to_sleep=2.0,
+    )
+    data = lifecycle.transfer_to_json()
+    assert BodyLifecycle.from_json(data).transfer_to_json() == data
+
+
+def test_null_bounds_disable_kill_plane():
+    lifecycle = BodyLifecycle.from_json({"bounds": None})
+    assert lifecycle.bounds is None
+
+
+def test_missing_keys_keep_defaults():
+    default = BodyLifecycle().transfer_to_json()
+    assert BodyLifecycle.from_json({}).transfer_to_json() == default
+
+
+@pytest.mark.parametrize("data", [None, [], "remove", 1])
+def test_non_dict_gives_defaults(data):
+    default = BodyLifecycle().transfer_to_json()
+    assert BodyLifecycle.from_json(data).transfer_to_json() == default
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        [1, 2, 3],
+        [5, 0, 1, 1],
+        [0, 0, math.inf, 1],
+        [0, 0, "1", 1],
+        [False, 0, True, 1],
+        "everywhere",
+    ],
+)
+def test_invalid_bounds_fall_back(bounds):
+    assert BodyLifecycle.from_json({"bounds": bounds}).bounds == BodyLifecycle().bounds
+
+
+def test_invalid_values_fall_back():
+    default = BodyLifecycle()
+    lifecycle = BodyLifecycle.from_json(
+        {
+            "mode": "explode",
+            "allow_sleeping": "yes",
+            "linear_sleep_tolerance": -1,
+            "angular_sleep_tolerance": math.nan,
+            "time_to_sleep": True,
+        }
+    )
+    assert lifecycle.transfer_to_json() == default.transfer_to_json()
+
+
+def test_invalid_block_does_not_wipe_scene(objectsmanager):
+    om = objectsmanager
+    om.add_object("dynamic", "circle", 1.0, (0.0, 0.0), 0.0, Vector3(0, 0, 0))
+    data = om.transfer_to_json()
+    data["lifecycle"] = {"bounds": [1, "x"], "mode": 5, "time_to_sleep": -3}
+    om.load_from_json(data)
+    assert len(om.objects) == 1
+    assert om.lifecycle.bounds == BodyLifecycle().bounds
@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pytest
+from obj.bodystate import BodyState, BodyStateMirror, lerp_angle
+from obj.objectsmanager import FRAME_RATE_HZ
+from pygame import Vector3
+
+
+@pytest.mark.parametrize(
+    "a, b, alpha, expected",
+    [
+        (0.0, 1.0, 0.5, 0.5),
+        (0.0, 1.0, 0.0, 0.0),
+        (0.0, 1.0, 1.0, 1.0),
+        # across ±pi the shorter arc goes through pi, not through 0
+        (math.pi - 0.1, -math.pi + 0.1, 0.5, math.pi),
+        (0.1, 2 * math.pi - 0.1, 0.5, 0.0),
+        # whole turns between the angles do not spin the body
+        (0.0, 4 * math.pi + 0.2, 0.5, 0.1),
+    ],
+)
+def test_lerp_angle_takes_shorter_arc(a, b, alpha, expected):
+    assert lerp_angle(a, b, alpha) == pytest.approx(expected)
+
+
+def test_lerp_angle_on_arrays():
+    a = np.array([0.0, math.pi - 0.1])
+    b = np.array([1.0, -math.pi + 0.1])
+    assert lerp_angle(a, b, 0.5) == pytest.approx([0.5, math.pi])
+
+
+def state(x, y, angle):
+    return BodyState(x, y, angle, 0.0, 0.0, x + 1, y + 1, 0.0, True)
+
+
+def mirror_between(before, after, alpha):
+    mirror = BodyStateMirror()
+    mirror.rows = [after]
+    mirror.array = np.array([before], dtype=float, order="F")
+    mirror.dirty = False
+    mirror.keep_previous()
+    mirror.array = np.array([after], dtype=float, order="F")
+    mirror.alpha = alpha
+    return mirror
+
+
+def test_blended_interpolates_position_and_angle():
+    before, after = state(0.0, 0.0, 3.0), state(2.0, -4.0, -3.0)
+    blended = mirror_between(before, after, 0.5).blended(0)
+    assert (blended.x, blended.y) == pytest.approx((1.0, -2.0))
+    assert (blended.cx, blended.cy) == pytest.approx((2.0, -1.0))
+    assert blended.angle == pytest.approx(lerp_angle(3.0, -3.0, 0.5))
+    assert abs(blended.angle) > 3.0
+
+
+def test_blended_at_ends():
+    before, after = state(0.0, 0.0, 0.0), state(2.0, -4.0, 1.0)
+    assert mirror_between(before, after, 1.0).blended(0) == after
+    start = mirror_between(before, after, 0.0).blended(0)
+    assert (start.x, start.y, start.angle) == pytest.approx((0.0, 0.0, 0.0))
+
+
+def test_blended_without_previous_is_current():
+    before, after = state(0.0, 0.0, 0.0), state(2.0, -4.0, 1.0)
+    mirror = mirror_between(before, after, 0.5)
+    mirror.mark_dirty()
+    assert mirror.blended(0) == after
+    mirror.dirty = True
+    mirror.keep_previous()
+    assert mirror.previous is None
+
+
+def test_interpolated_frames_between_physics_frames(objectsmanager):
+    om = objectsmanager
+    om.physics_frames = 2
+    om.interpolate = True
+    ball = om.add_object("dynamic", "circle", 0.5, (0.0, 0.0), 0.0, Vector3())
+    om.reset_simulation()
+    om.run_simulation(True)
+    alphas, times = [], []
+    for _ in range(6):
+        om.step_simulation(1 / FRAME_RATE_HZ)
+        alphas.append(om.body_states.alpha)
+        times.append(om.time)
+    assert alphas == pytest.approx([0.5, 0.0] * 3)
+    assert times == pytest.approx([0.0, 0.01, 0.01, 0.02, 0.02, 0.03])
+    # the rendered state lags physics by half a physics frame in between
+    blended = om.body_states.blended(ball.state_index)
+    om.step_simulation(1 / FRAME_RATE_HZ)
+    assert om.display_time == pytest.approx(0.025)
+    assert ball.physics.body.position.y > om.body_states.blended(ball.state_index).y
+    assert om.body_states.blended(ball.state_index).y > blended.y
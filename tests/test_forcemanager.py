@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+from Box2D import b2PolygonShape, b2World
+from obj.forcemanager import ForceManager
+from obj.impulsecollector import ImpulseCollector
+from pygame import Vector3
+
+DT = 1 / 200
+
+
+def sliding_box(ground_first):
+    world = b2World(gravity=(0, 10))
+    collector = ImpulseCollector()
+    world.contactListener = collector
+
+    def ground():
+        body = world.CreateStaticBody(position=(0.0, 1.0), userData=1)
+        body.CreateFixture(shape=b2PolygonShape(box=(50.0, 0.5)), friction=0.5)
+
+    def box():
+        body = world.CreateDynamicBody(position=(0.0, 0.0), userData=2)
+        body.CreateFixture(
+            shape=b2PolygonShape(box=(0.5, 0.5)), density=1.0, friction=0.5
+        )
+        return body
+
+    # the order decides which body is A in the contact
+    if ground_first:
+        ground()
+        body = box()
+    else:
+        body = box()
+        ground()
+    return world, collector, body
+
+
+@pytest.mark.parametrize("ground_first", [True, False])
+def test_contact_force_opposes_gravity_and_sliding(ground_first):
+    world, collector, body = sliding_box(ground_first)
+    force = ForceManager(body, collector)
+    body.linearVelocity = (5.0, 0.0)
+    for _ in range(20):
+        collector.start_frame(DT)
+        world.Step(DT, 10, 5)
+    force.update()
+    mass = body.mass
+    # resting on the ground the normal force cancels gravity (y points down)
+    assert force.total_force.y == pytest.approx(0.0, abs=0.05 * mass)
+    # kinetic friction mu * m * g slows the sliding box
+    assert body.linearVelocity.x > 0
+    assert force.total_force.x == pytest.approx(-0.5 * mass * 10, rel=0.05)
+
+
+@pytest.mark.parametrize("physics_frames", [1, 2, 4])
+def test_resting_force_does_not_depend_on_frame_length(objectsmanager, physics_frames):
+    om = objectsmanager
+    om.physics_frames = physics_frames
+    om.add_object("static", "rectangle", (10.0, 1.0), (0.0, 2.0), 0.0, Vector3())
+    ball = om.add_object("dynamic", "circle", 0.5, (0.0, 0.0), 0.0, Vector3())
+    om.reset_simulation()
+    om.run_simulation(True)
+    for _ in range(150):
+        om.step_simulation()
+    assert ball.physics.body.awake
+    assert om.collector.duration == pytest.approx(physics_frames * om.frame_time)
+    ball.forcemanager.update()
+    assert tuple(ball.forcemanager.total_force) == pytest.approx((0.0, 0.0), abs=0.01)
+
+
+def test_shortened_stoper_frame_sets_impulse_duration(objectsmanager):
+    om = objectsmanager
+    om.stoper = SimpleNamespace(value=12)  # milliseconds
+    om.add_object("static", "rectangle", (10.0, 1.0), (0.0, 2.0), 0.0, Vector3())
+    om.add_object("dynamic", "circle", 0.5, (0.0, 0.0), 0.0, Vector3())
+    om.reset_simulation()
+    om.run_simulation(True)
+    for _ in range(3):
+        om.step_simulation()
+    assert not om.is_simulation_running
+    assert om.time == pytest.approx(0.012)
+    assert om.collector.duration == pytest.approx(0.002)
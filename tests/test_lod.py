@@ -0,0 +1,72 @@
+import math
+
+import pygame
+import pytest
+from obj.drawn.lod import circle_polygon, clip_polygon, needs_clipping
+
+BOUNDS = pygame.Rect(0, 0, 100, 50)
+
+
+def area(points):
+    return 0.5 * abs(
+        sum(
+            x0 * y1 - x1 * y0
+            for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1])
+        )
+    )
+
+
+def test_polygon_inside_is_unchanged():
+    square = [(10, 10), (20, 10), (20, 20), (10, 20)]
+    assert not needs_clipping(square, BOUNDS)
+    assert clip_polygon(square, BOUNDS) == [
+        (10.0, 10.0),
+        (20.0, 10.0),
+        (20.0, 20.0),
+        (10.0, 20.0),
+    ]
+
+
+def test_polygon_outside_is_empty():
+    square = [(200, 10), (220, 10), (220, 20), (200, 20)]
+    assert needs_clipping(square, BOUNDS)
+    assert clip_polygon(square, BOUNDS) == []
+
+
+def test_polygon_crossing_an_edge_is_cut_there():
+    square = [(90, 10), (110, 10), (110, 20), (90, 20)]
+    clipped = clip_polygon(square, BOUNDS)
+    assert max(x for x, _ in clipped) == pytest.approx(100.0)
+    assert area(clipped) == pytest.approx(100.0)
+
+
+def test_polygon_covering_bounds_becomes_bounds():
+    huge = [(-1e6, -1e6), (1e6, -1e6), (1e6, 1e6), (-1e6, 1e6)]
+    clipped = clip_polygon(huge, BOUNDS)
+    assert area(clipped) == pytest.approx(100 * 50)
+    assert all(0 <= x <= 100 and 0 <= y <= 50 for x, y in clipped)
+
+
+def test_triangle_over_corner():
+    triangle = [(-10, -10), (30, -10), (-10, 30)]
+    clipped = clip_polygon(triangle, BOUNDS)
+    # the part in the first quadrant is the triangle (0,0), (20,0), (0,20)
+    assert area(clipped) == pytest.approx(200.0)
+
+
+def test_circle_polygon():
+    assert circle_polygon((500, 500), 10, BOUNDS) is None
+    # the screen lies inside the circle
+    assert area(circle_polygon((50, 25), 1e5, BOUNDS)) == pytest.approx(5000.0)
+    # huge circle whose arc crosses the screen: clipped, close to the true area
+    cx, cy, radius = 50, 25 + 5000, 5000
+    points = circle_polygon((cx, cy), radius, BOUNDS)
+    assert all(0 <= x <= 100 and 0 <= y <= 50 for x, y in points)
+    for x, y in points:
+        assert math.hypot(x - cx, y - cy) <= radius + 1e-6
+    expected = 100 * 50 - sum(
+        (25 + 5000 - math.sqrt(radius**2 - (x + 0.5 - cx) ** 2)) for x in range(100)
+    )
+    # segments stay within half a pixel of the arc
+    assert area(points) == pytest.approx(expected, abs=0.5 * 100)
+    assert area(points) <= expected
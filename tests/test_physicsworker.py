@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+import pytest
+from Box2D import b2PolygonShape, b2World
+from obj.physicsworker import (
+    _LATEST,
+    _SEQ,
+    _TIME,
+    HEADER_SIZE,
+    STATE_SIZE,
+    STOPER_REACHED,
+    PhysicsWorker,
+    Y,
+    _build_body,
+    _publish,
+    describe_body,
+)
+
+
+def make_world():
+    world = b2World(gravity=(0, 10))
+    ball = world.CreateDynamicBody(position=(1.0, 2.0), angle=0.3)
+    ball.CreateCircleFixture(radius=0.5, density=2.0, friction=0.4, restitution=0.7)
+    ball.linearVelocity = (1.0, -2.0)
+    ball.angularVelocity = 0.5
+    ground = world.CreateStaticBody(position=(0.0, 10.0))
+    ground.CreateFixture(shape=b2PolygonShape(box=(20.0, 0.5)), friction=0.9)
+    return world, ball, ground
+
+
+def normalized(desc):
+    # Box2D recomputes the hull, which may start it at another vertex
+    for fixture in desc["fixtures"]:
+        kind, radius, data = fixture["geometry"]
+        if kind == "polygon":
+            fixture["geometry"] = (kind, radius, sorted(data))
+    return desc
+
+
+def test_describe_and_build_round_trip():
+    world, ball, ground = make_world()
+    copy = b2World(gravity=(0, 10))
+    for body in (ball, ground):
+        desc = describe_body(body, (3.0, 0.0))
+        rebuilt = _build_body(copy, desc)
+        assert normalized(describe_body(rebuilt, (3.0, 0.0))) == normalized(desc)
+    assert describe_body(ball, (3.0, 0.0))["applied_force"] == (3.0, 0.0)
+
+
+def test_rebuilt_world_steps_identically():
+    world, ball, ground = make_world()
+    copy = b2World(gravity=(0, 10))
+    twin = _build_body(copy, describe_body(ball, (0.0, 0.0)))
+    _build_body(copy, describe_body(ground, (0.0, 0.0)))
+    for _ in range(400):
+        world.Step(1 / 200, 10, 5)
+        copy.Step(1 / 200, 10, 5)
+    assert tuple(twin.position) == tuple(ball.position)
+    assert twin.angle == ball.angle
+
+
+def test_publish_alternates_slots():
+    count = 2
+    shared = np.zeros(HEADER_SIZE + 2 * count * STATE_SIZE)
+    shared[_LATEST] = 1
+    slots = shared[HEADER_SIZE:].reshape(2, count, STATE_SIZE)
+    for i, slot in enumerate([0, 1, 0, 1]):
+        states = np.full((count, STATE_SIZE), float(i))
+        _publish(shared, slots, states, 0.1 * i)
+        base = slot * 3
+        assert shared[_LATEST] == slot
+        # a finished write leaves an even, bumped sequence number
+        assert shared[base + _SEQ] == 2 * (i // 2 + 1)
+        assert shared[base + _TIME] == pytest.approx(0.1 * i)
+        assert (slots[slot] == i).all()
+        # the other slot still holds the previous frame for readers
+        if i:
+            assert (slots[1 - slot] == i - 1).all()
+
+
+def test_worker_stops_at_stoper():
+    world, ball, ground = make_world()
+    scene = {
+        "bodies": [describe_body(b, (0.0, 0.0)) for b in (ball, ground)],
+        "gravity": (0.0, 10.0),
+        "dt": 1 / 200,
+        "velocity_iterations": 10,
+        "position_iterations": 5,
+        "warm_starting": True,
+        "continuous_physics": True,
+        "frame_time": 1 / 200,
+        "time": 0.0,
+        "stoper": 0.1,
+        "stop_at_collision": False,
+    }
+    worker = PhysicsWorker(scene)
+    try:
+        deadline = time.monotonic() + 30
+        while worker.status != STOPER_REACHED:
+            assert time.monotonic() < deadline, "worker did not reach the stoper"
+            time.sleep(0.01)
+        worker.poll()
+        assert worker.current_time == pytest.approx(0.1)
+        for _ in range(20):
+            world.Step(1 / 200, 10, 5)
+        assert worker.current[0, Y] == pytest.approx(ball.position.y)
+    finally:
+        worker.close()
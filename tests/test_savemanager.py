@@ -0,0 +1,71 @@
+import json
+import time
+
+import pytest
+from obj.savemanager import SaveManager, scene_file_name, to_json_safe
+from pygame import Vector2, Vector3
+
+
+def finish(manager):
+    deadline = time.monotonic() + 10
+    while (job := manager.poll()) is None:
+        assert time.monotonic() < deadline, "file job did not finish"
+        time.sleep(0.001)
+    return job
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("scene", "scene.json"),
+        (" scene.json ", "scene.json"),
+        ("../../etc/scene", "scene.json"),
+        ("   ", ""),
+    ],
+)
+def test_scene_file_name(name, expected):
+    assert scene_file_name(name) == expected
+
+
+def test_to_json_safe():
+    value = {"a": (Vector2(1, 2), [Vector3(1, 2, 3)]), "b": None}
+    assert to_json_safe(value) == {"a": [[1.0, 2.0], [[1.0, 2.0, 3.0]]], "b": None}
+
+
+def test_save_and_load_round_trip(tmp_path):
+    manager = SaveManager(str(tmp_path / "saves"))
+    data = {"gravity": (0, 9.8), "objects": [{"id": i} for i in range(100)]}
+    done = []
+    assert manager.save_to_json(data, "scene", done.append)
+    assert manager.busy()
+    # one job at a time
+    assert not manager.save_to_json(data, "other")
+    job = finish(manager)
+    assert done == [job] and job.error is None and job.progress == 1.0
+    assert [p.name for p in (tmp_path / "saves").iterdir()] == ["scene.json"]
+
+    assert manager.load_from_json("scene", done.append)
+    job = finish(manager)
+    assert job.error is None
+    assert job.result == {"gravity": [0, 9.8], "objects": data["objects"]}
+
+
+def test_failed_save_keeps_previous_file(tmp_path):
+    manager = SaveManager(str(tmp_path))
+    manager.save_to_json({"objects": [1]}, "scene")
+    finish(manager)
+    manager.save_to_json({"objects": [object()]}, "scene")
+    job = finish(manager)
+    assert job.error is not None
+    assert json.loads((tmp_path / "scene.json").read_text()) == {"objects": [1]}
+    assert [p.name for p in tmp_path.iterdir()] == ["scene.json"]
+
+
+def test_load_errors(tmp_path):
+    manager = SaveManager(str(tmp_path))
+    (tmp_path / "broken.json").write_text("{")
+    manager.load_from_json("broken", None)
+    assert "broken JSON" in finish(manager).error
+    manager.load_from_json("missing", None)
+    assert "does not exist" in finish(manager).error
+    assert not manager.load_from_json("  ", None)
@@ -0,0 +1,111 @@
+import json
+import os
+import time
+
+import pytest
+from obj.sceneindex import INDEX_FILE, THUMBNAIL_SIZE, SceneIndex, summarize_scene
+
+SCENE = {
+    "gravity": [0.0, 9.81],
+    "stoper": 1500,
+    "objects": [
+        {
+            "obj_type": "dynamic",
+            "shape_type": "circle",
+            "size": 0.5,
+            "position": [0.0, 0.0],
+            "color": [255, 0, 0],
+        },
+        {
+            "obj_type": "static",
+            "shape_type": "rectangle",
+            "size": [10.0, 1.0],
+            "position": [0.0, 2.0],
+            "angle": 0.1,
+            "color": [0, 0, 255],
+        },
+    ],
+}
+
+
+def write_scene(directory, name, data=SCENE):
+    (directory / name).write_text(json.dumps(data))
+
+
+def finish(index):
+    deadline = time.monotonic() + 10
+    while index.job is not None and not index.job.finished():
+        assert time.monotonic() < deadline, "index pass did not finish"
+        time.sleep(0.001)
+    return index.poll()
+
+
+def test_summarize_scene():
+    entry = summarize_scene(SCENE)
+    assert entry["shapes"] == {"circle": 1, "rectangle": 1}
+    assert entry["types"] == {"dynamic": 1, "static": 1}
+    assert entry["gravity"] == 9.81
+    assert entry["stoper"] == 1500
+
+
+def test_pass_lists_and_describes_scenes(tmp_path):
+    write_scene(tmp_path, "a.json")
+    (tmp_path / "broken.json").write_text("{")
+    (tmp_path / "notes.txt").write_text("not a scene")
+    index = SceneIndex(str(tmp_path))
+    index.refresh()
+    assert index.busy()
+    assert finish(index)
+    assert sorted(index.scenes()) == ["a.json", "broken.json"]
+    assert index.describe("a.json") == "1 dynamic, 1 static  g 9.81  stop 1.50s"
+    assert index.describe("broken.json") == "unreadable scene"
+    assert index.describe("missing.json") == ""
+    assert index.thumbnail("a.json").get_size() == THUMBNAIL_SIZE
+    assert index.thumbnail("broken.json") is None
+    assert (tmp_path / INDEX_FILE).exists()
+    # nothing changed, so a second pass reports no change
+    index.refresh()
+    assert not finish(index)
+
+
+def test_index_file_is_reused(tmp_path, monkeypatch):
+    write_scene(tmp_path, "a.json")
+    write_scene(tmp_path, "b.json")
+    first = SceneIndex(str(tmp_path))
+    first.refresh()
+    finish(first)
+
+    parsed = []
+    second = SceneIndex(str(tmp_path))
+    original = second._index_file
+    monkeypatch.setattr(
+        second, "_index_file", lambda path: parsed.append(path) or original(path)
+    )
+    # only the changed scene is parsed again, the removed one is dropped
+    write_scene(tmp_path, "b.json", {"objects": []})
+    os.remove(tmp_path / "a.json")
+    second.refresh()
+    assert finish(second)
+    assert parsed == [str(tmp_path / "b.json")]
+    assert second.scenes() == ["b.json"]
+    assert second.describe("b.json") == "empty"
+
+
+def test_refresh_during_pass_scans_again(tmp_path):
+    index = SceneIndex(str(tmp_path))
+    index.refresh()
+    write_scene(tmp_path, "late.json")
+    # the running pass may have listed the directory before the new scene
+    index.refresh()
+    finish(index)
+    assert index.busy()
+    finish(index)
+    assert not index.busy()
+    assert index.scenes() == ["late.json"]
+
+
+def test_missing_directory_is_empty(tmp_path):
+    index = SceneIndex(str(tmp_path / "missing"))
+    index.refresh()
+    assert not finish(index)
+    assert index.scenes() == []
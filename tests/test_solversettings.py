@@ -0,0 +1,65 @@
+import pytest
+from obj.solversettings import (
+    QUALITY_PRESETS,
+    SolverSettings,
+    quality_preset,
+)
+
+
+@pytest.mark.parametrize("name", sorted(QUALITY_PRESETS))
+def test_preset_round_trip(name):
+    settings = quality_preset(name)
+    loaded = SolverSettings.from_json(settings.transfer_to_json())
+    assert loaded.transfer_to_json() == settings.transfer_to_json()
+    assert loaded.quality == name
+
+
+def test_unknown_preset_raises():
+    with pytest.raises(ValueError):
+        quality_preset("ultra")
+
+
+@pytest.mark.parametrize("data", [None, [], "normal", 3])
+def test_non_dict_gives_default(data):
+    default = quality_preset("draft")
+    assert SolverSettings.from_json(data, default=default) is default
+
+
+def test_invalid_values_fall_back_to_saved_preset():
+    data = quality_preset("precise").transfer_to_json()
+    data.update(
+        dt=-1,
+        velocity_iterations=0,
+        position_iterations="5",
+        warm_starting=1,
+        max_substeps=float("nan"),
+        cfl=True,
+    )
+    loaded = SolverSettings.from_json(data)
+    expected = quality_preset("precise")
+    assert loaded.transfer_to_json() == expected.transfer_to_json()
+
+
+def test_hand_edited_values_fall_back_to_default():
+    default = quality_preset("draft")
+    data = {"quality": None, "dt": 0.01, "velocity_iterations": float("inf")}
+    loaded = SolverSettings.from_json(data, default=default)
+    assert loaded.quality is None
+    assert loaded.dt == 0.01
+    assert loaded.velocity_iterations == default.velocity_iterations
+    assert loaded.continuous_physics == default.continuous_physics
+
+
+def test_unknown_quality_is_dropped():
+    loaded = SolverSettings.from_json({"quality": "ultra"})
+    assert loaded.quality is None
+    assert loaded.dt == SolverSettings().dt
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(dt=0), dict(velocity_iterations=0), dict(max_substeps=0), dict(cfl=0)],
+)
+def test_constructor_rejects_invalid_values(kwargs):
+    with pytest.raises(ValueError):
+        SolverSettings(**kwargs)